@@ -0,0 +1,91 @@
+"""
+🧾 Ortak Analitik Hesaplamaları
+===============================
+Dashboard ve metrik API'sinin paylaştığı, Streamlit'ten bağımsız toplamalar.
+Filtre sözlüğü sol paneldeki filtrelerle aynı biçimdedir:
+`{'sources': [...], 'start': date, 'end': date, 'statuses': [...], 'company': str}`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from loader import SOURCE_COLUMN
+
+
+def calculate_metrics(df):
+    """Ana metrikleri hesapla"""
+    total = len(df)
+
+    # Status bazlı sayılar
+    applied = len(df[df['Status'] == 'Applied']) if 'Status' in df.columns else 0
+    rejected = len(df[df['Status'] == 'Rejected']) if 'Status' in df.columns else 0
+    under_review = len(df[df['Status'] == 'Under Review']) if 'Status' in df.columns else 0
+    interview = len(df[df['Status'] == 'Interview']) if 'Status' in df.columns else 0
+
+    # Oranlar
+    rejection_rate = (rejected / total * 100) if total > 0 else 0
+    response_rate = ((rejected + interview + under_review) / total * 100) if total > 0 else 0
+    interview_rate = (interview / total * 100) if total > 0 else 0
+
+    # Benzersiz şirket sayısı
+    unique_companies = df['Company'].nunique() if 'Company' in df.columns else 0
+
+    return {
+        'total': total,
+        'applied': applied,
+        'rejected': rejected,
+        'under_review': under_review,
+        'interview': interview,
+        'rejection_rate': rejection_rate,
+        'response_rate': response_rate,
+        'interview_rate': interview_rate,
+        'unique_companies': unique_companies
+    }
+
+
+def filter_mask(df, filters):
+    """Sol panel filtrelerini tek bir boolean maskede birleştir"""
+    filters = filters or {}
+    mask = np.ones(len(df), dtype=bool)
+    if filters.get('sources') and SOURCE_COLUMN in df.columns:
+        mask &= df[SOURCE_COLUMN].isin(filters['sources']).to_numpy()
+    if 'Date' in df.columns and (filters.get('start') or filters.get('end')):
+        date_tz = df['Date'].dt.tz
+        if filters.get('start'):
+            mask &= (df['Date'] >= pd.Timestamp(filters['start'], tz=date_tz)).to_numpy()
+        if filters.get('end'):
+            day_end = pd.Timestamp(filters['end'], tz=date_tz) + pd.Timedelta(days=1)
+            mask &= (df['Date'] < day_end).to_numpy()
+    if filters.get('statuses') and 'Status' in df.columns:
+        mask &= df['Status'].isin(filters['statuses']).to_numpy()
+    if filters.get('company') and 'Company' in df.columns:
+        mask &= (df['Company'] == filters['company']).to_numpy()
+    return mask
+
+
+def apply_filters(df, filters):
+    """Filtrelenmiş görünüm (filtre bir şey elemiyorsa aynı DataFrame)"""
+    mask = filter_mask(df, filters)
+    return df if mask.all() else df[mask]
+
+
+def daily_counts(df):
+    """Günlük başvuru sayıları: Date, count"""
+    counts = df.groupby(df['Date'].dt.date).size().reset_index(name='count')
+    counts['Date'] = pd.to_datetime(counts['Date'])
+    return counts
+
+
+def period_counts(df, period='weekly'):
+    """Haftalık/aylık başvuru sayıları: Period, count"""
+    # DataFrame kopyalanmadan, yalnızca tarih sütunundan
+    counts = df['Date'].dt.to_period('W' if period == 'weekly' else 'M').value_counts().sort_index()
+    return pd.DataFrame({'Period': counts.index.astype(str), 'count': counts.to_numpy()})
+
+
+def status_by_company(df, top_n=10, top_companies=None):
+    """En çok başvurulan şirketlerin durum dağılımı (şirket x durum)"""
+    if top_companies is None:
+        top_companies = df['Company'].value_counts().head(top_n).index
+    df_top = df[df['Company'].isin(top_companies)]
+    return df_top.groupby(['Company', 'Status']).size().unstack(fill_value=0)
@@ -6,12 +6,45 @@ Herhangi bir meslek alanı için kullanılabilir.
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
-import numpy as np
+from datetime import datetime
+import io
+import os
+import sys
+
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from lazy_imports import LazyModule, preload, start_background
+from memory_budget import SHARED, MemoryBudget, process_rss
+from speculation import Speculator
+from store import LocalStore
+
+# Ağır modüller ilk kullanımda yüklenir; karşılama ekranı bunlar olmadan çizilir
+pd = LazyModule('pandas')
+np = LazyModule('numpy')
+go = LazyModule('plotly.graph_objects')
+analytics = LazyModule('analytics')
+arrow_store = LazyModule('arrow_store')
+date_index = LazyModule('date_index')
+drilldown = LazyModule('drilldown')
+loader = LazyModule('loader')
+sketches = LazyModule('sketches')
+sql_backend = LazyModule('sql_backend')
+table_index = LazyModule('table_index')
+watcher = LazyModule('watcher')
+
+# Isınma sırasında önceden yüklenecek modüller
+WARMUP_MODULES = [
+    'numpy', 'pandas', 'pyarrow', 'plotly.graph_objects', 'openpyxl',
+    'loader', 'analytics', 'arrow_store', 'date_index', 'drilldown', 'table_index', 'sketches', 'sql_backend', 'watcher',
+]
+
+DEMO_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_data.csv')
+WARMUP_ENABLED = os.environ.get('JOB_TRACKER_WARMUP', '0') == '1'
+# Paylaşılan veri setleri süreçler arası tek bir bellek eşlemeli Arrow dosyasından okunur
+ARROW_ENABLED = os.environ.get('JOB_TRACKER_ARROW', '1') == '1'
+# Sayfa çizildikten sonra olası sonraki görünümler arka planda önceden hesaplanır
+SPECULATION_ENABLED = os.environ.get('JOB_TRACKER_SPECULATE', '1') == '1'
 
 # Sayfa Konfigürasyonu
 st.set_page_config(
@@ -43,60 +76,205 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def load_data(uploaded_file):
-    """CSV dosyasını yükle ve işle"""
+def load_data(uploaded_files):
+    """CSV dosyalarını paralel yükle, şemalarını hizala ve tekrarları ayıkla"""
+    if not isinstance(uploaded_files, (list, tuple)):
+        uploaded_files = [uploaded_files]
     try:
-        df = pd.read_csv(uploaded_file)
-        
-        # Tarih sütununu datetime'a çevir
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-            df = df.dropna(subset=['Date'])
-            df = df.sort_values('Date', ascending=False)
-        
-        return df
+        return loader.read_many(uploaded_files)
     except Exception as e:
         st.error(f"Dosya yüklenirken hata: {e}")
         return None
 
 
-def calculate_metrics(df):
-    """Ana metrikleri hesapla"""
-    total = len(df)
-    
-    # Status bazlı sayılar
-    applied = len(df[df['Status'] == 'Applied']) if 'Status' in df.columns else 0
-    rejected = len(df[df['Status'] == 'Rejected']) if 'Status' in df.columns else 0
-    under_review = len(df[df['Status'] == 'Under Review']) if 'Status' in df.columns else 0
-    interview = len(df[df['Status'] == 'Interview']) if 'Status' in df.columns else 0
-    
-    # Oranlar
-    rejection_rate = (rejected / total * 100) if total > 0 else 0
-    response_rate = ((rejected + interview + under_review) / total * 100) if total > 0 else 0
-    interview_rate = (interview / total * 100) if total > 0 else 0
-    
-    # Benzersiz şirket sayısı
-    unique_companies = df['Company'].nunique() if 'Company' in df.columns else 0
-    
-    return {
-        'total': total,
-        'applied': applied,
-        'rejected': rejected,
-        'under_review': under_review,
-        'interview': interview,
-        'rejection_rate': rejection_rate,
-        'response_rate': response_rate,
-        'interview_rate': interview_rate,
-        'unique_companies': unique_companies
-    }
+def get_cli_paths():
+    """`streamlit run app.py -- a.csv b.csv` ile verilen CSV yolları"""
+    return [p for p in sys.argv[1:] if p.lower().endswith('.csv') and os.path.isfile(p)]
+
+
+@st.cache_resource(show_spinner=False)
+def get_memory_budget():
+    """Süreç genelinde tek bellek bütçesi (JOB_TRACKER_MEMORY_BUDGET_MB)"""
+    return MemoryBudget()
+
+
+@st.cache_resource(show_spinner=False)
+def get_speculator():
+    """Süreç genelinde tek düşük öncelikli ön hesaplama işçisi"""
+    return Speculator()
+
+
+def current_session_id():
+    """Bu çalıştırmanın oturum kimliği (kapanmış oturumların girdileri bırakılır)"""
+    if runtime.exists():
+        get_memory_budget().prune(runtime.Runtime.instance().is_active_session)
+        get_speculator().prune(runtime.Runtime.instance().is_active_session)
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else SHARED
+
+
+def load_dataset(name, dataset_key, factory, owner=SHARED, sources=()):
+    """Veri setini bellek bütçesi üzerinden yükle (paylaşılan veri tüm oturumlarda tek kopya)"""
+    budget = get_memory_budget()
+    if not (ARROW_ENABLED and owner == SHARED and sources):
+        # Veri setine indeksler, filtrelenmiş görünümler ve çizilen bileşenler referans
+        # verir; diske taşımak belleği boşaltmaz, geri okuma ikinci kopya üretir. Bu yüzden
+        # yalnızca atılabilir ve bağımlıları bellekteyken atılmaz.
+        return budget.get_or_create(
+            owner, ('dataset',) + name, factory, version=dataset_key, spillable=False
+        )
+
+    def mapped():
+        if not all(os.path.exists(p) for p in sources):
+            return factory()
+        version = (dataset_key, arrow_store.source_signature(sources), loader.SCHEMA_VERSION)
+        return arrow_store.load_or_build(name, version, factory)
 
+    # Eşlenmiş sütunlar sayfa önbelleğinde durur; süreç belleğine sayılmaz ve diske taşınmaz
+    return budget.get_or_create(
+        owner, ('dataset',) + name, mapped, version=dataset_key, spillable=False, nbytes=0
+    )
+
+
+def dataset_entry(dataset_key, session_id):
+    """Veri setinin bütçedeki (owner, name) anahtarı; ona referans veren girdiler bunu bildirir"""
+    if dataset_key[0] == 'upload':
+        return session_id, ('dataset', 'upload')
+    return SHARED, ('dataset',) + dataset_key[:2]
+
+
+def load_demo_data(path):
+    """Demo veri setini yükle (ısınma bunu önceden yükleyebilir)"""
+    return load_dataset(
+        ('demo', path), ('demo', path), lambda: loader.read_applications_csv(path), sources=(path,)
+    )
+
+
+def warm_up():
+    """Ağır modülleri içe aktar ve demo veriyi önbelleğe al"""
+    preload(WARMUP_MODULES)
+    if os.path.isfile(DEMO_DATA_PATH):
+        load_demo_data(DEMO_DATA_PATH)
+
+
+@st.cache_resource(show_spinner=False)
+def start_warmup():
+    """Isınmayı süreç başına bir kez arka planda başlat"""
+    return start_background(warm_up, name='job-tracker-warmup')
 
-def create_status_chart(df):
-    """Durum dağılımı pasta grafiği"""
-    if 'Status' not in df.columns:
+
+def load_store_data(data_dir):
+    """Yerel depodaki canlı veriyi yükle"""
+    store = LocalStore(data_dir)
+    if not store.exists():
         return None
-    
-    status_counts = df['Status'].value_counts()
+    return load_data(store.csv_path)
+
+
+@st.fragment(run_every="5s")
+def watch_store_version(data_dir, loaded_version):
+    """Depo sürümünü periyodik kontrol et, yeni veri gelince sayfayı yenile"""
+    current_version = LocalStore(data_dir).version()
+    if current_version != loaded_version:
+        st.rerun()
+    st.caption(f"🟢 Canlı veri · sürüm {current_version}")
+
+
+@st.cache_resource(show_spinner=False)
+def get_folder_watcher(path):
+    """Her izlenen yol için süreç genelinde tek bir izleyici"""
+    return watcher.FolderWatcher(path)
+
+
+def load_watched_data(path, generation):
+    """İzlenen klasörün birleşik verisi (yalnızca nesil değişince yeniden hesaplanır)"""
+    # Birleşik veri izleyicide de tutulur; bütçede yalnızca sayılır
+    return load_dataset(
+        ('watch', path), ('watch', path, generation),
+        lambda: get_folder_watcher(path).frame()
+    )
+
+
+@st.fragment(run_every="5s")
+def watch_folder(path, loaded_generation):
+    """Klasörü periyodik tara, değişiklik varsa sayfayı yenile"""
+    folder_watcher = get_folder_watcher(path)
+    folder_watcher.scan()
+    if folder_watcher.generation != loaded_generation:
+        st.rerun()
+    st.caption(f"👀 {folder_watcher.file_count()} dosya izleniyor · nesil {folder_watcher.generation}")
+
+
+def get_analytics_db(dataset_key, df_all):
+    """Veri seti başına gömülü SQL veritabanı (canlı veride kalıcı dosya)"""
+    if dataset_key[0] == 'live':
+        # Canlı veride sürüm başına yeni veritabanı açılmaz; tek bağlantı yeni satırları ekler
+        store = LocalStore(dataset_key[1])
+        db = get_live_analytics_db(str(store.data_dir))
+        db.sync_store(store)
+        return db
+    return get_frame_analytics_db(dataset_key, df_all)
+
+
+@st.cache_resource(show_spinner="SQL analitik motoru hazırlanıyor...")
+def get_live_analytics_db(data_dir):
+    """Canlı veri klasörünün kalıcı veritabanı (süreç başına tek bağlantı)"""
+    return sql_backend.AnalyticsDB(os.path.join(data_dir, 'analytics.db'))
+
+
+@st.cache_resource(show_spinner="SQL analitik motoru hazırlanıyor...", max_entries=4)
+def get_frame_analytics_db(dataset_key, _df_all):
+    """Yüklenen/demo/klasör veri seti için geçici veritabanı"""
+    # Geçici klasör, veri seti önbellekten düşüp veritabanı bırakıldığında silinir
+    db = sql_backend.AnalyticsDB(temporary=True)
+    db.load_frame(_df_all)
+    return db
+
+
+def get_topk_index(dataset_key, df_all):
+    """Şirket ve pozisyon için gün x kaynak bölümlü Space-Saving özetleri (paylaşılan)"""
+    return get_memory_budget().get_or_create(
+        SHARED, ('topk',) + dataset_key[:2],
+        lambda: {
+            column: sketches.PartitionedTopK(column, capacity=256).add_frame(df_all)
+            for column in ('Company', 'Position')
+            if column in df_all.columns
+        },
+        version=dataset_key
+    )
+
+
+@st.fragment
+def render_sql_panel(db):
+    """Ad-hoc SQL sorguları için panel"""
+    with st.expander(f"🧮 Özel SQL Sorgusu ({db.engine})"):
+        st.caption(
+            "`applications` tablosu: date, time, company, position, category, status, "
+            "subject, gmail_link, processed_at, source, weekday, hour"
+        )
+        with st.form("sql_query_form"):
+            sql = st.text_area(
+                "Sorgu",
+                value="SELECT status, COUNT(*) AS n FROM applications GROUP BY status ORDER BY n DESC",
+                height=120
+            )
+            submitted = st.form_submit_button("▶️ Çalıştır")
+        if submitted:
+            try:
+                result = db.query(sql)
+            except sql_backend.QueryError as e:
+                st.error(f"Sorgu hatası: {e}")
+            else:
+                st.dataframe(result, use_container_width=True, hide_index=True)
+                st.caption(f"{len(result)} satır (en fazla 10.000 gösterilir)")
+
+
+def create_status_chart(df, status_counts=None):
+    """Durum dağılımı pasta grafiği (sayımlar SQL motorundan da verilebilir)"""
+    if status_counts is None:
+        if 'Status' not in df.columns:
+            return None
+        status_counts = df['Status'].value_counts()
     
     colors = {
         'Applied': '#00d4ff',
@@ -129,7 +307,7 @@ def create_status_chart(df):
         ),
         margin=dict(t=60, b=80, l=20, r=20),
         annotations=[dict(
-            text=f'<b>{len(df)}</b><br>Toplam',
+            text=f'<b>{int(status_counts.sum())}</b><br>Toplam',
             x=0.5, y=0.5,
             font=dict(size=20, color=None),
             showarrow=False
@@ -139,13 +317,12 @@ def create_status_chart(df):
     return fig
 
 
-def create_timeline_chart(df):
+def create_timeline_chart(df, daily_counts=None):
     """Zaman bazlı başvuru grafiği"""
-    if 'Date' not in df.columns:
-        return None
-    
-    daily_counts = df.groupby(df['Date'].dt.date).size().reset_index(name='count')
-    daily_counts['Date'] = pd.to_datetime(daily_counts['Date'])
+    if daily_counts is None:
+        if 'Date' not in df.columns:
+            return None
+        daily_counts = analytics.daily_counts(df)
     
     fig = go.Figure()
     
@@ -161,12 +338,11 @@ def create_timeline_chart(df):
         hovertemplate='<b>%{x|%d %B %Y}</b><br>Başvuru: %{y}<extra></extra>'
     ))
     
-    # 7 günlük hareketli ortalama
+    # 7 günlük hareketli ortalama (sayımlar önbellekte paylaşıldığı için yerinde değiştirilmez)
     if len(daily_counts) > 7:
-        daily_counts['ma7'] = daily_counts['count'].rolling(window=7).mean()
         fig.add_trace(go.Scatter(
             x=daily_counts['Date'],
-            y=daily_counts['ma7'],
+            y=daily_counts['count'].rolling(window=7).mean(),
             mode='lines',
             name='7 Günlük Ortalama',
             line=dict(color='#9c27b0', width=2, dash='dash'),
@@ -202,12 +378,13 @@ def create_timeline_chart(df):
     return fig
 
 
-def create_company_chart(df, top_n=15):
+def create_company_chart(df, top_n=15, company_counts=None):
     """En çok başvurulan şirketler"""
-    if 'Company' not in df.columns:
-        return None
-    
-    company_counts = df['Company'].value_counts().head(top_n)
+    if company_counts is None:
+        if 'Company' not in df.columns:
+            return None
+        company_counts = df['Company'].value_counts()
+    company_counts = company_counts.head(top_n)
     
     fig = go.Figure(data=[go.Bar(
         x=company_counts.values,
@@ -245,12 +422,13 @@ def create_company_chart(df, top_n=15):
     return fig
 
 
-def create_position_wordcloud_chart(df):
+def create_position_wordcloud_chart(df, position_counts=None):
     """Pozisyon bazlı analiz"""
-    if 'Position' not in df.columns:
-        return None
-    
-    position_counts = df['Position'].value_counts().head(12)
+    if position_counts is None:
+        if 'Position' not in df.columns:
+            return None
+        position_counts = df['Position'].value_counts()
+    position_counts = position_counts.head(12)
     
     fig = go.Figure(data=[go.Bar(
         x=position_counts.index,
@@ -288,27 +466,20 @@ def create_position_wordcloud_chart(df):
     return fig
 
 
-def create_period_histogram(df, period='weekly'):
+def create_period_histogram(df, period='weekly', period_counts=None):
     """Haftalık veya aylık başvuru aktivitesi histogramı"""
-    if 'Date' not in df.columns:
+    if period_counts is None and 'Date' not in df.columns:
         return None
     
-    df_temp = df.copy()
-    
     if period == 'weekly':
-        # Haftalık histogram
-        df_temp['Period'] = df_temp['Date'].dt.to_period('W').astype(str)
         title = 'Haftalık Başvuru Aktivitesi'
         xaxis_title = 'Hafta'
     else:  # monthly
-        # Aylık histogram
-        df_temp['Period'] = df_temp['Date'].dt.to_period('M').astype(str)
         title = 'Aylık Başvuru Aktivitesi'
         xaxis_title = 'Ay'
     
-    # Her dönem için başvuru sayısını hesapla
-    period_counts = df_temp.groupby('Period').size().reset_index(name='count')
-    period_counts = period_counts.sort_values('Period')
+    if period_counts is None:
+        period_counts = analytics.period_counts(df, period)
     
     # Histogram oluştur
     fig = go.Figure(data=go.Bar(
@@ -384,15 +555,12 @@ def create_response_funnel(metrics):
     return fig
 
 
-def create_status_by_company(df, top_n=10):
+def create_status_by_company(df, top_n=10, status_company=None, top_companies=None):
     """Şirket bazlı durum dağılımı"""
-    if 'Company' not in df.columns or 'Status' not in df.columns:
-        return None
-    
-    top_companies = df['Company'].value_counts().head(top_n).index
-    df_top = df[df['Company'].isin(top_companies)]
-    
-    status_company = df_top.groupby(['Company', 'Status']).size().unstack(fill_value=0)
+    if status_company is None:
+        if 'Company' not in df.columns or 'Status' not in df.columns:
+            return None
+        status_company = analytics.status_by_company(df, top_n, top_companies)
     
     colors = {
         'Applied': '#00d4ff',
@@ -442,17 +610,209 @@ def create_status_by_company(df, top_n=10):
     return fig
 
 
-def create_html_dashboard(df, metrics):
-    """HTML dashboard oluştur"""
+def create_drilldown_treemap(path, level, level_label):
+    """Açık düğüm ve yalnızca onun çocukları için treemap"""
+    colors = {
+        'Applied': '#00d4ff',
+        'Rejected': '#ef4444',
+        'Under Review': '#f97316',
+        'Interview': '#22c55e'
+    }
+    
+    root_label = ' › '.join(path) if path else 'Tüm başvurular'
+    ids, labels, parents, values, marker_colors = ['root'], [root_label], [''], [level['total']], ['rgba(0,0,0,0)']
+    for i, (label, count) in enumerate(level['items']):
+        ids.append(f'node-{i}')
+        labels.append(str(label))
+        parents.append('root')
+        values.append(count)
+        marker_colors.append(colors.get(label, '#9e9e9e'))
+    if level['other']:
+        ids.append('other')
+        labels.append(f"{drilldown.OTHER_LABEL} ({level['other_items']} {level_label.lower()})")
+        parents.append('root')
+        values.append(level['other'])
+        marker_colors.append('#9e9e9e')
+    
+    fig = go.Figure(go.Treemap(
+        ids=ids,
+        labels=labels,
+        parents=parents,
+        values=values,
+        branchvalues='total',
+        marker=dict(colors=marker_colors) if not path else None,
+        textinfo='label+value+percent parent',
+        hovertemplate='<b>%{label}</b><br>Başvuru: %{value}<br>Oran: %{percentParent:.1%}<extra></extra>',
+        maxdepth=2
+    ))
+    
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color=None),
+        margin=dict(t=10, b=10, l=10, r=10),
+        height=420
+    )
+    
+    return fig
+
+
+WEEKDAY_LABELS = ['Pzt', 'Sal', 'Çar', 'Per', 'Cum', 'Cmt', 'Paz']
+RESPONSE_STATUSES = ['Rejected', 'Interview', 'Under Review']
+
+
+def weekday_hour_counts(df):
+    """Başvuru ve yanıt sayılarını tek bir bincount ile 7x24 matrislere topla"""
+    if loader.WEEKDAY_COLUMN not in df.columns or loader.HOUR_COLUMN not in df.columns:
+        return None, None
+    
+    # Tarihsiz satırlarda (nullable Int8) gün/saat boştur; saatsiz satırlar gibi atlanır
+    hour = df[loader.HOUR_COLUMN].to_numpy(dtype=np.intp, na_value=-1)
+    valid = hour >= 0
+    cells = df[loader.WEEKDAY_COLUMN].to_numpy(dtype=np.intp, na_value=0)[valid] * 24 + hour[valid]
+    
+    # Yanıtlar ikinci 168'lik bloğa düşer: [başvurular | yanıtlar]
+    if 'Status' in df.columns:
+        is_response = df['Status'].isin(RESPONSE_STATUSES).to_numpy()[valid]
+        cells = cells + is_response * 168
+    
+    counts = np.bincount(cells, minlength=2 * 168)
+    applications = counts[:168] + counts[168:]
+    responses = counts[168:]
+    return applications.reshape(7, 24), responses.reshape(7, 24)
+
+
+def create_activity_heatmap(df, metric='applications', counts=None):
+    """Haftanın günü x saat aktivite haritası"""
+    applications, responses = counts if counts is not None else weekday_hour_counts(df)
+    if applications is None or applications.sum() == 0:
+        return None
+    
+    if metric == 'responses':
+        matrix = responses
+        title = 'Haftalık Yanıt Haritası (Gün x Saat)'
+        label = 'Yanıt'
+    else:
+        matrix = applications
+        title = 'Haftalık Aktivite Haritası (Gün x Saat)'
+        label = 'Başvuru'
+    
+    fig = go.Figure(data=go.Heatmap(
+        z=matrix,
+        x=[f'{h:02d}:00' for h in range(24)],
+        y=WEEKDAY_LABELS,
+        colorscale=[[0, '#f5f9ff'], [0.5, '#64b5f6'], [1, '#1565c0']],
+        colorbar=dict(title=label),
+        hovertemplate=f'<b>%{{y}} %{{x}}</b><br>{label}: %{{z}}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=dict(text=title, font=dict(size=18, color=None)),
+        xaxis=dict(
+            title=f'Saat ({loader.DEFAULT_TIMEZONE})',
+            tickfont=dict(size=10, color=None)
+        ),
+        yaxis=dict(
+            autorange='reversed',
+            tickfont=dict(color=None)
+        ),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color=None),
+        margin=dict(t=60, b=60, l=60, r=20),
+        height=380
+    )
+    
+    return fig
+
+
+def format_minutes(minutes):
+    """Dakika cinsinden süreyi kısa metne çevir"""
+    if minutes < 60:
+        return f"{minutes:.0f} dk"
+    if minutes < 24 * 60:
+        return f"{minutes / 60:.1f} sa"
+    return f"{minutes / (24 * 60):.1f} gün"
+
+
+def lag_summary(df):
+    """İşlem gecikmesinin medyanı ve 90. yüzdeliği (dakika); veri yoksa None"""
+    if loader.LAG_COLUMN not in df.columns:
+        return None
+    lag = df[loader.LAG_COLUMN].to_numpy(dtype='float64', na_value=np.nan)
+    lag = lag[~np.isnan(lag)]
+    if not len(lag):
+        return None
+    median, p90 = np.percentile(lag, [50, 90])
+    return {'median': float(median), 'p90': float(p90), 'count': len(lag)}
+
+
+def lag_daily_quantiles(df):
+    """Günlük gecikme medyanı ve 90. yüzdeliği (sütunlar 0.5, 0.9); veri yoksa None"""
+    if loader.LAG_COLUMN not in df.columns:
+        return None
+    lag = df[[loader.LAG_COLUMN]].assign(Day=df['Date'].dt.normalize()).dropna(subset=[loader.LAG_COLUMN])
+    if lag.empty:
+        return None
+    return lag.groupby('Day')[loader.LAG_COLUMN].quantile([0.5, 0.9]).unstack()
+
+
+def create_lag_chart(df, daily=None):
+    """Günlük işlem gecikmesi (Processed At - olay zamanı) medyanı ve 90. yüzdeliği"""
+    if daily is None:
+        daily = lag_daily_quantiles(df)
+    if daily is None:
+        return None
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=daily.index, y=daily[0.5],
+        mode='lines+markers',
+        name='Medyan',
+        line=dict(color='#2196f3', width=2),
+        hovertemplate='<b>%{x|%d.%m.%Y}</b><br>Medyan: %{y:.0f} dk<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(
+        x=daily.index, y=daily[0.9],
+        mode='lines',
+        name='90. yüzdelik',
+        line=dict(color='#f97316', width=2, dash='dash'),
+        hovertemplate='<b>%{x|%d.%m.%Y}</b><br>P90: %{y:.0f} dk<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=dict(text='n8n İşlem Gecikmesi (e-posta → kayıt)', font=dict(size=18, color=None)),
+        xaxis=dict(title='Tarih', tickfont=dict(color=None), gridcolor='rgba(0,0,0,0.1)'),
+        yaxis=dict(title='Gecikme (dakika)', tickfont=dict(color=None), gridcolor='rgba(0,0,0,0.1)', rangemode='tozero'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color=None),
+        hovermode='x unified',
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+        margin=dict(t=60, b=60, l=60, r=20),
+        height=380
+    )
+    
+    return fig
+
+
+def create_html_dashboard(df, metrics, company_counts=None, position_counts=None):
+    """HTML dashboard oluştur (sıralamalar top-k özetlerinden de verilebilir)"""
+    if company_counts is None and 'Company' in df.columns:
+        company_counts = df['Company'].value_counts()
+    
     # Grafikleri oluştur
     status_chart = create_status_chart(df)
     timeline_chart = create_timeline_chart(df)
-    company_chart = create_company_chart(df, top_n=15)
-    position_chart = create_position_wordcloud_chart(df)
+    company_chart = create_company_chart(df, top_n=15, company_counts=company_counts)
+    position_chart = create_position_wordcloud_chart(df, position_counts=position_counts)
     funnel_chart = create_response_funnel(metrics)
-    status_by_company_chart = create_status_by_company(df, top_n=10)
+    status_by_company_chart = create_status_by_company(
+        df, top_n=10, top_companies=company_counts.head(10).index if company_counts is not None else None
+    )
     weekly_histogram = create_period_histogram(df, period='weekly')
     monthly_histogram = create_period_histogram(df, period='monthly')
+    activity_heatmap = create_activity_heatmap(df)
     
     # Grafikleri HTML'e çevir (sadece ilk grafikte Plotly.js dahil)
     status_html = status_chart.to_html(include_plotlyjs='cdn', div_id='status_chart') if status_chart else ""
@@ -463,6 +823,7 @@ def create_html_dashboard(df, metrics):
     status_by_company_html = status_by_company_chart.to_html(include_plotlyjs=False, div_id='status_by_company_chart') if status_by_company_chart else ""
     weekly_html = weekly_histogram.to_html(include_plotlyjs=False, div_id='weekly_chart') if weekly_histogram else ""
     monthly_html = monthly_histogram.to_html(include_plotlyjs=False, div_id='monthly_chart') if monthly_histogram else ""
+    heatmap_html = activity_heatmap.to_html(include_plotlyjs=False, div_id='activity_heatmap') if activity_heatmap else ""
     
     # Tablo HTML'i
     display_cols = ['Date', 'Company', 'Position', 'Status']
@@ -479,7 +840,7 @@ def create_html_dashboard(df, metrics):
     )
     
     # En çok başvurulan şirketler
-    top_companies = df['Company'].value_counts().head(10) if 'Company' in df.columns else pd.Series()
+    top_companies = company_counts.head(10) if company_counts is not None else pd.Series()
     top_companies_html = ""
     if len(top_companies) > 0:
         top_companies_html = "<h3>🏢 En Çok Başvurulan 10 Şirket</h3><ul>"
@@ -779,6 +1140,13 @@ def create_html_dashboard(df, metrics):
             </div>
         </div>
         
+        <div class="section">
+            <h2>🗓️ Haftalık Aktivite Haritası</h2>
+            <div class="chart-container">
+                {heatmap_html}
+            </div>
+        </div>
+        
         <div class="section">
             <h2>📋 Başvuru Detayları (İlk 100 Kayıt)</h2>
             <div class="chart-container">
@@ -798,7 +1166,526 @@ def create_html_dashboard(df, metrics):
     return html_content
 
 
+TABLE_COLUMNS = ['Date', 'Company', 'Position', 'Status', 'Gmail Link']
+
+SORT_LABELS = {
+    'Date': 'Tarih',
+    'Company': 'Şirket',
+    'Position': 'Pozisyon',
+    'Status': 'Durum',
+}
+
+
+def get_date_index(dataset_key, df_all):
+    """Kaynak x durum x gün önek toplamı indeksi (paylaşılan)"""
+    return get_memory_budget().get_or_create(
+        SHARED, ('date_index',) + dataset_key[:2],
+        lambda: date_index.DailyPrefixIndex(df_all),
+        version=dataset_key
+    )
+
+
+def get_drilldown_index(dataset_key, df_all):
+    """Durum/şirket sıralı kırılım indeksi (paylaşılan, ilk açılışta oluşturulur)"""
+    return get_memory_budget().get_or_create(
+        SHARED, ('drilldown',) + dataset_key[:2],
+        lambda: drilldown.DrillDownIndex(df_all),
+        version=dataset_key
+    )
+
+
+DRILL_TOP_N = 15
+
+
+def _set_drill_path(path):
+    st.session_state.drill_path = tuple(path)
+
+
+def _open_drill_node():
+    choice = st.session_state.drill_choice
+    if choice is not None:
+        st.session_state.drill_path = st.session_state.drill_path + (choice,)
+    st.session_state.drill_choice = None
+
+
+@st.fragment
+def render_drilldown(dataset_key, df_all, mask, view_key, status_counts=None):
+    """Durum → şirket → pozisyon kırılımı; düğümler açıldıkça hesaplanır"""
+    levels = [c for c in drilldown.LEVELS if c in df_all.columns]
+    if not levels or levels[0] != 'Status':
+        return
+    
+    # Filtreler değişince kırılım köke döner
+    if st.session_state.get('drill_view') != view_key:
+        st.session_state.drill_view = view_key
+        st.session_state.drill_path = ()
+    path = st.session_state.drill_path
+    
+    # Kök seviyesi hazır durum dağılımından gelir; indeks ancak bir düğüm açılınca oluşturulur
+    if not path and status_counts is not None:
+        level = drilldown.level_from_counts(status_counts, DRILL_TOP_N)
+    else:
+        index = get_drilldown_index(dataset_key, df_all)
+        level = index.level(view_key, mask, path, top_n=DRILL_TOP_N)
+    level_label = SORT_LABELS.get(levels[len(path)], levels[len(path)])
+    
+    crumbs = st.columns(len(path) + 1 + (len(path) < len(levels) - 1))
+    crumbs[0].button("🏠 Tümü", key="drill_root", on_click=_set_drill_path, args=((),), disabled=not path,
+                     use_container_width=True)
+    for depth, label in enumerate(path):
+        crumbs[depth + 1].button(
+            str(label), key=f"drill_crumb_{depth}", on_click=_set_drill_path, args=(path[:depth + 1],),
+            disabled=depth == len(path) - 1, use_container_width=True
+        )
+    if len(path) < len(levels) - 1 and level['items']:
+        crumbs[-1].selectbox(
+            f"{level_label} aç",
+            options=[None] + [label for label, _ in level['items']],
+            format_func=lambda x: f"➕ {level_label} seç" if x is None else str(x),
+            key="drill_choice",
+            on_change=_open_drill_node,
+            label_visibility="collapsed"
+        )
+    
+    if not level['total']:
+        st.info("Bu düğümde kayıt yok.")
+        return
+    st.plotly_chart(create_drilldown_treemap(path, level, level_label), use_container_width=True)
+    if level['other']:
+        st.caption(
+            f"İlk {DRILL_TOP_N} {level_label.lower()} gösteriliyor; kalan {level['other_items']} "
+            f"{level_label.lower()} ({level['other']} başvuru) \"{drilldown.OTHER_LABEL}\" altında toplandı."
+        )
+
+
+SPECULATE_TOP_COMPANIES = 5
+
+
+def view_cache_key(filters):
+    """Filtre sözlüğünün sıradan bağımsız, hashlenebilir biçimi"""
+    return tuple(
+        (name, tuple(sorted(value)) if isinstance(value, (list, tuple)) else value)
+        for name, value in sorted(filters.items())
+        if value
+    )
+
+
+def sketch_allowed(filters, status_total):
+    """Top-k özetleri yalnızca tarih/kaynak filtresi varken kullanılabilir
+
+    Durum filtresi dolu durumların hepsini seçmelidir; boş durumlu satırlar
+    özetlerde ayrı tutulduğundan seçilip seçilmemeleri fark etmez.
+    """
+    statuses = filters.get('statuses')
+    known = [status for status in statuses or () if pd.notna(status)]
+    return not filters.get('company') and not (statuses and len(known) < status_total)
+
+
+def sketch_arguments(filters):
+    """Filtreleri top-k özeti argümanlarına çevir (durum maskesi filter_mask ile aynı)"""
+    statuses = filters.get('statuses')
+    unknown_status = not statuses or any(pd.isna(status) for status in statuses)
+    return filters.get('start'), filters.get('end'), filters.get('sources'), unknown_status
+
+
+def compute_view(df, filters, prefix_index=None, topk=None, check=None):
+    """Görünümün grafik toplamları (SQL motoru kapalıyken); `check` adımlar arasında çağrılır"""
+    check = check or (lambda: None)
+    range_index = prefix_index if prefix_index and prefix_index.covers(filters) else None
+    view = {}
+    
+    # Şirket/pozisyon sıralamaları: top-k özetleri > tam value_counts
+    sketch_args = sketch_arguments(filters)
+    for column, top_n in (('Company', 15), ('Position', 12)):
+        if topk and column in topk:
+            counts = topk[column].top_series(top_n, *sketch_args)
+        elif column in df.columns:
+            counts = df[column].value_counts().head(top_n)
+        else:
+            counts = None
+        view[column.lower() + '_counts'] = counts
+        check()
+    
+    if range_index:
+        view['metrics'] = range_index.metrics(filters)
+        view['status_counts'] = range_index.status_counts(filters)
+        view['daily_counts'] = range_index.daily_counts(filters)
+        view['status_by_company'] = range_index.status_by_company(filters)
+    else:
+        view['metrics'] = analytics.calculate_metrics(df)
+        view['status_counts'] = df['Status'].value_counts() if 'Status' in df.columns else None
+        view['daily_counts'] = analytics.daily_counts(df) if 'Date' in df.columns else None
+        view['status_by_company'] = None
+    check()
+    
+    if view['status_by_company'] is None and 'Company' in df.columns and 'Status' in df.columns:
+        company_counts = view['company_counts']
+        view['status_by_company'] = analytics.status_by_company(
+            df, 10, top_companies=company_counts.head(10).index if company_counts is not None else None
+        )
+        check()
+    
+    view['lag'] = lag_summary(df)
+    check()
+    view['lag_daily'] = lag_daily_quantiles(df) if view['lag'] else None
+    check()
+    view['weekday_hour'] = weekday_hour_counts(df)
+    return view
+
+
+def compute_period_counts(df, filters, period, prefix_index=None):
+    """Haftalık/aylık sayımlar (önek toplamı indeksi kapsıyorsa oradan)"""
+    if prefix_index and prefix_index.covers(filters):
+        return prefix_index.period_counts(period, filters)
+    return analytics.period_counts(df, period) if 'Date' in df.columns else None
+
+
+def view_cache_name(dataset_key, filters, part):
+    return ('view',) + dataset_key[:2] + (view_cache_key(filters), part)
+
+
+def get_view_part(owner, dataset_key, filters, part, factory):
+    """Görünüm toplamını önbellekten al, yoksa hesapla (spekülasyon isabetleri sayılır)"""
+    budget = get_memory_budget()
+    name = view_cache_name(dataset_key, filters, part)
+    value = budget.get(owner, name, version=dataset_key)
+    if SPECULATION_ENABLED:
+        get_speculator().record((owner, name), hit=value is not None)
+    if value is None:
+        value = budget.get_or_create(owner, name, factory, version=dataset_key)
+    return value
+
+
+def speculative_view_task(budget, owner, dataset_key, df_all, filters, parts, prefix_index):
+    """Bir aday görünümün eksik parçalarını hesaplayan arka plan işi
+
+    İş, üretim kilidi almaz: düşük öncelikli iş parçacığı bir kilidi tutarken aynı
+    görünümü isteyen ön plan onu beklemek yerine görünümü kendisi hesaplar.
+    """
+    def run(check):
+        names = {part: view_cache_name(dataset_key, filters, part) for part in parts}
+        missing = [part for part in parts if not budget.contains(owner, names[part], version=dataset_key)]
+        if not missing:
+            return []
+        df = analytics.apply_filters(df_all, filters)
+        check()
+        computed = []
+        for part in missing:
+            if part == 'summary':
+                value = compute_view(df, filters, prefix_index, check=check)
+            else:
+                value = compute_period_counts(df, filters, part, prefix_index)
+            check()
+            # Ön plan bu arada aynı görünümü hesapladıysa onunki korunur
+            if value is not None and not budget.contains(owner, names[part], version=dataset_key):
+                budget.put(owner, names[part], value, version=dataset_key)
+                computed.append((owner, names[part]))
+        return computed
+    return run
+
+
+def schedule_speculation(session_id, owner, dataset_key, df_all, filters, period, view, status_total, prefix_index):
+    """Sayfa çizildikten sonra olası sonraki görünümleri arka planda hazırla"""
+    candidates = [(filters, ['monthly' if period == 'weekly' else 'weekly'])]
+    status_counts = view['status_counts']
+    if status_counts is not None and len(status_counts) > 1:
+        candidates += [({**filters, 'statuses': [status]}, ['summary', period]) for status in status_counts.index]
+    company_counts = view['company_counts']
+    if company_counts is not None and not filters.get('company'):
+        candidates += [
+            ({**filters, 'company': company}, ['summary', period])
+            for company in company_counts.index[:SPECULATE_TOP_COMPANIES]
+        ]
+    budget = get_memory_budget()
+    get_speculator().submit(session_id, [
+        speculative_view_task(budget, owner, dataset_key, df_all, candidate, parts, prefix_index)
+        for candidate, parts in candidates
+        # Özet parçası top-k özetlerine bağlıysa ön planda hesaplanır
+        if 'summary' not in parts or not sketch_allowed(candidate, status_total)
+    ])
+
+
+def render_period_comparison(prefix_index, sources=None):
+    """Bu ay / geçen ay ve bu yıl / geçen yıl karşılaştırması"""
+    anchor = prefix_index.last_day
+    ranges = date_index.comparison_ranges(anchor)
+    st.markdown("## 🔁 Dönem Karşılaştırması")
+    st.caption(f"Son kayıt tarihi ({anchor:%d.%m.%Y}) esas alınır; önceki dönem aynı gün sayısıyla karşılaştırılır.")
+    
+    col1, col2 = st.columns(2)
+    for col, key, title in ((col1, 'month', '📆 Bu Ay / Geçen Ay'), (col2, 'year', '📅 Bu Yıl / Geçen Yıl')):
+        current_range, previous_range = ranges[key]
+        result = prefix_index.compare(current_range, previous_range, sources=sources)
+        current, previous = result['current'], result['previous']
+        with col:
+            st.markdown(f"**{title}**")
+            st.caption(
+                f"{current_range[0]:%d.%m.%Y} – {current_range[1]:%d.%m.%Y} · "
+                f"önceki: {previous_range[0]:%d.%m.%Y} – {previous_range[1]:%d.%m.%Y}"
+            )
+            m1, m2, m3, m4 = st.columns(4)
+            m1.metric("Başvuru", current['total'], delta=current['total'] - previous['total'])
+            m2.metric("Mülakat", current['interview'], delta=current['interview'] - previous['interview'])
+            m3.metric(
+                "Yanıt Oranı", f"{current['response_rate']:.1f}%",
+                delta=f"{current['response_rate'] - previous['response_rate']:+.1f} puan"
+            )
+            m4.metric(
+                "Red Oranı", f"{current['rejection_rate']:.1f}%",
+                delta=f"{current['rejection_rate'] - previous['rejection_rate']:+.1f} puan",
+                delta_color="inverse"
+            )
+
+
+def _format_bytes(n):
+    """Bayt sayısını okunabilir birime çevir"""
+    for unit in ('B', 'KB', 'MB'):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.2f} GB"
+
+
+def is_admin():
+    """Yönetici görünümü açık mı? (JOB_TRACKER_ADMIN=1 veya ?admin=1)"""
+    return os.environ.get('JOB_TRACKER_ADMIN') == '1' or st.query_params.get('admin') == '1'
+
+
+def render_memory_admin(budget, session_id):
+    """Bellek bütçesi kullanımını gösteren yönetici paneli"""
+    summary = budget.summary()
+    with st.expander("🧮 Bellek Kullanımı", expanded=False):
+        rss = process_rss()
+        col1, col2 = st.columns(2)
+        col1.metric("Bütçe", _format_bytes(summary['budget_bytes']))
+        col2.metric("Bellekte", _format_bytes(summary['resident_bytes']))
+        col1.metric("Paylaşılan", _format_bytes(summary['shared_bytes']))
+        col2.metric("Diskte", _format_bytes(summary['spilled_bytes']))
+        st.caption(
+            f"Süreç RSS: {_format_bytes(rss) if rss is not None else '?'} · "
+            f"{len(summary['session_bytes'])} oturum · bu oturum "
+            f"{_format_bytes(summary['session_bytes'].get(session_id, 0))}"
+        )
+        st.caption(
+            f"İsabet {summary['hits']} · ıska {summary['misses']} · diske taşınan {summary['spills']} · "
+            f"geri yüklenen {summary['reloads']} · atılan {summary['evictions']}"
+        )
+        if SPECULATION_ENABLED:
+            speculation = get_speculator().summary()
+            hit_rate = f"%{speculation['hit_rate'] * 100:.0f}" if speculation['hit_rate'] is not None else "-"
+            st.caption(
+                f"🔮 Ön hesaplama: isabet {speculation['hits']} · ıska {speculation['misses']} ({hit_rate}) · "
+                f"hazırlanan {speculation['computed']} · kullanılmayan {speculation['unused']} · "
+                f"iptal {speculation['cancelled']} · bekleyen {speculation['pending']} · "
+                f"{speculation['busy_seconds']:.1f} sn"
+            )
+        rows = budget.usage()
+        if rows:
+            st.dataframe(
+                [
+                    {
+                        'Sahip': 'paylaşılan' if row['owner'] == SHARED else row['owner'][:8],
+                        'Girdi': str(row['name']),
+                        'Boyut': _format_bytes(row['bytes']),
+                        'Durum': 'bellek' if row['state'] == 'memory' else 'disk',
+                        'Boşta (sn)': row['idle_seconds'],
+                    }
+                    for row in rows
+                ],
+                use_container_width=True,
+                hide_index=True
+            )
+
+
+def get_table_index(df_all, dataset_key, session_id):
+    """Veri seti başına bir kez oluşturulan sıralama indeksini döndür (oturumlar arasında paylaşılır)"""
+    # İndeks veri setini tuttuğu için veri seti o bellekteyken diske taşınmaz;
+    # bütçe aşılırsa indeks atılır ve bir sonraki ihtiyaçta yeniden oluşturulur
+    parent = dataset_entry(dataset_key, session_id)
+    return get_memory_budget().get_or_create(
+        parent[0], ('table_index',) + dataset_key[:2],
+        lambda: table_index.TableIndex(df_all, [c for c in SORT_LABELS if c in df_all.columns]),
+        version=dataset_key, spillable=False, depends_on=parent
+    )
+
+
+@st.fragment
+def render_application_table(table_index, df, view_key):
+    """Sunucu tarafında sıralanan ve sayfalanan başvuru tablosu"""
+    available_cols = [c for c in TABLE_COLUMNS if c in df.columns]
+    total = len(df)
+    if total == 0 or not table_index.columns:
+        st.info("Gösterilecek kayıt yok.")
+        return
+    
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    with col1:
+        sort_col = st.selectbox(
+            "Sırala",
+            options=table_index.columns,
+            format_func=lambda c: SORT_LABELS.get(c, c),
+            key="table_sort_col"
+        )
+    with col2:
+        ascending = st.radio(
+            "Yön",
+            options=[False, True],
+            format_func=lambda x: '⬆️ Artan' if x else '⬇️ Azalan',
+            horizontal=True,
+            key="table_sort_dir"
+        )
+    with col3:
+        page_size = st.selectbox("Sayfa boyutu", options=[25, 50, 100, 250], index=1, key="table_page_size")
+    
+    page_count = max(1, -(-total // page_size))
+    if st.session_state.get('table_page', 1) > page_count:
+        st.session_state.table_page = page_count
+    with col4:
+        page = st.number_input("Sayfa", min_value=1, max_value=page_count, value=1, step=1, key="table_page")
+    
+    sorted_positions = table_index.view(view_key, df, sort_col, ascending)
+    page_df = table_index.page(sorted_positions, int(page) - 1, page_size, available_cols)
+    
+    st.dataframe(
+        page_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Date': st.column_config.DateColumn('Tarih', format='DD/MM/YYYY'),
+            'Company': st.column_config.TextColumn('Şirket'),
+            'Position': st.column_config.TextColumn('Pozisyon'),
+            'Status': st.column_config.TextColumn('Durum'),
+            'Gmail Link': st.column_config.LinkColumn('Gmail', display_text='📧 Aç')
+        }
+    )
+    start = (int(page) - 1) * page_size
+    st.caption(f"{start + 1}–{min(start + page_size, total)} / {total} kayıt · sayfa {int(page)} / {page_count}")
+
+
+# Excel sayfası başına satır sınırı (başlık satırı dahil)
+EXCEL_MAX_ROWS = 1_048_576
+
+
+def _excel_value(ws, value):
+    """Excel'e yazılamayan değerleri (NaN/NaT, pandas tipleri, kontrol karakterleri) dönüştür"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    
+    if isinstance(value, str):
+        value = ILLEGAL_CHARACTERS_RE.sub('', value)
+        if value.startswith('='):
+            # "=" ile başlayan metin formül olarak yorumlanmasın: açık metin hücresi
+            cell = WriteOnlyCell(ws, value=value)
+            cell.data_type = 's'
+            return cell
+        return value
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime().replace(tzinfo=None)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _excel_header(ws, headers):
+    """Kalın başlık satırı ekle"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = Font(bold=True)
+        cells.append(cell)
+    ws.append(cells)
+
+
+def create_excel_export(df, metrics, output, status_counts=None, company_counts=None,
+                        weekly_counts=None, chunk_size=10_000):
+    """Filtrelenmiş veriyi openpyxl write-only modunda .xlsx olarak akıt
+    
+    Özet sayfaları sayfada zaten hesaplanmış toplamlardan (`status_counts`,
+    `company_counts`, `weekly_counts`) yazılır; verilmezlerse `df`'ten hesaplanır.
+    Satırlar Excel sınırını aşarsa birden fazla sayfaya bölünür. Satır
+    sayfalarının sayısını döndürür.
+    """
+    from openpyxl import Workbook
+    
+    wb = Workbook(write_only=True)
+    
+    # Özet sayfası
+    ws = wb.create_sheet('Özet')
+    _excel_header(ws, ['Metrik', 'Değer'])
+    for label, key in [
+        ('Toplam Başvuru', 'total'),
+        ('Farklı Şirket', 'unique_companies'),
+        ('Mülakat Daveti', 'interview'),
+        ('İnceleniyor', 'under_review'),
+        ('Reddedilen', 'rejected'),
+        ('Red Oranı (%)', 'rejection_rate'),
+        ('Yanıt Oranı (%)', 'response_rate'),
+        ('Mülakat Oranı (%)', 'interview_rate'),
+    ]:
+        ws.append([label, _excel_value(ws, round(metrics[key], 1))])
+    
+    # Durum dağılımı
+    if status_counts is None and 'Status' in df.columns:
+        status_counts = df['Status'].value_counts()
+    if status_counts is not None:
+        ws = wb.create_sheet('Durum Dağılımı')
+        _excel_header(ws, ['Durum', 'Sayı', 'Oran (%)'])
+        total = metrics['total']
+        for status, count in status_counts.items():
+            ws.append([_excel_value(ws, status), int(count), round(count / total * 100, 1) if total > 0 else 0])
+    
+    # En çok başvurulan şirketler
+    if company_counts is None and 'Company' in df.columns:
+        company_counts = df['Company'].value_counts().head(15)
+    if company_counts is not None:
+        ws = wb.create_sheet('Top Şirketler')
+        _excel_header(ws, ['Sıra', 'Şirket', 'Başvuru'])
+        for idx, (company, count) in enumerate(company_counts.head(15).items(), 1):
+            ws.append([idx, _excel_value(ws, company), int(count)])
+    
+    # Haftalık başvuru sayıları
+    if weekly_counts is None and 'Date' in df.columns:
+        weekly_counts = analytics.period_counts(df, 'weekly')
+    if weekly_counts is not None:
+        ws = wb.create_sheet('Haftalık')
+        _excel_header(ws, ['Hafta', 'Başvuru'])
+        for week, count in zip(weekly_counts['Period'], weekly_counts['count']):
+            ws.append([week, int(count)])
+    
+    # Tüm satırlar - parça parça akıtılır, tüm tablo Python nesnesine çevrilmez;
+    # yükleyicinin türettiği iç sütunlar yazılmaz
+    internal = {loader.EVENT_TIME_COLUMN, loader.WEEKDAY_COLUMN, loader.HOUR_COLUMN, loader.LAG_COLUMN}
+    columns = [c for c in df.columns if c not in internal]
+    rows_per_sheet = EXCEL_MAX_ROWS - 1
+    sheet_count = max(1, -(-len(df) // rows_per_sheet))
+    for sheet_no in range(sheet_count):
+        ws = wb.create_sheet('Başvurular' if sheet_no == 0 else f'Başvurular ({sheet_no + 1})')
+        _excel_header(ws, [str(c) for c in columns])
+        sheet_end = min(len(df), (sheet_no + 1) * rows_per_sheet)
+        for start in range(sheet_no * rows_per_sheet, sheet_end, chunk_size):
+            chunk = df.iloc[start:min(start + chunk_size, sheet_end)][columns]
+            for row in chunk.itertuples(index=False, name=None):
+                ws.append([_excel_value(ws, v) for v in row])
+    
+    wb.save(output)
+    return sheet_count
+
+
 def main():
+    # İsteğe bağlı ısınma: ağır modüller karşılama ekranı çizilirken yüklenir
+    if WARMUP_ENABLED:
+        start_warmup()
+    
+    # Her yeniden çalıştırma bir girdi değişikliğidir: bu oturumun spekülatif işleri bırakılır
+    session_id = current_session_id()
+    if SPECULATION_ENABLED:
+        get_speculator().cancel(session_id)
+
     # Header - Streamlit'in kendi fonksiyonlarını kullan
     st.title("📊 İş Başvurusu Analiz Platformu")
     st.markdown("**n8n otomasyonundan gelen LinkedIn başvuru verilerinizi analiz edin**")
@@ -823,11 +1710,13 @@ def main():
         st.markdown("### 📁 Veri Yükleme")
         st.info("💡 **Bilgi:** n8n workflow'unuzdan dışa aktardığınız CSV dosyasını yükleyin.")
         
-        uploaded_file = st.file_uploader(
-            "CSV dosyası seçin",
+        uploaded_files = st.file_uploader(
+            "CSV dosyaları seçin",
             type=['csv'],
-            help="n8n'den export ettiğiniz başvuru verilerini içeren CSV dosyası"
+            accept_multiple_files=True,
+            help="n8n'den export ettiğiniz başvuru verilerini içeren CSV dosyaları (hesap/yıl başına birden fazla olabilir)"
         )
+        cli_paths = get_cli_paths()
         
         st.markdown("---")
         
@@ -836,12 +1725,40 @@ def main():
         # Demo veri seçeneği
         use_demo = st.checkbox("Demo veri kullan", value=False, help="Örnek veri ile platformu test edin")
         
-        if uploaded_file or use_demo:
+        # Canlı veri seçeneği (ingest_server.py ile n8n'den gelen kayıtlar)
+        use_live = st.checkbox(
+            "Canlı n8n verisi kullan",
+            value=False,
+            help="ingest_server.py'nin yerel depoya yazdığı kayıtları otomatik yenilenerek gösterir"
+        )
+        
+        # Klasör izleme seçeneği (günlük n8n exportlarının düştüğü klasör)
+        use_watch = st.checkbox(
+            "Klasörü izle",
+            value=bool(os.environ.get('JOB_TRACKER_WATCH_PATH')),
+            help="Klasördeki CSV dosyaları değiştikçe dashboard otomatik güncellenir"
+        )
+        watch_path = None
+        if use_watch:
+            watch_path = st.text_input(
+                "İzlenecek klasör veya dosya",
+                value=os.environ.get('JOB_TRACKER_WATCH_PATH', '')
+            ).strip()
+        
+        # SQL analitik motoru (DuckDB kuruluysa DuckDB, değilse SQLite)
+        use_sql = st.checkbox(
+            "🗄️ SQL analitik motoru",
+            value=os.environ.get('JOB_TRACKER_SQL') == '1',
+            help="Grafik toplamalarını gömülü veritabanına iter ve özel sorgu panelini açar"
+        )
+        
+        has_data = bool(uploaded_files or cli_paths or use_demo or use_live or watch_path)
+        if has_data:
             st.markdown("---")
             st.markdown("### 🎯 Filtreler")
     
     # Ana içerik
-    if uploaded_file is None and not use_demo:
+    if not has_data:
         # Karşılama ekranı
         st.markdown("## 📤 Başlamak için veri yükleyin")
         st.markdown("Sol panelden n8n otomasyonunuzdan aldığınız CSV dosyasını yükleyin veya demo veriyi aktifleştirin.")
@@ -875,34 +1792,95 @@ def main():
         
         return
     
-    # Veri yükleme
-    if use_demo:
+    # Veri yükleme (veri setleri bellek bütçesi üzerinden oturumlar arasında paylaşılır)
+    if use_live:
+        store = LocalStore()
+        data_dir = str(store.data_dir)
+        loaded_version = store.version()
+        dataset_key = ('live', data_dir, loaded_version)
+        df = load_dataset(
+            ('live', data_dir), dataset_key, lambda: load_store_data(data_dir),
+            sources=(str(store.csv_path),)
+        )
+        watch_store_version(data_dir, loaded_version)
+        if df is None or df.empty:
+            st.info("📡 Henüz canlı veri yok. n8n workflow'unu çalıştırdığınızda kayıtlar burada görünecek.")
+            return
+    elif watch_path:
+        folder_watcher = get_folder_watcher(watch_path)
+        folder_watcher.scan()
+        df = load_watched_data(watch_path, folder_watcher.generation)
+        dataset_key = ('watch', watch_path, folder_watcher.generation)
+        watch_folder(watch_path, folder_watcher.generation)
+        for file_name, error in folder_watcher.errors.items():
+            st.warning(f"⚠️ {file_name} okunamadı: {error}")
+        if df is None or df.empty:
+            st.info(f"👀 `{watch_path}` içinde henüz CSV dosyası yok.")
+            return
+    elif use_demo:
         # sample_data.csv dosyasından demo veri yükle
-        import os
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        sample_data_path = os.path.join(script_dir, 'sample_data.csv')
-        
         try:
-            df = pd.read_csv(sample_data_path)
-            # Tarih sütununu datetime'a çevir
-            if 'Date' in df.columns:
-                df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-                df = df.dropna(subset=['Date'])
-                df = df.sort_values('Date', ascending=False)
+            df = load_demo_data(DEMO_DATA_PATH)
+            dataset_key = ('demo', DEMO_DATA_PATH)
             st.info("🎮 Demo verisi kullanılıyor (sample_data.csv). Gerçek verilerinizi yüklemek için sol panelden CSV dosyanızı seçin.")
         except FileNotFoundError:
             st.error("❌ sample_data.csv dosyası bulunamadı. Lütfen dosyanın proje klasöründe olduğundan emin olun.")
             return
+    elif uploaded_files:
+        # Yüklenen dosyalar oturuma aittir; oturum kapanınca bırakılır
+        dataset_key = ('upload',) + tuple(f.file_id for f in uploaded_files)
+        df = load_dataset(('upload',), dataset_key, lambda: load_data(uploaded_files), owner=session_id)
+        if df is None:
+            return
     else:
-        df = load_data(uploaded_file)
+        signatures = tuple((os.path.getmtime(p), os.path.getsize(p)) for p in cli_paths)
+        dataset_key = ('cli', tuple(cli_paths), signatures)
+        df = load_dataset(
+            ('cli', tuple(cli_paths)), dataset_key, lambda: load_data(list(cli_paths)),
+            sources=tuple(cli_paths)
+        )
         if df is None:
             return
     
-    # Sidebar filtreleri
+    # Filtrelenmemiş veri seti ve filtre durumu (sayfalı tablo indeksi için)
+    df_all = df
+    
+    # Zaman damgası raporu: tarihi okunamayan satırlar analize alınmaz
+    timestamp_report = df_all.attrs.get(loader.REPORT_ATTR, {})
+    dropped = timestamp_report.get('unknown_date', 0) + timestamp_report.get('invalid_date', 0)
+    if dropped:
+        st.warning(
+            f"⚠️ {dropped} kayıt tarihi okunamadığı için analize alınmadı "
+            f"(Unknown: {timestamp_report.get('unknown_date', 0)}, geçersiz: {timestamp_report.get('invalid_date', 0)})."
+        )
+    if timestamp_report.get('missing_date', 0):
+        st.warning(
+            f"⚠️ {timestamp_report['missing_date']} kayıt tarih sütunu olmayan kaynaklardan geldi; "
+            "zamana dayalı grafiklere alınmadı."
+        )
+    filter_key = []
+    filters = {}
+    status_total = 0
+    
+    # Sidebar filtreleri: tüm koşullar tek bir maskede birleştirilir, veri bir kez kesilir
+    mask = np.ones(len(df_all), dtype=bool)
     with st.sidebar:
-        if 'Date' in df.columns:
-            min_date = df['Date'].min().date()
-            max_date = df['Date'].max().date()
+        if loader.SOURCE_COLUMN in df_all.columns and df_all[loader.SOURCE_COLUMN].nunique() > 1:
+            sources = st.multiselect(
+                "Kaynak Filtresi",
+                options=sorted(df_all[loader.SOURCE_COLUMN].dropna().unique().tolist()),
+                default=sorted(df_all[loader.SOURCE_COLUMN].dropna().unique().tolist()),
+                help="Dosya (hesap/yıl) bazında filtreleme"
+            )
+            if sources:
+                mask &= df_all[loader.SOURCE_COLUMN].isin(sources).to_numpy()
+            filter_key.append(('source', tuple(sources)))
+            filters['sources'] = sources
+        
+        if 'Date' in df_all.columns:
+            dates = df_all['Date'][mask]
+            min_date = dates.min().date()
+            max_date = dates.max().date()
             date_range = st.date_input(
                 "Tarih Aralığı",
                 value=(min_date, max_date),
@@ -910,20 +1888,30 @@ def main():
                 max_value=max_date
             )
             if len(date_range) == 2:
-                df = df[(df['Date'].dt.date >= date_range[0]) & (df['Date'].dt.date <= date_range[1])]
+                date_tz = df_all['Date'].dt.tz
+                day_start = pd.Timestamp(date_range[0], tz=date_tz)
+                day_end = pd.Timestamp(date_range[1], tz=date_tz) + pd.Timedelta(days=1)
+                mask &= ((df_all['Date'] >= day_start) & (df_all['Date'] < day_end)).to_numpy()
+            filter_key.append(('date', tuple(date_range)))
+            if len(date_range) == 2:
+                filters['start'], filters['end'] = date_range
         
-        if 'Status' in df.columns:
+        if 'Status' in df_all.columns:
+            status_options = df_all['Status'][mask].unique().tolist()
             statuses = st.multiselect(
                 "Durum Filtresi",
-                options=df['Status'].unique().tolist(),
-                default=df['Status'].unique().tolist()
+                options=status_options,
+                default=status_options
             )
             if statuses:
-                df = df[df['Status'].isin(statuses)]
+                mask &= df_all['Status'].isin(statuses).to_numpy()
+            status_total = df_all['Status'].nunique()
+            filter_key.append(('status', tuple(statuses)))
+            filters['statuses'] = statuses
         
-        if 'Company' in df.columns:
+        if 'Company' in df_all.columns:
             # Tüm benzersiz şirketleri al
-            all_companies = sorted(df['Company'].unique().tolist())
+            all_companies = sorted(df_all['Company'][mask].unique().tolist())
             
             # Session state ile seçilen şirketi takip et
             if 'selected_company_filter' not in st.session_state:
@@ -944,16 +1932,61 @@ def main():
             
             # Filtreleme uygula
             if selected_company:
-                df = df[df['Company'] == selected_company]
+                mask &= (df_all['Company'] == selected_company).to_numpy()
+            filter_key.append(('company', selected_company))
+            filters['company'] = selected_company
             # None seçildiyse tüm şirketleri göster (filtreleme yapılmaz)
     
-    # Metrikleri hesapla
-    metrics = calculate_metrics(df)
+    df = df_all if mask.all() else df_all[mask]
+    view_key = (dataset_key, tuple(filter_key))
+    
+    # Filtrelenmiş görünüm oturuma yazılır; metin değerleri tam veri setiyle
+    # paylaşıldığından yalnızca sütun dizilerinin (sığ) boyutu sayılır
+    budget = get_memory_budget()
+    if df is not df_all:
+        budget.put(session_id, 'filtered_view', df, version=view_key, spillable=False,
+                   nbytes=int(df.memory_usage(index=True, deep=False).sum()),
+                   depends_on=dataset_entry(dataset_key, session_id))
+    
+    # SQL motoru açıksa toplamalar veritabanına itilir
+    analytics_db = get_analytics_db(dataset_key, df_all) if use_sql else None
+    
+    # Tarih/kaynak/durum filtreleri önek toplamı indeksinden sabit sürede yanıtlanır
+    has_dates = 'Date' in df_all.columns and df_all['Date'].notna().any()
+    prefix_index = get_date_index(dataset_key, df_all) if has_dates else None
+    
+    # Görünüm toplamları: SQL motoru ya da paylaşılan görünüm önbelleği (arka planda
+    # önceden hesaplanmış olabilir). Yüklenen dosyaların görünümleri oturuma aittir.
+    view_owner = session_id if dataset_key[0] == 'upload' else SHARED
+    if analytics_db:
+        view = {
+            'company_counts': analytics_db.value_counts('Company', filters, limit=15),
+            'position_counts': analytics_db.value_counts('Position', filters, limit=12),
+            'metrics': analytics_db.metrics(filters),
+            'status_counts': analytics_db.value_counts('Status', filters),
+            'daily_counts': analytics_db.daily_counts(filters),
+            'status_by_company': analytics_db.status_by_company(filters),
+            'lag': lag_summary(df),
+            'lag_daily': None,
+            'weekday_hour': None,
+        }
+    else:
+        # Yalnızca tarih/kaynak filtresi varken top-k bölüm özetleri birleştirilir, satırlar taranmaz
+        view = get_view_part(
+            view_owner, dataset_key, filters, 'summary',
+            lambda: compute_view(
+                df, filters, prefix_index,
+                topk=get_topk_index(dataset_key, df_all) if sketch_allowed(filters, status_total) else None
+            )
+        )
+    metrics = view['metrics']
+    company_counts = view['company_counts']
+    position_counts = view['position_counts']
     
     # Metrik kartları
     st.markdown("## 📈 Genel Bakış")
     
-    col1, col2, col3, col4, col5 = st.columns(5)
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
     
     with col1:
         st.metric("Toplam Başvuru", f"{metrics['total']}")
@@ -970,13 +2003,26 @@ def main():
     with col5:
         st.metric("Red Oranı", f"{metrics['rejection_rate']:.1f}%")
     
+    lag = view['lag']
+    with col6:
+        st.metric(
+            "İşlem Gecikmesi",
+            format_minutes(lag['median']) if lag else "-",
+            help=f"Medyan; 90. yüzdelik {format_minutes(lag['p90'])}" if lag else "Processed At veya Time bilgisi yok"
+        )
+    
+    # Dönem karşılaştırması (tarih filtresinden bağımsız, kaynak filtresine uyar)
+    if prefix_index:
+        render_period_comparison(prefix_index, sources=filters.get('sources'))
+    
     # Grafikler - Üst satır
     st.markdown("## 📊 Detaylı Analizler")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = create_status_chart(df)
+        status_counts = view['status_counts']
+        fig = create_status_chart(df, status_counts=status_counts)
         if fig:
             st.plotly_chart(fig, use_container_width=True)
     
@@ -986,7 +2032,7 @@ def main():
             st.plotly_chart(fig, use_container_width=True)
     
     # Zaman serisi grafiği
-    fig = create_timeline_chart(df)
+    fig = create_timeline_chart(df, daily_counts=view['daily_counts'])
     if fig:
         st.plotly_chart(fig, use_container_width=True)
     
@@ -994,12 +2040,14 @@ def main():
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = create_company_chart(df)
+        fig = create_company_chart(df, company_counts=company_counts)
         if fig:
             st.plotly_chart(fig, use_container_width=True)
+            if company_counts is not None and company_counts.attrs.get('max_error'):
+                st.caption(f"≈ Space-Saving tahmini (en fazla ±{company_counts.attrs['max_error']})")
     
     with col2:
-        fig = create_position_wordcloud_chart(df)
+        fig = create_position_wordcloud_chart(df, position_counts=position_counts)
         if fig:
             st.plotly_chart(fig, use_container_width=True)
     
@@ -1016,44 +2064,82 @@ def main():
             key="period_selector"
         )
         
-        fig = create_period_histogram(df, period=period_option)
+        if analytics_db:
+            period_counts = analytics_db.period_counts(period_option, filters)
+        else:
+            period_counts = get_view_part(
+                view_owner, dataset_key, filters, period_option,
+                lambda: compute_period_counts(df, filters, period_option, prefix_index)
+            )
+        fig = create_period_histogram(df, period=period_option, period_counts=period_counts)
         if fig:
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        fig = create_status_by_company(df)
+        fig = create_status_by_company(
+            df,
+            status_company=view['status_by_company'],
+            top_companies=company_counts.head(10).index if company_counts is not None else None
+        )
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+    
+    # Durum → şirket → pozisyon kırılımı
+    if 'Status' in df.columns and 'Company' in df.columns:
+        st.markdown("## 🧭 Durum → Şirket → Pozisyon")
+        render_drilldown(dataset_key, df_all, None if df is df_all else mask, view_key, status_counts=status_counts)
+    
+    # Haftanın günü x saat aktivite haritası
+    if loader.WEEKDAY_COLUMN in df.columns:
+        st.markdown("## 🗓️ Haftalık Aktivite Haritası")
+        heatmap_metric = st.radio(
+            "Gösterilen:",
+            options=['applications', 'responses'],
+            format_func=lambda x: '📨 Başvurular' if x == 'applications' else '📬 Yanıtlar',
+            horizontal=True,
+            key="heatmap_metric"
+        )
+        fig = create_activity_heatmap(df, metric=heatmap_metric, counts=view['weekday_hour'])
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.caption("Saat bilgisi (Time sütunu) olan kayıt bulunamadı.")
+    
+    # n8n işlem gecikmesi (Processed At - olay zamanı)
+    if lag:
+        st.markdown("## ⏱️ İşlem Gecikmesi")
+        fig = create_lag_chart(df, daily=view['lag_daily'])
         if fig:
             st.plotly_chart(fig, use_container_width=True)
+        skipped = [
+            (timestamp_report.get('missing_time', 0), "saat bilgisi yok"),
+            (timestamp_report.get('invalid_processed', 0), "Processed At okunamadı"),
+            (timestamp_report.get('negative_lag', 0), "Processed At olay zamanından önce"),
+        ]
+        notes = [f"{n} kayıt: {reason}" for n, reason in skipped if n]
+        if notes:
+            st.caption("Gecikmeye dahil edilmeyenler — " + " · ".join(notes))
     
     # Veri tablosu
     st.markdown("## 📋 Başvuru Detayları")
     
-    # Tablo için sütun seçimi
-    display_cols = ['Date', 'Company', 'Position', 'Status']
-    if 'Gmail Link' in df.columns:
-        display_cols.append('Gmail Link')
+    application_index = get_table_index(df_all, dataset_key, session_id)
+    render_application_table(application_index, df, view_key)
     
-    available_cols = [c for c in display_cols if c in df.columns]
-    
-    st.dataframe(
-        df[available_cols].head(50),
-        use_container_width=True,
-        hide_index=True,
-        column_config={
-            'Date': st.column_config.DateColumn('Tarih', format='DD/MM/YYYY'),
-            'Company': st.column_config.TextColumn('Şirket'),
-            'Position': st.column_config.TextColumn('Pozisyon'),
-            'Status': st.column_config.TextColumn('Durum'),
-            'Gmail Link': st.column_config.LinkColumn('Gmail', display_text='📧 Aç')
-        }
-    )
+    if analytics_db:
+        render_sql_panel(analytics_db)
     
     # Export seçeneği
     st.markdown("---")
     col1, col2, col3 = st.columns([1, 1, 2])
     
+    # İndirme içerikleri görünüm başına bir kez üretilir; bütçe aşılırsa diske taşınır
+    export_key = (view_key, analytics_db is not None)
+    
     with col1:
-        csv = df.to_csv(index=False).encode('utf-8')
+        csv = budget.get_or_create(
+            session_id, 'csv_export', lambda: df.to_csv(index=False).encode('utf-8'), version=export_key
+        )
         st.download_button(
             label="📥 CSV İndir",
             data=csv,
@@ -1063,7 +2149,13 @@ def main():
     
     with col2:
         # HTML Dashboard oluştur
-        html_dashboard = create_html_dashboard(df, metrics)
+        html_dashboard = budget.get_or_create(
+            session_id, 'html_export',
+            lambda: create_html_dashboard(
+                df, metrics, company_counts=company_counts, position_counts=position_counts
+            ),
+            version=export_key
+        )
         st.download_button(
             label="📊 Dashboard İndir (HTML)",
             data=html_dashboard,
@@ -1072,6 +2164,65 @@ def main():
             help="Tüm grafikler ve analizlerle birlikte interaktif HTML dashboard"
         )
     
+    with col3:
+        # Excel dosyası yalnızca istendiğinde bellekte oluşturulur ve oturumun
+        # bütçe girdisi olarak tutulur (geçici dosya bırakmaz; bütçe aşılırsa diske taşınır)
+        excel_key = (len(df), int(pd.util.hash_pandas_object(df.index).sum()), tuple(df.columns))
+        if not budget.contains(session_id, 'excel_export', excel_key):
+            budget.discard(session_id, 'excel_export')
+        
+        clicked = st.button("📗 Excel Hazırla", help="Filtrelenmiş veriyi özet sayfalarıyla .xlsx olarak hazırlar")
+        if clicked:
+            # Özet sayfaları sayfanın zaten hesapladığı toplamlardan yazılır
+            if period_option == 'weekly':
+                weekly_counts = period_counts
+            elif analytics_db:
+                weekly_counts = analytics_db.period_counts('weekly', filters)
+            else:
+                weekly_counts = get_view_part(
+                    view_owner, dataset_key, filters, 'weekly',
+                    lambda: compute_period_counts(df, filters, 'weekly', prefix_index)
+                )
+            with st.spinner("Excel dosyası hazırlanıyor..."):
+                output = io.BytesIO()
+                try:
+                    sheet_count = create_excel_export(
+                        df, metrics, output,
+                        status_counts=view['status_counts'],
+                        company_counts=company_counts,
+                        weekly_counts=weekly_counts,
+                    )
+                except Exception as e:
+                    sheet_count = 0
+                    st.error(f"❌ Excel dosyası oluşturulamadı: {e}")
+                else:
+                    budget.put(session_id, 'excel_export', output.getvalue(), version=excel_key)
+            if sheet_count > 1:
+                st.warning(
+                    f"⚠️ Satırlar Excel'in sayfa sınırını aştığı için {sheet_count} sayfaya bölündü."
+                )
+        
+        excel = None
+        if budget.contains(session_id, 'excel_export', excel_key):
+            excel = budget.get(session_id, 'excel_export', excel_key)
+        if excel is not None:
+            st.download_button(
+                label="📗 Excel İndir",
+                data=excel,
+                file_name=f"basvuru_analiz_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+    
+    # Sayfa çizildi: olası sonraki görünümler düşük öncelikle önceden hesaplanır
+    if SPECULATION_ENABLED and not analytics_db:
+        schedule_speculation(
+            session_id, view_owner, dataset_key, df_all, filters, period_option, view, status_total, prefix_index
+        )
+    
+    if is_admin():
+        with st.sidebar:
+            render_memory_admin(budget, session_id)
+    
     # Footer
     st.markdown("---")
     st.markdown("**📊 İş Başvurusu Analiz Platformu** | n8n + Streamlit ile güçlendirilmiştir")
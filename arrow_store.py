@@ -0,0 +1,103 @@
+"""
+🏹 Paylaşılan Arrow Anlık Görüntüsü
+===================================
+Ayrıştırılmış veri seti bir kez Arrow IPC dosyasına yazılır; aynı makinedeki
+tüm Streamlit süreçleri ve oturumları dosyayı salt okunur bellek eşlemesiyle
+(mmap) açar. Metin sütunları pandas'a kopyalanmadan `ArrowDtype` olarak
+bağlanır, böylece filtreler ve value_counts doğrudan eşlenmiş tamponlar
+üzerinde pyarrow.compute çekirdekleriyle çalışır.
+
+Güncellemede yeni dosya geçici adla yazılıp `os.replace` ile atomik olarak
+yerine konur; eski dosyayı eşlemiş okuyucular kapanana kadar eski sürümü
+görmeye devam eder.
+"""
+
+import hashlib
+import os
+import tempfile
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+
+VERSION_KEY = b'job_tracker_version'
+DEFAULT_SNAPSHOT_DIR = (
+    os.environ.get('JOB_TRACKER_SNAPSHOT_DIR')
+    or os.path.join(tempfile.gettempdir(), 'job_tracker_snapshots')
+)
+
+
+def snapshot_path(name, snapshot_dir=None):
+    """Veri kaynağı için kararlı anlık görüntü dosya yolu"""
+    digest = hashlib.blake2b(repr(name).encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(snapshot_dir or DEFAULT_SNAPSHOT_DIR, f'{name[0]}-{digest}.arrow')
+
+
+def source_signature(paths):
+    """Kaynak dosyaların (mtime, boyut) imzası; aynı sürüm numarasıyla yeniden yazılan veriyi ayırt eder"""
+    return tuple((os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in paths)
+
+
+def write_snapshot(df, path, version):
+    """DataFrame'i Arrow IPC dosyasına yaz ve atomik olarak yerine koy"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[VERSION_KEY] = str(version).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+
+    tmp_path = f'{path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp'
+    try:
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        with open(tmp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def snapshot_version(path):
+    """Dosyadaki sürüm etiketi (dosya yoksa veya okunamıyorsa None)"""
+    try:
+        with pa.memory_map(path, 'r') as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    value = metadata.get(VERSION_KEY)
+    return value.decode('utf-8') if value is not None else None
+
+
+def _pandas_type(arrow_type):
+    """Metin sütunları Arrow tamponlarında kalır; tarih/sayı sütunları numpy görünümüdür"""
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+
+def map_snapshot(path):
+    """Dosyayı salt okunur eşle ve sütunları kopyalamadan DataFrame olarak döndür"""
+    # Tamponlar eşlemeye referans tutar; eşleme DataFrame yaşadığı sürece açık kalır
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    return table.to_pandas(types_mapper=_pandas_type, split_blocks=True)
+
+
+def load_or_build(name, version, factory, snapshot_dir=None):
+    """Sürüm eşleşiyorsa mevcut anlık görüntüyü eşle, değilse oluşturup yaz"""
+    path = snapshot_path(name, snapshot_dir)
+    if snapshot_version(path) != str(version):
+        df = factory()
+        if df is None:
+            return None
+        write_snapshot(df, path, version)
+    return map_snapshot(path)
+
+
+def mapped_nbytes(df):
+    """Eşlenmiş dosyada duran (süreç belleğine kopyalanmamış) sütunların boyutu"""
+    return sum(
+        df[column].array.nbytes for column in df.columns
+        if isinstance(df[column].dtype, pd.ArrowDtype)
+    )
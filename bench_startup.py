@@ -0,0 +1,105 @@
+"""
+⏱️ Soğuk Başlangıç Ölçümü
+=========================
+Her ölçüm temiz bir Python sürecinde çalışır; böylece modül önbelleği
+sonucu etkilemez. Karşılama ekranının çizilme süresi, demo verinin ilk
+çizimi ve ağır modüllerin tek başına içe aktarma süreleri raporlanır.
+
+Kullanım:
+    python bench_startup.py --runs 5
+    python bench_startup.py --max-landing 3.0   # CI'da eşik aşılırsa çıkış kodu 1
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(APP_DIR, 'app.py')
+
+# Karşılama ekranında yüklenmemesi gereken modüller
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl', 'loader', 'sql_backend', 'table_index']
+
+LANDING_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+t2 = time.perf_counter()
+result = {{'streamlit_import': t1 - t0, 'landing': t2 - t1,
+          'loaded': [m for m in {heavy!r} if m in sys.modules]}}
+if {demo!r}:
+    at.sidebar.checkbox[0].check().run()
+    result['demo_first_render'] = time.perf_counter() - t2
+print(json.dumps(result))
+"""
+
+IMPORT_SCRIPT = """
+import importlib, json, time
+t0 = time.perf_counter()
+importlib.import_module({module!r})
+print(json.dumps({{'seconds': time.perf_counter() - t0}}))
+"""
+
+
+def run_isolated(code):
+    """Kodu yeni bir Python sürecinde çalıştır ve son JSON satırını döndür"""
+    env = dict(os.environ, PYTHONPATH=APP_DIR, JOB_TRACKER_WARMUP='0')
+    completed = subprocess.run(
+        [sys.executable, '-c', code], cwd=APP_DIR, env=env,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def summarize(values):
+    """Medyan / en iyi / en kötü süreler"""
+    return {
+        'median': round(statistics.median(values), 3),
+        'min': round(min(values), 3),
+        'max': round(max(values), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dashboard soğuk başlangıç ölçümü')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--no-demo', action='store_true', help='Demo veri çizimini ölçme')
+    parser.add_argument('--max-landing', type=float, default=None,
+                        help='Karşılama ekranı medyan süresi için üst sınır (saniye)')
+    args = parser.parse_args()
+
+    runs = [
+        run_isolated(LANDING_SCRIPT.format(app=APP_PATH, heavy=HEAVY_MODULES, demo=not args.no_demo))
+        for _ in range(args.runs)
+    ]
+    report = {
+        'runs': args.runs,
+        'streamlit_import': summarize([r['streamlit_import'] for r in runs]),
+        'landing': summarize([r['landing'] for r in runs]),
+        'heavy_modules_on_landing': sorted({m for r in runs for m in r['loaded']}),
+        'imports': {
+            module: round(run_isolated(IMPORT_SCRIPT.format(module=module))['seconds'], 3)
+            for module in ('pandas', 'plotly.graph_objects', 'openpyxl')
+        },
+    }
+    if not args.no_demo:
+        report['demo_first_render'] = summarize([r['demo_first_render'] for r in runs])
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    if report['heavy_modules_on_landing']:
+        print(f"⚠️ Karşılama ekranında yüklenen ağır modüller: {report['heavy_modules_on_landing']}",
+              file=sys.stderr)
+    if args.max_landing is not None and report['landing']['median'] > args.max_landing:
+        print(f"❌ Karşılama süresi {report['landing']['median']}s > {args.max_landing}s", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
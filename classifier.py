@@ -0,0 +1,260 @@
+"""
+🏷️ Sürümlü Email Sınıflandırıcı
+===============================
+n8n workflow'undaki "Kategorize & Extract Data" düğümünün Python karşılığı.
+Anahtar kelime listeleri ve şirket/pozisyon regex'leri koddan ayrı bir JSON
+kural dosyasında (`classification_rules.json`) tutulur; kural setinin sürümü
+içeriğinin hash'idir.
+
+`subject_filter` n8n'deki "Filter Job Applications Only" düğümünün karşılığıdır:
+konusu bu ifadelerden birini içermeyen emailler satır üretmez.
+
+İki kural seti karşılaştırıldığında (`RuleChange`) hangi emaillerin sonucunun
+değişebileceği belirlenir: değişen anahtar kelimeleri içeren emailler ve
+ilk eşleşen şirket/pozisyon kuralı değişen konumda veya sonrasında olanlar.
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent / 'classification_rules.json'
+
+# classify() mantığı değiştiğinde artırılır; eski sonuçların tamamı yeniden hesaplanır
+ENGINE_VERSION = 2
+
+GMAIL_LINK_PREFIX = 'https://mail.google.com/mail/u/0/#inbox/'
+TOKEN_RE = re.compile(r'\w+')
+
+
+def load_rules(path=None):
+    """Kural dosyasını oku (varsayılan: classification_rules.json)"""
+    with open(path or DEFAULT_RULES_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def rules_version(rules):
+    """Kural setinin içerik hash'inden türetilen sürüm etiketi"""
+    canonical = json.dumps([ENGINE_VERSION, rules], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:12]
+
+
+def tokenize(text):
+    """Özellik indeksi için metindeki benzersiz kelimeler (küçük harf)"""
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+def phrase_term_filters(phrase):
+    """Anahtar kelimeyi içeren bir metnin kelimelerinin sağlaması gereken koşullar.
+
+    Her kelime için (kelime, tam, önek, sonek) döner: ifadenin içindeki kelimeler
+    metinde birebir geçmelidir; kenardaki kelimeler metindeki bir kelimenin
+    başında, sonunda veya içinde geçebilir.
+    """
+    phrase = phrase.lower()
+    matches = list(TOKEN_RE.finditer(phrase))
+    filters = []
+    for i, match in enumerate(matches):
+        starts_at_boundary = i > 0 or match.start() > 0
+        ends_at_boundary = i < len(matches) - 1 or match.end() < len(phrase)
+        filters.append((match.group(), starts_at_boundary, ends_at_boundary))
+    return filters
+
+
+def term_matches(term, word, starts_at_boundary, ends_at_boundary):
+    """İndeksteki `term` kelimesi, ifadedeki `word` için aday mı?"""
+    if starts_at_boundary and ends_at_boundary:
+        return term == word
+    if starts_at_boundary:
+        return term.startswith(word)
+    if ends_at_boundary:
+        return term.endswith(word)
+    return word in term
+
+
+def _first_difference(old, new):
+    """İki sıralı listenin ilk farklı olduğu konum (aynıysa None)"""
+    for i, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            return i
+    if len(old) != len(new):
+        return min(len(old), len(new))
+    return None
+
+
+def _email_datetime(email):
+    """internalDate (ms) veya Date başlığından UTC zaman"""
+    internal = email.get('internalDate')
+    if internal:
+        try:
+            ts = int(internal)
+            return datetime.fromtimestamp(ts / 1000 if ts > 1_000_000_000_000 else ts, tz=timezone.utc)
+        except (TypeError, ValueError, OverflowError, OSError):
+            pass
+    if email.get('date'):
+        try:
+            parsed = parsedate_to_datetime(email['date'])
+        except (TypeError, ValueError, IndexError):
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+    return None
+
+
+def email_texts(email):
+    """Kuralların baktığı metinler: küçük harfli tam metin ve orijinal alanlar"""
+    subject = email.get('Subject') or email.get('subject') or ''
+    snippet = email.get('snippet') or ''
+    body_html = email.get('html') or email.get('textHtml') or ''
+    body_plain = email.get('textPlain') or email.get('text') or snippet
+    full_text = f'{subject.lower()} {snippet.lower()} {body_plain.lower()}'
+    return full_text, subject, snippet, body_html
+
+
+class RuleChange:
+    """Eski ve yeni kural seti arasındaki, sonucu etkileyebilecek farklar"""
+
+    def __init__(self, old, new):
+        self.full = old is None or old.get('engine', ENGINE_VERSION) != ENGINE_VERSION
+        old = old or {}
+
+        # (ifade, kategori, durum, sıra) çiftlerinin simetrik farkı: bu ifadeleri
+        # içermeyen bir emailde eşleşen kuralların listesi iki sette de aynıdır
+        def phrase_rules(rules):
+            return {
+                (phrase.lower(), rule['category'], rule['status'], i)
+                for i, rule in enumerate(rules.get('categories', []))
+                for phrase in rule['phrases']
+            }
+        self.phrases = sorted({p[0] for p in phrase_rules(old) ^ phrase_rules(new)})
+        self.subject_filter = old.get('subject_filter') != new.get('subject_filter')
+        self.default_category = old.get('default_category') != new.get('default_category')
+
+        self.company_from = _first_difference(old.get('company_patterns', []), new.get('company_patterns', []))
+        self.default_company = old.get('default_company') != new.get('default_company')
+
+        self.position_from = _first_difference(old.get('position_patterns', []), new.get('position_patterns', []))
+        if old.get('similar_jobs_marker') != new.get('similar_jobs_marker'):
+            self.position_from = 0
+        self.default_position = old.get('default_position') != new.get('default_position')
+
+    def is_empty(self):
+        return not (
+            self.full or self.phrases or self.subject_filter or self.default_category
+            or self.company_from is not None or self.default_company
+            or self.position_from is not None or self.default_position
+        )
+
+
+class _PositionRule:
+    __slots__ = ('source', 'pattern', 'min_length', 'max_length', 'exclude', 'exclude_company', 'truncate')
+
+    def __init__(self, spec):
+        self.source = spec['source']
+        self.pattern = re.compile(spec['pattern'], re.IGNORECASE)
+        self.min_length = spec.get('min_length', 0)
+        self.max_length = spec.get('max_length')
+        self.exclude = [word.lower() for word in spec.get('exclude', [])]
+        self.exclude_company = spec.get('exclude_company', False)
+        self.truncate = spec.get('truncate')
+
+
+class RuleSet:
+    """Derlenmiş kural seti"""
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.version = rules_version(rules)
+        self.subject_filter = [phrase.lower() for phrase in rules.get('subject_filter', [])]
+        self.categories = [
+            (rule['category'], rule['status'], [phrase.lower() for phrase in rule['phrases']])
+            for rule in rules['categories']
+        ]
+        self.default_category = rules['default_category']
+        self.company_patterns = [re.compile(p, re.IGNORECASE) for p in rules['company_patterns']]
+        self.default_company = rules['default_company']
+        self.similar_jobs_marker = re.compile(rules['similar_jobs_marker'], re.IGNORECASE)
+        self.position_rules = [_PositionRule(spec) for spec in rules['position_patterns']]
+        self.default_position = rules['default_position']
+
+    @classmethod
+    def load(cls, path=None):
+        return cls(load_rules(path))
+
+    def snapshot(self):
+        """Arşivde saklanacak biçim (motor sürümüyle birlikte)"""
+        return {'engine': ENGINE_VERSION, **self.rules}
+
+    def is_application(self, subject):
+        """Konu başvuru filtresinden geçiyor mu? (filtre yoksa her email geçer)"""
+        subject = subject.lower()
+        return not self.subject_filter or any(phrase in subject for phrase in self.subject_filter)
+
+    def classify(self, email, processed_at=''):
+        """Emaili sınıflandır: (Sheets sütunlarında satır, eşleşen kural konumları)
+
+        Başvuru filtresinden geçmeyen emaillerde satır None'dır.
+        """
+        full_text, subject, snippet, body_html = email_texts(email)
+        if not self.is_application(subject):
+            return None, {'category_rule': None, 'company_rule': None, 'position_rule': None}
+
+        email_dt = _email_datetime(email)
+        date = email_dt.strftime('%Y-%m-%d') if email_dt else 'Unknown'
+        time = email_dt.strftime('%H:%M') if email_dt else 'Unknown'
+
+        category_rule = None
+        category, status = self.default_category['category'], self.default_category['status']
+        for i, (rule_category, rule_status, phrases) in enumerate(self.categories):
+            if any(phrase in full_text for phrase in phrases):
+                category_rule, category, status = i, rule_category, rule_status
+                break
+
+        company_rule, company = None, self.default_company
+        for i, pattern in enumerate(self.company_patterns):
+            match = pattern.search(subject)
+            if match:
+                company_rule, company = i, match.group(1).strip()
+                break
+
+        # Pozisyon linki "Similar jobs" bölümünden önce aranır
+        sources = {
+            'html': self.similar_jobs_marker.split(body_html, maxsplit=1)[0] or body_html,
+            'subject': subject,
+            'snippet': snippet,
+        }
+        company_word = company.lower().split(' ')[0]
+        position_rule, position = None, self.default_position
+        for i, rule in enumerate(self.position_rules):
+            match = rule.pattern.search(sources[rule.source])
+            if not match or not match.group(1):
+                continue
+            value = match.group(1)
+            if len(value) < rule.min_length or (rule.max_length is not None and len(value) > rule.max_length):
+                continue
+            lowered = value.lower()
+            if any(word in lowered for word in rule.exclude):
+                continue
+            if rule.exclude_company and company_word in lowered:
+                continue
+            position_rule, position = i, value.strip()[:rule.truncate]
+            break
+
+        message_id = email.get('id') or ''
+        row = {
+            'Date': date,
+            'Time': time,
+            'Company': company,
+            'Position': position,
+            'Category': category,
+            'Status': status,
+            'Subject': subject,
+            'Gmail Link': GMAIL_LINK_PREFIX + message_id,
+            'Processed At': processed_at,
+        }
+        features = {'category_rule': category_rule, 'company_rule': company_rule, 'position_rule': position_rule}
+        return row, features
@@ -0,0 +1,315 @@
+"""
+📅 Günlük Önek Toplamı İndeksi
+==============================
+Veri yüklenirken kaynak x durum x gün ve kaynak x (en sık) şirket x durum x gün
+için kümülatif sayım dizileri bir kez hesaplanır. Herhangi bir tarih aralığının
+toplamları ve oranları iki dizi okumasıyla, haftalık/aylık histogramlar dönem
+başına tek okumayla elde edilir; veri yeniden filtrelenmez.
+
+Yalnızca farklı şirket sayısı aralıktaki satırlara bakar: satırlar güne göre
+sıralı tutulduğundan aralık tek bir dilimdir.
+
+Tarihi olmayan satırlar (ör. Date sütunu olmayan bir kaynaktan gelenler)
+indekse alınmaz; pandas yolu gibi tarih aralığına ve dönem sayımlarına girmezler.
+Tarih sınırı olmayan bir filtre bu satırları da kapsadığından indeksle yanıtlanmaz.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from loader import SOURCE_COLUMN
+
+
+def _factorize(values):
+    """Eksik değerleri ayrı bir son koda alan factorize"""
+    codes, uniques = pd.factorize(values)
+    codes = np.where(codes < 0, len(uniques), codes)
+    return codes.astype(np.int64), list(uniques)
+
+
+def build_metrics(counts, unique_companies):
+    """Durum sayımlarından calculate_metrics ile aynı sözlüğü üret"""
+    total = int(sum(counts.values()))
+    applied = counts.get('Applied', 0)
+    rejected = counts.get('Rejected', 0)
+    under_review = counts.get('Under Review', 0)
+    interview = counts.get('Interview', 0)
+    return {
+        'total': total,
+        'applied': applied,
+        'rejected': rejected,
+        'under_review': under_review,
+        'interview': interview,
+        'rejection_rate': (rejected / total * 100) if total > 0 else 0,
+        'response_rate': ((rejected + interview + under_review) / total * 100) if total > 0 else 0,
+        'interview_rate': (interview / total * 100) if total > 0 else 0,
+        'unique_companies': unique_companies,
+    }
+
+
+class DailyPrefixIndex:
+    """Tarih aralığı sorgularını kümülatif günlük sayımlarla yanıtlayan indeks"""
+
+    def __init__(self, df, top_companies=30):
+        dates = df['Date']
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        days = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+        valid = ~np.isnat(days)
+        self.undated_rows = int(len(days) - valid.sum())
+        if self.undated_rows:
+            df, days = df[valid], days[valid]
+        if len(days):
+            self.first_day = days.min()
+            self.n_days = int((days.max() - self.first_day).astype(np.int64)) + 1
+        else:
+            self.first_day, self.n_days = np.datetime64('1970-01-01', 'D'), 0
+        day_idx = (days - self.first_day).astype(np.int64)
+
+        if SOURCE_COLUMN in df.columns:
+            src, self.sources = _factorize(df[SOURCE_COLUMN])
+        else:
+            src, self.sources = np.zeros(len(df), dtype=np.int64), ['']
+        n_src = len(self.sources) + 1
+
+        if 'Status' in df.columns:
+            status, self.statuses = _factorize(df['Status'])
+        else:
+            status, self.statuses = np.zeros(len(df), dtype=np.int64), []
+        n_status = len(self.statuses) + 1  # son kod: eksik durum
+
+        # Kaynak x durum x gün kümülatif sayımları (başta sıfır sütunu)
+        flat = (src * n_status + status) * self.n_days + day_idx
+        counts = np.bincount(flat, minlength=n_src * n_status * self.n_days)
+        self._status_cum = self._cumulative(counts.reshape(n_src, n_status, self.n_days))
+
+        self.companies = []
+        self._untracked_max = 0
+        self._company_cum = None
+        if 'Company' in df.columns:
+            company, uniques = _factorize(df['Company'])
+            totals = np.bincount(company, minlength=len(uniques) + 1)[:len(uniques)]
+            ranked = np.argsort(-totals, kind='stable')
+            tracked = ranked[:top_companies]
+            self.companies = [uniques[i] for i in tracked]
+            # İzlenmeyen bir şirketin herhangi bir aralıktaki sayısı bu değeri aşamaz
+            self._untracked_max = int(totals[ranked[top_companies]]) if len(ranked) > top_companies else 0
+
+            rank = np.full(len(uniques) + 1, -1, dtype=np.int64)
+            rank[tracked] = np.arange(len(tracked))
+            row_rank = rank[company]
+            keep = row_rank >= 0
+            n_comp = max(len(tracked), 1)
+            flat = ((src[keep] * n_comp + row_rank[keep]) * n_status + status[keep]) * self.n_days + day_idx[keep]
+            counts = np.bincount(flat, minlength=n_src * n_comp * n_status * self.n_days)
+            self._company_cum = self._cumulative(counts.reshape(n_src, n_comp, n_status, self.n_days))
+
+            # Farklı şirket sayısı için güne göre sıralı satır dilimleri
+            order = np.argsort(day_idx, kind='stable')
+            self._sorted_company = company[order]
+            self._sorted_src = src[order]
+            self._sorted_status = status[order]
+            self._day_offsets = np.searchsorted(day_idx[order], np.arange(self.n_days + 1))
+            self._n_company_codes = len(uniques) + 1
+
+    @staticmethod
+    def _cumulative(counts):
+        cum = np.zeros(counts.shape[:-1] + (counts.shape[-1] + 1,), dtype=np.int64)
+        np.cumsum(counts, axis=-1, out=cum[..., 1:])
+        return cum
+
+    def memory_footprint(self):
+        """Kümülatif dizilerin ve sıralı dilimlerin toplam boyutu"""
+        arrays = [self._status_cum, self._company_cum] + [
+            getattr(self, name, None)
+            for name in ('_sorted_company', '_sorted_src', '_sorted_status', '_day_offsets')
+        ]
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    @property
+    def last_day(self):
+        return (self.first_day + np.timedelta64(self.n_days - 1, 'D')).astype(date)
+
+    def covers(self, filters):
+        """Filtre bu indeksle yanıtlanabilir mi?
+
+        Şirket filtresi satır taraması gerektirir; tarih sınırı olmayan filtre
+        indekste olmayan tarihsiz satırları da kapsar.
+        """
+        filters = filters or {}
+        if filters.get('company'):
+            return False
+        return not self.undated_rows or bool(filters.get('start') or filters.get('end'))
+
+    def _bounds(self, start=None, end=None):
+        """Tarih aralığını [lo, hi) gün indekslerine çevir"""
+        lo = 0 if start is None else int((np.datetime64(start, 'D') - self.first_day).astype(np.int64))
+        hi = self.n_days if end is None else int((np.datetime64(end, 'D') - self.first_day).astype(np.int64)) + 1
+        lo, hi = min(max(lo, 0), self.n_days), min(max(hi, 0), self.n_days)
+        return lo, max(lo, hi)
+
+    def _selectors(self, filters):
+        """Seçili kaynak ve durum kodları"""
+        filters = filters or {}
+        sources = filters.get('sources')
+        if sources:
+            src_sel = [i for i, s in enumerate(self.sources) if s in set(sources)]
+        else:
+            src_sel = list(range(len(self.sources) + 1))
+        statuses = filters.get('statuses')
+        if statuses:
+            status_sel = [i for i, s in enumerate(self.statuses) if s in set(statuses)]
+        else:
+            status_sel = list(range(len(self.statuses) + 1))
+        return np.array(src_sel, dtype=np.int64), np.array(status_sel, dtype=np.int64)
+
+    def _status_totals(self, filters):
+        lo, hi = self._bounds(filters.get('start'), filters.get('end'))
+        src_sel, status_sel = self._selectors(filters)
+        cum = self._status_cum[np.ix_(src_sel, status_sel)]
+        return status_sel, (cum[..., hi] - cum[..., lo]).sum(axis=0)
+
+    def status_counts(self, filters=None):
+        """Durum sayımları (value_counts biçiminde)"""
+        filters = filters or {}
+        status_sel, totals = self._status_totals(filters)
+        counts = {
+            self.statuses[code]: int(n)
+            for code, n in zip(status_sel, totals)
+            if code < len(self.statuses) and n > 0
+        }
+        series = pd.Series(counts, name='count', dtype='int64').sort_values(ascending=False, kind='stable')
+        series.index.name = 'Status'
+        return series
+
+    def unique_companies(self, filters=None):
+        """Aralıktaki farklı şirket sayısı (güne göre sıralı dilim üzerinden)"""
+        filters = filters or {}
+        if self._company_cum is None:
+            return 0
+        lo, hi = self._bounds(filters.get('start'), filters.get('end'))
+        rows = slice(self._day_offsets[lo], self._day_offsets[hi])
+        src_sel, status_sel = self._selectors(filters)
+        companies = self._sorted_company[rows]
+        mask = np.isin(self._sorted_src[rows], src_sel) & np.isin(self._sorted_status[rows], status_sel)
+        present = np.bincount(companies[mask], minlength=self._n_company_codes)
+        return int(np.count_nonzero(present[:-1]))
+
+    def metrics(self, filters=None):
+        """calculate_metrics ile aynı sözlük"""
+        filters = filters or {}
+        status_sel, totals = self._status_totals(filters)
+        counts = {
+            self.statuses[code] if code < len(self.statuses) else None: int(n)
+            for code, n in zip(status_sel, totals)
+        }
+        return build_metrics(counts, self.unique_companies(filters))
+
+    def _total_cum_at(self, positions, filters):
+        """Seçili kaynak/durumlar için kümülatif toplamları verilen gün sınırlarında oku"""
+        src_sel, status_sel = self._selectors(filters)
+        cum = self._status_cum[np.ix_(src_sel, status_sel)]
+        return cum[..., positions].sum(axis=(0, 1))
+
+    def daily_counts(self, filters=None):
+        """Günlük başvuru sayıları (yalnızca kayıt olan günler)"""
+        filters = filters or {}
+        lo, hi = self._bounds(filters.get('start'), filters.get('end'))
+        cum = self._total_cum_at(np.arange(lo, hi + 1), filters)
+        counts = np.diff(cum)
+        days = self.first_day + np.arange(lo, hi)
+        nonzero = counts > 0
+        return pd.DataFrame({'Date': pd.to_datetime(days[nonzero]), 'count': counts[nonzero]})
+
+    def period_counts(self, period='weekly', filters=None):
+        """Haftalık/aylık sayımlar (create_period_histogram ile aynı etiketler)"""
+        filters = filters or {}
+        lo, hi = self._bounds(filters.get('start'), filters.get('end'))
+        if hi <= lo:
+            return pd.DataFrame({'Period': pd.Series(dtype='object'), 'count': pd.Series(dtype='int64')})
+
+        first = self.first_day + lo
+        last = self.first_day + (hi - 1)
+        if period == 'weekly':
+            # Pazartesi başlangıçlı haftalar (pandas 'W' dönemi)
+            offset = (first.astype(np.int64) + 3) % 7
+            starts = np.arange(first - offset, last + 1, np.timedelta64(7, 'D'))
+        else:
+            starts = np.arange(first.astype('datetime64[M]'), last.astype('datetime64[M]') + 1).astype('datetime64[D]')
+
+        # Dönem sınırları gün indekslerine çevrilir ve aralığa kırpılır
+        bounds = np.clip((starts - self.first_day).astype(np.int64), lo, hi)
+        bounds = np.append(bounds, hi)
+        cum = self._total_cum_at(bounds, filters)
+        counts = np.diff(cum)
+
+        if period == 'weekly':
+            labels = [f'{s}/{s + np.timedelta64(6, "D")}' for s in starts]
+        else:
+            labels = [str(s.astype('datetime64[M]')) for s in starts]
+        keep = counts > 0
+        return pd.DataFrame({
+            'Period': np.array(labels, dtype=object)[keep],
+            'count': counts[keep],
+        })
+
+    def status_by_company(self, filters=None, top_n=10):
+        """En çok başvurulan şirketlerin durum dağılımı; sonuç kesin değilse None"""
+        filters = filters or {}
+        if self._company_cum is None or not self.companies:
+            return None
+        lo, hi = self._bounds(filters.get('start'), filters.get('end'))
+        src_sel, status_sel = self._selectors(filters)
+        cum = self._company_cum[src_sel][:, :, status_sel]
+        table = (cum[..., hi] - cum[..., lo]).sum(axis=0)  # şirket x durum
+        totals = table.sum(axis=1)
+
+        ranked = np.argsort(-totals, kind='stable')[:top_n]
+        ranked = ranked[totals[ranked] > 0]
+        # İzlenmeyen bir şirket sıralamaya girebiliyorsa indeks kesin sonuç veremez
+        if self._untracked_max > 0 and (len(ranked) < top_n or totals[ranked[-1]] <= self._untracked_max):
+            return None
+        if len(ranked) == 0:
+            return pd.DataFrame()
+
+        status_names = [
+            self.statuses[code] for code in status_sel if code < len(self.statuses)
+        ]
+        columns = [i for i, code in enumerate(status_sel) if code < len(self.statuses)]
+        result = pd.DataFrame(
+            table[np.ix_(ranked, columns)],
+            index=pd.Index([self.companies[i] for i in ranked], name='Company'),
+            columns=pd.Index(status_names, name='Status'),
+        )
+        result = result.loc[:, result.sum(axis=0) > 0]
+        return result.sort_index().sort_index(axis=1)
+
+    def compare(self, current, previous, sources=None):
+        """İki tarih aralığının metrikleri: {'current': {...}, 'previous': {...}}"""
+        base = {'sources': sources} if sources else {}
+        return {
+            'current': self.metrics({**base, 'start': current[0], 'end': current[1]}),
+            'previous': self.metrics({**base, 'start': previous[0], 'end': previous[1]}),
+        }
+
+
+def comparison_ranges(anchor):
+    """Bu ay / geçen ay ve bu yıl / geçen yıl için eşit uzunlukta aralıklar"""
+    month_start = anchor.replace(day=1)
+    prev_month_end = month_start - timedelta(days=1)
+    prev_month_start = prev_month_end.replace(day=1)
+    prev_month_same_day = min(prev_month_start + (anchor - month_start), prev_month_end)
+
+    year_start = anchor.replace(month=1, day=1)
+    prev_year_start = year_start.replace(year=anchor.year - 1)
+    try:
+        prev_year_same_day = anchor.replace(year=anchor.year - 1)
+    except ValueError:  # 29 Şubat
+        prev_year_same_day = anchor.replace(year=anchor.year - 1, day=28)
+
+    return {
+        'month': ((month_start, anchor), (prev_month_start, prev_month_same_day)),
+        'year': ((year_start, anchor), (prev_year_start, prev_year_same_day)),
+    }
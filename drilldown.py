@@ -0,0 +1,140 @@
+"""
+🧭 Hiyerarşik Kırılım
+=====================
+Durum → şirket → pozisyon ağacı. Veri seti başına bir kez satırlar durum ve
+şirket koduna göre sıralanır; böylece her düğümün satırları sıralı düzende
+bitişik bir bölümdür. Bir düğümün çocukları ancak kullanıcı o düğümü
+açtığında, yalnızca o bölüm taranarak hesaplanır ve önbelleğe alınır.
+
+Her seviyede ilk N çocuk döndürülür, kalanlar tek bir "Diğer" düğümünde
+toplanır; tarayıcıya tüm hiyerarşi değil yalnızca açık düğüm gönderilir.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+LEVELS = ('Status', 'Company', 'Position')
+OTHER_LABEL = 'Diğer'
+MISSING_LABEL = '(boş)'
+
+
+def _top_level(labels, counts, top_n):
+    """Sayımlardan ilk N çocuk + 'Diğer' özeti"""
+    counts = np.asarray(counts)
+    nonzero = np.flatnonzero(counts)
+    if len(nonzero) > top_n:
+        top = nonzero[np.argpartition(counts[nonzero], -top_n)[-top_n:]]
+    else:
+        top = nonzero
+    # Eşit sayılarda etiket sırası kararlı olsun
+    top = top[np.lexsort((top, -counts[top]))]
+    shown = int(counts[top].sum())
+    total = int(counts.sum())
+    return {
+        'total': total,
+        'items': [(labels[i], int(counts[i])) for i in top],
+        'other': total - shown,
+        'other_items': len(nonzero) - len(top),
+    }
+
+
+def level_from_counts(counts, top_n):
+    """Hazır bir value_counts sonucundan (ör. durum dağılımı) kök seviyesi"""
+    counts = counts[counts > 0]
+    return _top_level(list(counts.index), counts.to_numpy(), top_n)
+
+
+class DrillDownIndex:
+    """Durum/şirket sıralı satır düzeni ve açılan düğümlerin önbelleği"""
+
+    def __init__(self, df, columns=LEVELS, max_levels=64):
+        self.columns = [c for c in columns if c in df.columns]
+        self.max_levels = max_levels
+        self._codes = []
+        self._labels = []
+        for column in self.columns:
+            codes, uniques = pd.factorize(df[column])
+            labels = pd.Index(list(uniques) + [MISSING_LABEL])
+            self._codes.append(np.where(codes < 0, len(uniques), codes).astype(np.int32))
+            self._labels.append(labels)
+
+        # İlk iki seviyeye göre sıralı düzen: her (durum) ve (durum, şirket)
+        # düğümünün satırları bu düzende bitişiktir
+        keys = self._codes[:2][::-1]
+        self.order = np.lexsort(keys) if keys else np.arange(len(df))
+        self._sorted = [codes[self.order] for codes in self._codes[:2]]
+        self._levels = OrderedDict()
+        self._lock = threading.Lock()
+
+    def memory_footprint(self):
+        """Kod dizileri, sıralı düzen ve önbellek (paylaşılan DataFrame hariç)"""
+        arrays = self._codes + self._sorted + [self.order]
+        return sum(a.nbytes for a in arrays) + sum(
+            labels.memory_usage(deep=True) for labels in self._labels
+        ) + 512 * len(self._levels)
+
+    def __getstate__(self):
+        # Diske taşınırken kilit ve düğüm önbelleği yazılmaz
+        state = dict(self.__dict__)
+        state['_levels'] = OrderedDict()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def depth(self):
+        return len(self.columns)
+
+    def _segment(self, path):
+        """Yolun satırlarının sıralı düzendeki [başlangıç, bitiş) aralığı; yol yoksa None"""
+        lo, hi = 0, len(self.order)
+        for depth, label in enumerate(path[:2]):
+            try:
+                code = self._labels[depth].get_loc(label)
+            except KeyError:
+                return None
+            keys = self._sorted[depth]
+            lo, hi = lo + np.searchsorted(keys[lo:hi], code, 'left'), lo + np.searchsorted(keys[lo:hi], code, 'right')
+        return lo, hi
+
+    def _children_counts(self, path, mask):
+        """Düğümün yalnızca kendi bölümünü tarayarak çocuk sayımları"""
+        depth = len(path)
+        size = len(self._labels[depth])
+        segment = self._segment(path)
+        if segment is None:
+            return np.zeros(size, dtype=np.int64)
+        lo, hi = segment
+        rows = self.order[lo:hi]
+        # İlk iki seviyenin kodları sıralı düzende hazırdır
+        codes = self._sorted[depth][lo:hi] if depth < len(self._sorted) else self._codes[depth][rows]
+        if mask is not None:
+            codes = codes[mask[rows]]
+        return np.bincount(codes, minlength=size)
+
+    def level(self, view_key, mask, path=(), top_n=15):
+        """`path` düğümünün çocukları (görünüm + yol başına önbellekli)"""
+        path = tuple(path)
+        if len(path) >= self.depth:
+            raise ValueError('en alt seviyenin çocuğu yok')
+        key = (view_key, path, top_n)
+        with self._lock:
+            cached = self._levels.get(key)
+            if cached is not None:
+                self._levels.move_to_end(key)
+                return cached
+
+        counts = self._children_counts(path, mask)
+        result = _top_level(self._labels[len(path)], counts, top_n)
+
+        with self._lock:
+            self._levels[key] = result
+            while len(self._levels) > self.max_levels:
+                self._levels.popitem(last=False)
+        return result
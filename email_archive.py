@@ -0,0 +1,373 @@
+"""
+🗃️ Sıkıştırılmış Email Arşivi
+=============================
+Gmail çekicinin indirdiği ham emailler (konu, snippet, gövdeler) zlib ile
+sıkıştırılarak yerel bir SQLite dosyasında saklanır. Her email için
+kelime özellikleri bir ters indekse yazılır ve son sınıflandırma sonucu
+hangi kural setiyle üretildiğiyle birlikte tutulur.
+
+Kurallar değiştiğinde yalnızca sonucu değişebilecek emailler yeniden
+sınıflandırılır: değişen anahtar kelimelerin adayları indeksten bulunur,
+şirket/pozisyon kurallarındaki değişiklikler kayıtlı eşleşme konumlarından
+belirlenir. Yeniden çalıştırma süreç havuzunda parça parça yapılır.
+
+Kullanım:
+    python email_archive.py reclassify --rules classification_rules.json
+    python email_archive.py stats
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from classifier import RuleChange, RuleSet, phrase_term_filters, term_matches, tokenize, email_texts
+from store import DEFAULT_DATA_DIR, LocalStore
+
+DEFAULT_ARCHIVE_PATH = DEFAULT_DATA_DIR / 'email_archive.sqlite'
+COMPRESSION_LEVEL = 6
+CHUNK_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    internal_date INTEGER,
+    archived_at TEXT NOT NULL,
+    raw BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS terms (
+    term_id INTEGER PRIMARY KEY,
+    term TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER NOT NULL,
+    message INTEGER NOT NULL,
+    PRIMARY KEY (term_id, message)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS classifications (
+    message INTEGER PRIMARY KEY,
+    rules_version TEXT NOT NULL,
+    category_rule INTEGER,
+    company_rule INTEGER,
+    position_rule INTEGER,
+    row TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rulesets (
+    version TEXT PRIMARY KEY,
+    rules TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def compress_message(message):
+    return zlib.compress(json.dumps(message, ensure_ascii=False).encode('utf-8'), COMPRESSION_LEVEL)
+
+
+def decompress_message(blob):
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+
+_RULESET_CACHE = {}
+
+
+def _classify_chunk(version, rules, items):
+    """İşçi süreçte bir parça emaili sınıflandır"""
+    ruleset = _RULESET_CACHE.get(version)
+    if ruleset is None:
+        ruleset = _RULESET_CACHE[version] = RuleSet(rules)
+    results = []
+    for rowid, blob in items:
+        # Arşivleme anı n8n'in işlem zamanı değildir; Processed At boş kalır ve
+        # bu satırlar gecikme hesabına katılmaz. Başvuru olmayan emaillerde satır 'null'dır.
+        row, features = ruleset.classify(decompress_message(blob))
+        results.append((rowid, features, json.dumps(row, ensure_ascii=False)))
+    return results
+
+
+class EmailArchive:
+    """SQLite + zlib email arşivi ve kelime indeksi"""
+
+    def __init__(self, path=None):
+        self.path = Path(path or DEFAULT_ARCHIVE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._con = sqlite3.connect(self.path, check_same_thread=False)
+        self._con.execute('PRAGMA journal_mode=WAL')
+        self._con.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    # ---- Arşivleme ------------------------------------------------------
+
+    def _term_ids(self, terms):
+        """Kelimelerin id'lerini döndür, yeni kelimeleri sözlüğe ekle"""
+        self._con.executemany('INSERT OR IGNORE INTO terms (term) VALUES (?)', [(t,) for t in terms])
+        ids = {}
+        terms = list(terms)
+        for start in range(0, len(terms), 500):
+            batch = terms[start:start + 500]
+            placeholders = ','.join('?' * len(batch))
+            ids.update(self._con.execute(
+                f'SELECT term, term_id FROM terms WHERE term IN ({placeholders})', batch
+            ).fetchall())
+        return ids
+
+    def add(self, messages):
+        """Emailleri sıkıştırıp arşive ve indekse ekle; yeni eklenen sayısını döndür"""
+        archived_at = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+        added = 0
+        with self._lock:
+            for message in messages:
+                cursor = self._con.execute(
+                    'INSERT OR IGNORE INTO messages (id, internal_date, archived_at, raw) VALUES (?, ?, ?, ?)',
+                    (message['id'], int(message.get('internalDate') or 0), archived_at, compress_message(message))
+                )
+                if not cursor.rowcount:
+                    continue
+                full_text = email_texts(message)[0]
+                term_ids = self._term_ids(tokenize(full_text))
+                self._con.executemany(
+                    'INSERT OR IGNORE INTO postings (term_id, message) VALUES (?, ?)',
+                    [(term_id, cursor.lastrowid) for term_id in term_ids.values()]
+                )
+                added += 1
+            self._con.commit()
+        return added
+
+    def get(self, message_id):
+        """Arşivdeki ham emaili döndür (yoksa None)"""
+        row = self._con.execute('SELECT raw FROM messages WHERE id = ?', (message_id,)).fetchone()
+        return decompress_message(row[0]) if row else None
+
+    # ---- Kural setleri --------------------------------------------------
+
+    def active_version(self):
+        """Son uygulanan kural setinin sürümü (hiç uygulanmadıysa None)"""
+        row = self._con.execute("SELECT value FROM meta WHERE key = 'active_rules'").fetchone()
+        return row[0] if row else None
+
+    def active_rules(self):
+        """Son uygulanan kural seti (hiç uygulanmadıysa None)"""
+        row = self._con.execute(
+            "SELECT r.rules FROM meta m JOIN rulesets r ON r.version = m.value WHERE m.key = 'active_rules'"
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _activate(self, ruleset):
+        self._con.execute(
+            'INSERT OR IGNORE INTO rulesets (version, rules, created_at) VALUES (?, ?, ?)',
+            (ruleset.version, json.dumps(ruleset.snapshot(), ensure_ascii=False),
+             time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()))
+        )
+        self._con.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('active_rules', ?)", (ruleset.version,))
+
+    # ---- Etkilenen emailler ---------------------------------------------
+
+    def phrase_candidates(self, phrases):
+        """İfadelerden en az birini içerebilecek emaillerin rowid kümesi"""
+        vocabulary = None
+        candidates = set()
+        for phrase in phrases:
+            filters = phrase_term_filters(phrase)
+            if not filters:
+                # Kelime içermeyen ifade indeksle daraltılamaz
+                return None
+            if vocabulary is None:
+                vocabulary = self._con.execute('SELECT term_id, term FROM terms').fetchall()
+            messages = None
+            for word, starts, ends in filters:
+                term_ids = [term_id for term_id, term in vocabulary if term_matches(term, word, starts, ends)]
+                found = set()
+                for start in range(0, len(term_ids), 500):
+                    batch = term_ids[start:start + 500]
+                    placeholders = ','.join('?' * len(batch))
+                    found.update(r[0] for r in self._con.execute(
+                        f'SELECT message FROM postings WHERE term_id IN ({placeholders})', batch
+                    ))
+                messages = found if messages is None else messages & found
+                if not messages:
+                    break
+            candidates |= messages
+        return candidates
+
+    def affected(self, change, version):
+        """Kural değişikliğinden etkilenebilecek emaillerin rowid kümesi
+
+        `version`, değişikliğin karşılaştırıldığı (önceki) kural setinin sürümüdür.
+        """
+        if change.full or change.subject_filter:
+            return {r[0] for r in self._con.execute('SELECT rowid FROM messages')}
+
+        # Hiç sınıflandırılmamış veya önceki sürümden farklı bir sürümle sınıflandırılmış emailler
+        affected = {r[0] for r in self._con.execute(
+            'SELECT m.rowid FROM messages m LEFT JOIN classifications c ON c.message = m.rowid '
+            'WHERE c.message IS NULL OR c.rules_version != ?', (version,)
+        )}
+
+        if change.phrases:
+            candidates = self.phrase_candidates(change.phrases)
+            if candidates is None:
+                return {r[0] for r in self._con.execute('SELECT rowid FROM messages')}
+            affected |= candidates
+
+        conditions = []
+        for column, start, default_changed in (
+            ('category_rule', None, change.default_category),
+            ('company_rule', change.company_from, change.default_company),
+            ('position_rule', change.position_from, change.default_position),
+        ):
+            # İlk eşleşen kural değişen konumdan önceyse sonuç değişmez
+            if start is not None:
+                conditions.append(f'{column} IS NULL OR {column} >= {int(start)}')
+            elif default_changed:
+                conditions.append(f'{column} IS NULL')
+        if conditions:
+            affected.update(r[0] for r in self._con.execute(
+                'SELECT message FROM classifications WHERE ' + ' OR '.join(f'({c})' for c in conditions)
+            ))
+        return affected
+
+    # ---- Yeniden sınıflandırma ------------------------------------------
+
+    def reclassify(self, ruleset, workers=None, progress=None):
+        """Yeni kural setini uygula; yalnızca etkilenen emailleri yeniden hesapla"""
+        started = time.perf_counter()
+        old_version = self.active_version()
+        change = RuleChange(self.active_rules(), ruleset.rules)
+        rowids = sorted(self.affected(change, old_version))
+
+        total = len(rowids)
+        if progress:
+            progress(0, total)
+        changed = 0
+        done = 0
+        for results in self._run(ruleset, rowids, workers):
+            changed += self._save(ruleset.version, results)
+            done += len(results)
+            if progress:
+                progress(done, total)
+
+        with self._lock:
+            # Etkilenmeyen emailler yeni sürümle aynı sonucu verir
+            self._con.execute('UPDATE classifications SET rules_version = ?', (ruleset.version,))
+            self._activate(ruleset)
+            self._con.commit()
+
+        return {
+            'version': ruleset.version,
+            'previous': old_version,
+            'full': change.full,
+            'messages': self.count(),
+            'reevaluated': total,
+            'changed': changed,
+            'seconds': round(time.perf_counter() - started, 3),
+        }
+
+    def _chunks(self, rowids):
+        for start in range(0, len(rowids), CHUNK_SIZE):
+            batch = rowids[start:start + CHUNK_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            yield self._con.execute(
+                f'SELECT rowid, raw FROM messages WHERE rowid IN ({placeholders})', batch
+            ).fetchall()
+
+    def _run(self, ruleset, rowids, workers):
+        """Parçaları sınıflandır; büyük işler süreç havuzunda paralel çalışır"""
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(rowids) <= CHUNK_SIZE:
+            for items in self._chunks(rowids):
+                yield _classify_chunk(ruleset.version, ruleset.rules, items)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_classify_chunk, ruleset.version, ruleset.rules, items) for items in self._chunks(rowids)]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _save(self, version, results):
+        """Sonuçları yaz ve önceki sonuçtan farklı olanların sayısını döndür"""
+        with self._lock:
+            previous = dict(self._con.execute(
+                f"SELECT message, row FROM classifications WHERE message IN ({','.join('?' * len(results))})",
+                [rowid for rowid, _, _ in results]
+            ).fetchall())
+            self._con.executemany(
+                'INSERT OR REPLACE INTO classifications '
+                '(message, rules_version, category_rule, company_rule, position_rule, row) VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (rowid, version, f['category_rule'], f['company_rule'], f['position_rule'], row)
+                    for rowid, f, row in results
+                ]
+            )
+            self._con.commit()
+        return sum(1 for rowid, _, row in results if previous.get(rowid) != row)
+
+    # ---- Okuma ----------------------------------------------------------
+
+    def count(self):
+        return self._con.execute('SELECT COUNT(*) FROM messages').fetchone()[0]
+
+    def rows(self):
+        """Sınıflandırılmış başvuru satırları (email zamanına göre sıralı, filtrelenenler hariç)"""
+        for (row,) in self._con.execute(
+            "SELECT c.row FROM classifications c JOIN messages m ON m.rowid = c.message "
+            "WHERE c.row != 'null' ORDER BY m.internal_date, m.rowid"
+        ):
+            yield json.loads(row)
+
+    def stats(self):
+        """Arşiv boyutu ve sıkıştırma oranı"""
+        messages, compressed = self._con.execute('SELECT COUNT(*), COALESCE(SUM(LENGTH(raw)), 0) FROM messages').fetchone()
+        return {
+            'messages': messages,
+            'classified': self._con.execute('SELECT COUNT(*) FROM classifications').fetchone()[0],
+            'terms': self._con.execute('SELECT COUNT(*) FROM terms').fetchone()[0],
+            'compressed_bytes': compressed,
+            'file_bytes': self.path.stat().st_size if self.path.exists() else 0,
+            'active_rules': self.active_version(),
+        }
+
+    def close(self):
+        self._con.close()
+
+
+def print_progress(done, total):
+    """İlerlemeyi stderr'de tek satırda göster"""
+    if not total:
+        return
+    percent = 100 * done // total
+    print(f'\r🔁 {done}/{total} email ({percent}%)', end='' if done < total else '\n', file=sys.stderr, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Email arşivi ve artımlı yeniden sınıflandırma')
+    parser.add_argument('command', choices=['reclassify', 'stats'])
+    parser.add_argument('--archive', default=str(DEFAULT_ARCHIVE_PATH))
+    parser.add_argument('--rules', default=None, help='Kural dosyası (varsayılan: classification_rules.json)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR), help='Sonuçların yazılacağı yerel depo')
+    parser.add_argument('--no-store', action='store_true', help='Sonuçları yerel depoya yazma')
+    args = parser.parse_args()
+
+    archive = EmailArchive(args.archive)
+    if args.command == 'stats':
+        print(json.dumps(archive.stats(), indent=2, ensure_ascii=False))
+        return
+
+    report = archive.reclassify(RuleSet.load(args.rules), workers=args.workers, progress=print_progress)
+    if not args.no_store and report['changed']:
+        report['store'] = LocalStore(args.data_dir).upsert(archive.rows())
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+📬 Artımlı Gmail Çekici
+=======================
+LinkedIn emaillerini Gmail API'den sayfa sayfa çeker ve bir senkronizasyon
+imleci (historyId) saklar. Sonraki çalıştırmalar yalnızca yeni mesajları
+indirir. Mesaj gövdeleri sınırlı paralellikle ve yeniden deneme/geri çekilme
+ile indirilir.
+
+Kullanım:
+    GMAIL_ACCESS_TOKEN=... python gmail_fetcher.py --after 2025/01/01
+
+Çıktı `data/gmail_messages.jsonl` dosyasına eklenir, imleç
+`data/gmail_cursor.json` dosyasında tutulur. Ham mesajlar ayrıca sıkıştırılmış
+email arşivine (`data/email_archive.sqlite`) yazılır; `--classify` verilirse
+yeni mesajlar aktif kural setiyle sınıflandırılıp yerel depoya eklenir.
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+from store import DEFAULT_DATA_DIR, LocalStore
+
+DEFAULT_API_BASE = 'https://gmail.googleapis.com'
+DEFAULT_QUERY = 'from:linkedin.com'
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class GmailAPIError(Exception):
+    """Gmail API'den kalıcı hata döndüğünde fırlatılır"""
+
+    def __init__(self, status, message):
+        super().__init__(f'{status}: {message}')
+        self.status = status
+
+
+def parse_retry_after(value):
+    """Retry-After başlığını saniyeye çevir (saniye veya HTTP tarihi; okunamazsa None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class GmailClient:
+    """Gmail REST API için küçük, yeniden denemeli istemci"""
+
+    def __init__(self, token, api_base=DEFAULT_API_BASE, user_id='me',
+                 max_retries=5, backoff_base=0.5, backoff_max=30.0, timeout=30):
+        self.token = token
+        self.api_base = api_base.rstrip('/')
+        self.user_id = user_id
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+    def _url(self, path, params=None):
+        url = f'{self.api_base}/gmail/v1/users/{quote(self.user_id)}/{path}'
+        if params:
+            url += '?' + urlencode({k: v for k, v in params.items() if v is not None}, doseq=True)
+        return url
+
+    def _sleep_before_retry(self, attempt, retry_after=None):
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            # Üstel geri çekilme + jitter
+            delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+            delay = random.uniform(delay / 2, delay)
+        time.sleep(delay)
+
+    def get(self, path, params=None):
+        """GET isteği gönder; 429/5xx ve ağ hatalarında yeniden dene"""
+        url = self._url(path, params)
+        for attempt in range(self.max_retries + 1):
+            request = Request(url, headers={
+                'Authorization': f'Bearer {self.token}',
+                'Accept': 'application/json',
+            })
+            try:
+                with urlopen(request, timeout=self.timeout) as response:
+                    return json.load(response)
+            except HTTPError as e:
+                if e.code not in RETRY_STATUSES or attempt == self.max_retries:
+                    raise GmailAPIError(e.code, e.read().decode('utf-8', 'replace')) from e
+                self._sleep_before_retry(attempt, parse_retry_after(e.headers.get('Retry-After')))
+            except URLError as e:
+                if attempt == self.max_retries:
+                    raise
+                self._sleep_before_retry(attempt)
+
+    def profile(self):
+        return self.get('profile')
+
+    def list_message_ids(self, query, page_size=500):
+        """Sorguya uyan tüm mesaj id'lerini sayfa sayfa döndür"""
+        page_token = None
+        while True:
+            page = self.get('messages', {'q': query, 'maxResults': page_size, 'pageToken': page_token})
+            for message in page.get('messages', []):
+                yield message['id']
+            page_token = page.get('nextPageToken')
+            if not page_token:
+                return
+
+    def list_added_since(self, start_history_id):
+        """historyId'den sonra eklenen mesaj id'lerini ve son historyId'yi döndür"""
+        ids, page_token, latest = [], None, start_history_id
+        while True:
+            page = self.get('history', {
+                'startHistoryId': start_history_id,
+                'historyTypes': 'messageAdded',
+                'pageToken': page_token,
+            })
+            for record in page.get('history', []):
+                for added in record.get('messagesAdded', []):
+                    ids.append(added['message']['id'])
+            latest = page.get('historyId', latest)
+            page_token = page.get('nextPageToken')
+            if not page_token:
+                return list(dict.fromkeys(ids)), latest
+
+    def get_message(self, message_id):
+        return self.get(f'messages/{quote(message_id)}', {'format': 'full'})
+
+
+def _decode_body(data):
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4)).decode('utf-8', 'replace')
+
+
+def _collect_parts(payload, texts):
+    """MIME ağacını gezip text/plain ve text/html gövdelerini topla"""
+    mime_type = payload.get('mimeType', '')
+    data = payload.get('body', {}).get('data')
+    if data and mime_type in texts:
+        texts[mime_type].append(_decode_body(data))
+    for part in payload.get('parts', []) or []:
+        _collect_parts(part, texts)
+
+
+def simplify_message(message):
+    """API mesajını n8n Gmail düğümünün çıktısına benzer düz bir sözlüğe çevir"""
+    payload = message.get('payload', {})
+    headers = {h['name'].lower(): h['value'] for h in payload.get('headers', [])}
+    texts = {'text/plain': [], 'text/html': []}
+    _collect_parts(payload, texts)
+    return {
+        'id': message['id'],
+        'threadId': message.get('threadId'),
+        'historyId': message.get('historyId'),
+        'internalDate': message.get('internalDate'),
+        'labelIds': message.get('labelIds', []),
+        'date': headers.get('date'),
+        'from': headers.get('from', ''),
+        'subject': headers.get('subject', ''),
+        'snippet': message.get('snippet', ''),
+        'textPlain': '\n'.join(texts['text/plain']),
+        'textHtml': '\n'.join(texts['text/html']),
+    }
+
+
+class SyncCursor:
+    """Son senkronizasyon durumunu JSON dosyasında tutar"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self, state):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+
+class GmailFetcher:
+    """Tam veya artımlı senkronizasyonu yöneten çekici"""
+
+    def __init__(self, client, cursor, query=DEFAULT_QUERY, sender_filter='linkedin.com',
+                 max_workers=8):
+        self.client = client
+        self.cursor = cursor
+        self.query = query
+        self.sender_filter = sender_filter
+        self.max_workers = max_workers
+        self.missing_ids = []
+
+    def _get_message(self, message_id):
+        """Mesajı indir; listelendikten sonra silinmişse (404) None"""
+        try:
+            return self.client.get_message(message_id)
+        except GmailAPIError as e:
+            if e.status != 404:
+                raise
+            return None
+
+    def _fetch_messages(self, message_ids):
+        """Mesajları sınırlı paralellikle indir (sıra korunur, en fazla 2 x işçi istek beklemede)"""
+        window = max(1, self.max_workers * 2)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for message_id in message_ids:
+                pending.append((message_id, pool.submit(self._get_message, message_id)))
+                if len(pending) < window:
+                    continue
+                yield from self._drain(pending, 1)
+            yield from self._drain(pending, len(pending))
+
+    def _drain(self, pending, count):
+        for _ in range(count):
+            message_id, future = pending.popleft()
+            message = future.result()
+            if message is None:
+                self.missing_ids.append(message_id)
+                continue
+            yield simplify_message(message)
+
+    def _pending_ids(self, state):
+        """İndirilecek mesaj id'lerini ve yeni historyId'yi belirle"""
+        history_id = state.get('historyId')
+        if history_id and state.get('query') == self.query:
+            try:
+                ids, latest = self.client.list_added_since(history_id)
+                return ids, latest, 'incremental'
+            except GmailAPIError as e:
+                # historyId çok eskiyse Gmail 404 döner; tam senkronizasyona dön
+                if e.status != 404:
+                    raise
+        # historyId'yi listelemeden önce al ki arada gelen mesajlar kaçmasın
+        latest = self.client.profile()['historyId']
+        return list(self.client.list_message_ids(self.query)), latest, 'full'
+
+    def sync(self, flush=None):
+        """Yeni mesajları döndüren üreteç; tamamlanınca imleci kaydeder
+
+        `flush` verilirse imleç kaydedilmeden hemen önce çağrılır; çağıranın
+        tamponda tuttuğu mesajlar böylece imleç ilerlemeden kalıcı hale gelir.
+        """
+        state = self.cursor.load()
+        ids, latest, mode = self._pending_ids(state)
+        seen = set(state.get('recent_ids', []))
+        ids = [i for i in ids if i not in seen]
+
+        for message in self._fetch_messages(ids):
+            # history API sorgu filtresi uygulamaz; göndereni burada kontrol et
+            if mode == 'incremental' and self.sender_filter not in message['from'].lower():
+                continue
+            yield message
+
+        if flush is not None:
+            flush()
+        self.cursor.save({
+            'historyId': latest,
+            'query': self.query,
+            'mode': mode,
+            'synced_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            # İndirilemeden silinen mesajlar imleci durdurmaz; yalnızca kayda geçer
+            'missing': len(self.missing_ids),
+            # Bir sonraki artımlı çalışmada tekrarları ayıklamak için son id'ler
+            'recent_ids': ids[-1000:],
+        })
+
+
+def load_message_ids(path):
+    """JSONL çıktısında daha önce yazılmış mesaj id'leri (yarım kalmış çalıştırmalardan tekrarları önlemek için)"""
+    ids = set()
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    ids.add(json.loads(line)['id'])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LinkedIn emaillerini Gmail API ile artımlı çek')
+    parser.add_argument('--token', default=os.environ.get('GMAIL_ACCESS_TOKEN'),
+                        help='OAuth2 erişim tokenı (varsayılan: GMAIL_ACCESS_TOKEN)')
+    parser.add_argument('--api-base', default=DEFAULT_API_BASE)
+    parser.add_argument('--after', default=None, help='Örn. 2025/01/01')
+    parser.add_argument('--before', default=None, help='Örn. 2026/01/01')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR))
+    parser.add_argument('--no-archive', action='store_true', help='Ham mesajları email arşivine yazma')
+    parser.add_argument('--classify', action='store_true',
+                        help='Yeni mesajları sınıflandırıp yerel depoya yaz')
+    parser.add_argument('--rules', default=None, help='Kural dosyası (varsayılan: classification_rules.json)')
+    args = parser.parse_args()
+
+    if not args.token:
+        parser.error('Gmail erişim tokenı gerekli (--token veya GMAIL_ACCESS_TOKEN)')
+
+    query = DEFAULT_QUERY
+    if args.after:
+        query += f' after:{args.after}'
+    if args.before:
+        query += f' before:{args.before}'
+
+    data_dir = Path(args.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    fetcher = GmailFetcher(
+        GmailClient(args.token, api_base=args.api_base),
+        SyncCursor(data_dir / 'gmail_cursor.json'),
+        query=query,
+        max_workers=args.workers,
+    )
+
+    archive = None
+    if not args.no_archive or args.classify:
+        from email_archive import EmailArchive
+        archive = EmailArchive(data_dir / 'email_archive.sqlite')
+
+    count = 0
+    batch = []
+    output_path = data_dir / 'gmail_messages.jsonl'
+    written = load_message_ids(output_path)
+    with open(output_path, 'a', encoding='utf-8') as out:
+        def flush_pending():
+            # İmleç ilerlemeden önce tamponlanan mesajlar diske ve arşive yazılır
+            out.flush()
+            os.fsync(out.fileno())
+            if archive is not None and batch:
+                archive.add(batch)
+                batch.clear()
+
+        for message in fetcher.sync(flush=flush_pending):
+            # Arşiv tekrarları kendisi ayıklar; JSONL'e her mesaj bir kez yazılır
+            if message['id'] not in written:
+                written.add(message['id'])
+                out.write(json.dumps(message, ensure_ascii=False) + '\n')
+                count += 1
+            if archive is not None:
+                batch.append(message)
+                if len(batch) >= 500:
+                    archive.add(batch)
+                    batch.clear()
+    print(f"📬 {count} yeni mesaj kaydedildi")
+    if fetcher.missing_ids:
+        print(f"⚠️ {len(fetcher.missing_ids)} mesaj indirilemeden silinmiş, atlandı")
+
+    if args.classify:
+        from classifier import RuleSet
+        from email_archive import print_progress
+        report = archive.reclassify(RuleSet.load(args.rules), workers=args.workers, progress=print_progress)
+        if report['changed']:
+            result = LocalStore(data_dir).upsert(archive.rows())
+            print(f"🏷️ {result['added']} satır eklendi, {result['updated']} satır güncellendi")
+
+
+if __name__ == "__main__":
+    main()
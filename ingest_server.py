@@ -0,0 +1,286 @@
+"""
+📡 n8n Canlı Veri Alıcısı
+=========================
+n8n workflow'unun çıkardığı başvuru kayıtlarını HTTP üzerinden alır,
+doğrular, tamponlayarak (write-behind) yerel depoya yazar.
+
+Kullanım:
+    python ingest_server.py --host 127.0.0.1 --port 8765
+
+Uç noktalar:
+    POST /ingest              -> Tek kayıt, kayıt listesi veya {"items": [...]}
+    GET  /version?since=N&wait=S -> Veri sürümü (since verilirse long-poll)
+    GET  /health              -> Sağlık kontrolü
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from store import COLUMNS, LocalStore
+
+VALID_STATUSES = {'Applied', 'Rejected', 'Under Review', 'Interview', 'unknown'}
+
+# n8n item alanları -> Sheets sütunları
+FIELD_MAP = {
+    'date': 'Date',
+    'time': 'Time',
+    'company': 'Company',
+    'position': 'Position',
+    'category': 'Category',
+    'status': 'Status',
+    'subject': 'Subject',
+    'gmailLink': 'Gmail Link',
+    'processedAt': 'Processed At',
+}
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_LONG_POLL_SECONDS = 60
+
+
+def validate_item(item):
+    """Tek bir n8n kaydını doğrula ve Sheets sütun adlarına çevir"""
+    if not isinstance(item, dict):
+        raise ValueError('kayıt bir JSON nesnesi olmalı')
+
+    # n8n HTTP Request düğümü {"json": {...}} sarmalıyla da gönderebilir
+    if 'json' in item and isinstance(item['json'], dict):
+        item = item['json']
+
+    row = {}
+    for key, value in item.items():
+        column = FIELD_MAP.get(key, key)
+        if column in COLUMNS:
+            row[column] = '' if value is None else str(value).strip()
+
+    if not row.get('Date'):
+        raise ValueError('Date alanı eksik')
+    if not row.get('Gmail Link') and not row.get('Subject'):
+        raise ValueError('Gmail Link veya Subject alanlarından biri gerekli')
+
+    status = row.get('Status') or 'unknown'
+    if status not in VALID_STATUSES:
+        raise ValueError(f'geçersiz Status: {status}')
+    row['Status'] = status
+
+    return row
+
+
+def parse_payload(payload):
+    """İstek gövdesini kayıt listesine çevir"""
+    if isinstance(payload, dict) and isinstance(payload.get('items'), list):
+        return payload['items']
+    if isinstance(payload, list):
+        return payload
+    return [payload]
+
+
+class WriteBehindBuffer:
+    """Kayıtları bellekte biriktirip toplu halde depoya yazan tampon"""
+
+    def __init__(self, store, batch_size=200, flush_interval=2.0):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._thread.start()
+
+    def put(self, rows):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('tampon kapatıldı')
+            self._pending.extend(rows)
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify()
+
+    def pending(self):
+        with self._cond:
+            return len(self._pending)
+
+    def _take(self):
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _write(self, batch):
+        """Toplu yazım; hata olursa kayıtlar sırası korunarak kuyruğun başına geri konur"""
+        try:
+            self.store.append(batch)
+            return True
+        except Exception:
+            logger.exception('%d kayıt depoya yazılamadı; yeniden denenecek', len(batch))
+            with self._cond:
+                self._pending[:0] = batch
+            return False
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._pending) >= self.batch_size,
+                    timeout=self.flush_interval
+                )
+                batch = self._take()
+                closed = self._closed
+            if batch and not self._write(batch):
+                if closed:
+                    logger.error('tampon kapatılırken %d kayıt yazılamadı', self.pending())
+                    return
+                # Hata sürüyorsa depoyu her turda zorlamamak için bir aralık beklenir
+                with self._cond:
+                    self._cond.wait_for(lambda: self._closed, timeout=self.flush_interval)
+                continue
+            if closed:
+                return
+
+    def flush(self):
+        """Bekleyen kayıtları hemen yaz (yazılamazsa False)"""
+        with self._cond:
+            batch = self._take()
+        return self._write(batch) if batch else True
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+
+class IngestHandler(BaseHTTPRequestHandler):
+    """n8n isteklerini karşılayan HTTP handler"""
+
+    server_version = 'JobTrackerIngest/1.0'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _authorized(self):
+        token = self.server.token
+        return not token or self.headers.get('X-Ingest-Token') == token
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == '/health':
+            self._send_json(200, {'status': 'ok', 'pending': self.server.buffer.pending()})
+        elif url.path == '/version':
+            store = self.server.store
+            if 'since' in query:
+                try:
+                    since = int(query['since'][0])
+                    wait = float(query.get('wait', ['30'])[0])
+                except ValueError:
+                    self._send_json(400, {'error': 'since/wait sayı olmalı'})
+                    return
+                if not math.isfinite(wait) or wait < 0:
+                    self._send_json(400, {'error': 'wait sonlu ve negatif olmayan bir sayı olmalı'})
+                    return
+                wait = min(wait, MAX_LONG_POLL_SECONDS)
+                version = store.wait_for_change(since, wait)
+            else:
+                version = store.version()
+            self._send_json(200, {'version': version})
+        else:
+            self._send_json(404, {'error': 'bulunamadı'})
+
+    def do_POST(self):
+        if urlparse(self.path).path != '/ingest':
+            self._send_json(404, {'error': 'bulunamadı'})
+            return
+        if not self._authorized():
+            self._send_json(401, {'error': 'geçersiz token'})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length <= 0 or length > MAX_BODY_BYTES:
+            self._send_json(413 if length > MAX_BODY_BYTES else 400, {'error': 'geçersiz gövde boyutu'})
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            self._send_json(400, {'error': f'geçersiz JSON: {e}'})
+            return
+
+        accepted, rejected = [], []
+        for idx, item in enumerate(parse_payload(payload)):
+            try:
+                accepted.append(validate_item(item))
+            except ValueError as e:
+                rejected.append({'index': idx, 'error': str(e)})
+
+        if accepted:
+            self.server.buffer.put(accepted)
+
+        self._send_json(202, {'accepted': len(accepted), 'rejected': rejected})
+
+
+def make_server(host='127.0.0.1', port=8765, store=None, batch_size=200,
+                flush_interval=2.0, token=None, quiet=False):
+    """Alıcı sunucusunu oluştur (port=0 verilirse boş bir port seçilir)"""
+    server = ThreadingHTTPServer((host, port), IngestHandler)
+    server.daemon_threads = True
+    server.store = store or LocalStore()
+    server.buffer = WriteBehindBuffer(server.store, batch_size=batch_size, flush_interval=flush_interval)
+    server.token = token
+    server.quiet = quiet
+    return server
+
+
+def shutdown_server(server):
+    """Sunucuyu durdur ve tampondaki kayıtları diske yaz"""
+    server.shutdown()
+    server.server_close()
+    server.buffer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='n8n canlı veri alıcısı')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--data-dir', default=None, help='Veri klasörü (varsayılan: ./data)')
+    parser.add_argument('--batch-size', type=int, default=200)
+    parser.add_argument('--flush-interval', type=float, default=2.0, help='Saniye cinsinden yazma aralığı')
+    args = parser.parse_args()
+
+    server = make_server(
+        args.host, args.port,
+        store=LocalStore(args.data_dir),
+        batch_size=args.batch_size,
+        flush_interval=args.flush_interval,
+        token=os.environ.get('JOB_TRACKER_INGEST_TOKEN'),
+    )
+    print(f"📡 Alıcı dinliyor: http://{args.host}:{server.server_port}/ingest")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutdown_server(server)
+
+
+if __name__ == "__main__":
+    main()
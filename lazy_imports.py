@@ -0,0 +1,55 @@
+"""
+⚡ Gecikmeli Modül Yükleme
+==========================
+Ağır modülleri (pandas, numpy, plotly, openpyxl ve bunlara bağlı yardımcı
+modüller) ilk kullanıldıkları ana kadar içe aktarmaz. Karşılama ekranı bu
+modüller yüklenmeden çizilir; isteğe bağlı ısınma (warm-up) bunları arka
+planda önceden yükleyebilir.
+"""
+
+import importlib
+import sys
+import threading
+
+
+class LazyModule:
+    """İlk öznitelik erişiminde gerçek modülü içe aktaran vekil nesne"""
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            module = importlib.import_module(self.__dict__['_name'])
+            self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = 'yüklendi' if self.__dict__['_module'] is not None else 'bekliyor'
+        return f"<LazyModule {self.__dict__['_name']} ({state})>"
+
+
+def is_loaded(name):
+    """Modül bu süreçte içe aktarıldı mı?"""
+    return name in sys.modules
+
+
+def preload(names):
+    """Modülleri sırayla içe aktar (ısınma iş parçacığından çağrılır)"""
+    for name in names:
+        importlib.import_module(name)
+
+
+def start_background(target, name='warmup'):
+    """Verilen fonksiyonu düşük öncelikli bir daemon iş parçacığında çalıştır"""
+    thread = threading.Thread(target=target, name=name, daemon=True)
+    thread.start()
+    return thread
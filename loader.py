@@ -0,0 +1,264 @@
+"""
+📂 Veri Okuma Yardımcıları
+==========================
+Streamlit'ten bağımsız CSV okuma fonksiyonları. Dashboard, klasör izleyici
+ve diğer araçlar aynı ayrıştırma mantığını paylaşır.
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from store import COLUMNS
+
+SOURCE_COLUMN = 'Source'
+WEEKDAY_COLUMN = 'Weekday'
+HOUR_COLUMN = 'Hour'
+EVENT_TIME_COLUMN = 'Event Time'
+LAG_COLUMN = 'Lag Minutes'
+REPORT_ATTR = 'timestamp_report'
+
+# Ayrıştırma çıktısı (sütunlar/tipler) değiştiğinde artırılır; kalıcı anlık görüntüler yenilenir
+SCHEMA_VERSION = 2
+
+# n8n saatleri UTC olarak üretir (toISOString); görüntüleme saat dilimi ayarlanabilir
+SOURCE_TIMEZONE = 'UTC'
+DEFAULT_TIMEZONE = os.environ.get('JOB_TRACKER_TIMEZONE', 'UTC')
+DEDUPE_COLUMNS = ['Gmail Link', 'Subject', 'Date']
+
+# n8n kodu tarih/saat bulunamayınca 'Unknown' yazar
+UNKNOWN_VALUES = ('Unknown', 'unknown', '')
+DATE_FORMAT = '%Y-%m-%d'
+TIME_FORMAT = '%H:%M'
+
+# "gmail_link", "GmailLink", "gmail link" gibi varyasyonları kanonik adlara eşle
+_CANONICAL = {re.sub(r'[^a-z]', '', c.lower()): c for c in COLUMNS + [SOURCE_COLUMN]}
+
+
+def normalize_columns(df):
+    """Sütun adlarını Google Sheets'teki kanonik adlara hizala"""
+    renames = {}
+    for column in df.columns:
+        key = re.sub(r'[^a-z]', '', str(column).lower())
+        canonical = _CANONICAL.get(key)
+        if canonical and canonical != column and canonical not in df.columns:
+            renames[column] = canonical
+    return df.rename(columns=renames) if renames else df
+
+
+def _parse_texts(texts, fmt):
+    """Metinleri UTC zamanına çevir: önce açık biçim, uymayanlar için esnek ayrıştırma.
+
+    Dönen değerler: zaman dizisi, 'Unknown'/boş maskesi, geçersiz maskesi.
+    """
+    times = pd.to_datetime(texts, format=fmt, errors='coerce', utc=True).to_numpy(dtype='datetime64[ns]')
+    unknown = np.zeros(len(texts), dtype=bool)
+    failed = np.flatnonzero(np.isnat(times))
+    if len(failed):
+        rest = texts.iloc[failed].astype('string').str.strip()
+        is_unknown = (rest.isna() | rest.isin(UNKNOWN_VALUES)).to_numpy(dtype=bool)
+        unknown[failed[is_unknown]] = True
+        retry = failed[~is_unknown]
+        if len(retry):
+            times[retry] = pd.to_datetime(
+                rest[~is_unknown], format='mixed', errors='coerce', utc=True
+            ).to_numpy(dtype='datetime64[ns]')
+    invalid = np.isnat(times) & ~unknown
+    return times, unknown, invalid
+
+
+def _parse_iso_utc(values):
+    """ISO 8601 zaman damgalarını Arrow'un hızlı ayrıştırıcısıyla çevir.
+
+    Tek bir değer bile uymazsa tüm sütun _parse_texts ile satır satır ayrıştırılır.
+    """
+    try:
+        parsed = pa.array(values, type=pa.string(), from_pandas=True).cast(pa.timestamp('ns', tz='UTC'))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return _parse_texts(values, 'ISO8601')
+    times = parsed.to_numpy(zero_copy_only=False).astype('datetime64[ns]')
+    unknown = parsed.is_null().to_numpy(zero_copy_only=False)
+    return times, unknown, np.zeros(len(times), dtype=bool)
+
+
+def _parse_unique(values, fmt):
+    """_parse_texts'i benzersiz değerler üzerinden çalıştır (tarihler çok tekrar eder)"""
+    codes, uniques = pd.factorize(values.astype('string'))
+    times, unknown, invalid = _parse_texts(pd.Series(uniques, dtype='string'), fmt)
+    # -1 kodu (eksik değer) için sona NaT / bilinmiyor eklenir
+    times = np.append(times, np.datetime64('NaT', 'ns'))
+    unknown = np.append(unknown, True)
+    invalid = np.append(invalid, False)
+    return times[codes], unknown[codes], invalid[codes]
+
+
+def _time_to_minutes(values):
+    """'HH:MM' metinlerini gün içi dakikaya çevir (benzersiz değerler üzerinden)"""
+    codes, uniques = pd.factorize(values.astype('string'))
+    parsed = pd.to_datetime(pd.Series(uniques, dtype='string'), format=TIME_FORMAT, errors='coerce')
+    unique_minutes = (parsed.dt.hour * 60 + parsed.dt.minute).to_numpy(dtype='float64', na_value=np.nan)
+    unique_minutes = np.append(unique_minutes, np.nan)  # -1 kodu (eksik değer) için
+    return unique_minutes[codes]
+
+
+def event_times(df):
+    """Date + Time'ı tek bir UTC olay zamanında birleştir (saat yoksa NaT)"""
+    dates = df['Date'].dt.normalize()
+    if dates.dt.tz is None:
+        dates = dates.dt.tz_localize(SOURCE_TIMEZONE)
+    if 'Time' not in df.columns or not len(df):
+        return pd.Series(pd.NaT, index=df.index, dtype=dates.dtype)
+    minutes = _time_to_minutes(df['Time'])
+    base = dates.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+    offsets = np.where(np.isnan(minutes), 0, minutes).astype(np.int64) * np.timedelta64(60, 's')
+    events = np.where(np.isnan(minutes), np.datetime64('NaT'), base + offsets)
+    return pd.Series(events, index=df.index).dt.tz_localize('UTC').dt.tz_convert(dates.dt.tz)
+
+
+def add_weekday_hour(df, tz=None):
+    """Olay zamanından int8 haftanın günü (0=Pzt) ve saat sütunlarını türet.
+
+    Saat bilgisi olmayan satırlarda Hour -1 olur ve gün, tarihin kendisinden alınır.
+    """
+    if 'Date' not in df.columns:
+        return df
+    tz = tz or DEFAULT_TIMEZONE
+
+    events = df[EVENT_TIME_COLUMN] if EVENT_TIME_COLUMN in df.columns else event_times(df)
+    weekday = df['Date'].dt.weekday.to_numpy(dtype=np.int8)
+    hour = np.full(len(df), -1, dtype=np.int8)
+
+    has_time = events.notna().to_numpy()
+    if has_time.any():
+        local = events[has_time].dt.tz_convert(tz)
+        weekday[has_time] = local.dt.weekday.to_numpy(dtype=np.int8)
+        hour[has_time] = local.dt.hour.to_numpy(dtype=np.int8)
+
+    df[WEEKDAY_COLUMN] = weekday
+    df[HOUR_COLUMN] = hour
+    return df
+
+
+def apply_timestamp_stage(df, tz=None):
+    """Tarihleri ayrıştır, olay zamanı ve işlem gecikmesini ekle, atılan satırları raporla"""
+    rows_read = len(df)
+    dates, unknown, invalid = _parse_unique(df['Date'], DATE_FORMAT)
+    keep = ~np.isnat(dates)
+    df = df[keep].copy() if not keep.all() else df
+    df['Date'] = dates[keep]
+
+    events = event_times(df)
+    df[EVENT_TIME_COLUMN] = events
+    df = add_weekday_hour(df, tz)
+
+    report = {
+        'rows_read': rows_read,
+        'unknown_date': int(unknown.sum()),
+        'invalid_date': int(invalid.sum()),
+        'missing_time': int(events.isna().sum()),
+        'invalid_processed': 0,
+        'negative_lag': 0,
+    }
+
+    # Gecikme: n8n'in kaydı işlediği an ile e-postanın geldiği an arasındaki dakika
+    if 'Processed At' in df.columns:
+        # Processed At neredeyse her satırda farklıdır; benzersiz değer önbelleği kazandırmaz
+        processed, _, processed_invalid = _parse_iso_utc(df['Processed At'].reset_index(drop=True))
+        lag = (processed - events.to_numpy(dtype='datetime64[ns]')) / np.timedelta64(1, 'm')
+        negative = lag < 0
+        lag[negative] = np.nan
+        df[LAG_COLUMN] = lag.astype(np.float32)
+        report['invalid_processed'] = int(processed_invalid.sum())
+        report['negative_lag'] = int(negative.sum())
+
+    df.attrs[REPORT_ATTR] = report
+    return df
+
+
+def merge_reports(frames):
+    """Birden fazla veri setinin zaman damgası raporlarını topla"""
+    total = {}
+    for frame in frames:
+        for key, value in frame.attrs.get(REPORT_ATTR, {}).items():
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def read_applications_csv(source):
+    """CSV dosyasını oku, zaman damgalarını işle ve tarihe göre sırala"""
+    df = normalize_columns(pd.read_csv(source))
+
+    if 'Date' in df.columns:
+        df = apply_timestamp_stage(df)
+        df = df.sort_values('Date', ascending=False, kind='stable')
+
+    return df
+
+
+def source_name(source):
+    """Dosya yolu veya yüklenen dosya için kısa kaynak adı"""
+    name = getattr(source, 'name', None) or str(source)
+    return os.path.splitext(os.path.basename(name))[0]
+
+
+def read_source_csv(source):
+    """CSV'yi oku ve satırlara kaynak adını ekle"""
+    df = read_applications_csv(source)
+    if SOURCE_COLUMN not in df.columns:
+        df[SOURCE_COLUMN] = source_name(source)
+    return df
+
+
+def merge_frames(frames):
+    """Farklı sütun setlerine sahip verileri hizala, birleştir ve tekrarları ayıkla"""
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return None
+
+    # Kanonik sütunlar önce, ek sütunlar ilk göründükleri sırayla
+    columns = [c for c in COLUMNS if any(c in f.columns for f in frames)]
+    for f in frames:
+        columns += [c for c in f.columns if c not in columns]
+
+    report = merge_reports(frames)
+    # Tamamen boş sütunlar concat'e verilmez (dtype belirlemesine katılmaları
+    # pandas'ta kullanımdan kalkıyor); eksik sütunlar son reindex ile eklenir
+    df = pd.concat([f.dropna(axis=1, how='all') for f in frames], ignore_index=True)
+    df = df.reindex(columns=columns)
+
+    # Tarih sütunu olmayan kaynakların satırlarında gün/saat boş kalır;
+    # sütunlar float'a dönmesin diye nullable Int8 olarak tutulur
+    for column in (WEEKDAY_COLUMN, HOUR_COLUMN):
+        if column in df.columns and df[column].dtype != np.int8:
+            df[column] = df[column].astype('Int8')
+
+    # Gmail Link / Subject / Date üzerinden satır hash'i ile tekrarları ayıkla
+    key_cols = [c for c in DEDUPE_COLUMNS if c in df.columns]
+    if key_cols:
+        row_hash = pd.util.hash_pandas_object(df[key_cols], index=False)
+        df = df[~row_hash.duplicated().to_numpy()]
+
+    if 'Date' in df.columns:
+        df = df.sort_values('Date', ascending=False, kind='stable')
+
+    df = df.reset_index(drop=True)
+    if 'Date' in df.columns:
+        report['missing_date'] = int(df['Date'].isna().sum())
+    df.attrs[REPORT_ATTR] = report
+    return df
+
+
+def read_many(sources, max_workers=None):
+    """Birden fazla CSV'yi paralel oku ve tek veri setinde birleştir"""
+    sources = list(sources)
+    if len(sources) == 1:
+        return merge_frames([read_source_csv(sources[0])])
+
+    max_workers = max_workers or min(len(sources), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        frames = list(pool.map(read_source_csv, sources))
+    return merge_frames(frames)
@@ -0,0 +1,392 @@
+"""
+🧮 Bellek Bütçesi
+=================
+Süreç genelinde bellek muhasebesi. Paylaşılan önbellekler (`SHARED`) ve
+oturum başına nesneler tek bir LRU listesinde tutulur. Toplam boyut bütçeyi
+aştığında en uzun süredir kullanılmayan girdiler diske yazılır (spill) ya da
+yeniden üretilebiliyorsa atılır (evict). Başka girdilerin referans verdiği
+girdiler (ör. tablo indeksinin tuttuğu veri seti) bağımlıları bellekteyken
+ne taşınır ne atılır. Diske yazma ve geri okuma kilit dışında yapılır.
+Streamlit'ten bağımsızdır.
+"""
+
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+
+SHARED = 'shared'
+DEFAULT_BUDGET_MB = int(os.environ.get('JOB_TRACKER_MEMORY_BUDGET_MB', '1024'))
+
+# Büyük koleksiyonlarda boyut, bu kadar öğeden örneklenerek tahmin edilir
+_SAMPLE_ITEMS = 200
+
+
+def estimate_nbytes(obj, _depth=0):
+    """Nesnenin yaklaşık bellek boyutu (bayt)"""
+    footprint = getattr(obj, 'memory_footprint', None)
+    if callable(footprint):
+        return int(footprint())
+    if hasattr(obj, 'memory_usage'):
+        usage = obj.memory_usage(deep=True)  # DataFrame, Series, Index
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    nbytes = getattr(obj, 'nbytes', None)  # numpy dizileri
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(obj, (bytes, bytearray, str)) or _depth > 4:
+        return sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        items = list(obj.items()) if len(obj) <= _SAMPLE_ITEMS else None
+        if items is None:
+            sample = [item for _, item in zip(range(_SAMPLE_ITEMS), obj.items())]
+            per_item = sum(estimate_nbytes(k, _depth + 1) + estimate_nbytes(v, _depth + 1) for k, v in sample)
+            return sys.getsizeof(obj) + per_item * len(obj) // len(sample)
+        return sys.getsizeof(obj) + sum(
+            estimate_nbytes(k, _depth + 1) + estimate_nbytes(v, _depth + 1) for k, v in items
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        sample = [item for _, item in zip(range(_SAMPLE_ITEMS), obj)]
+        if not sample:
+            return sys.getsizeof(obj)
+        per_item = sum(estimate_nbytes(item, _depth + 1) for item in sample)
+        return sys.getsizeof(obj) + per_item * len(obj) // len(sample)
+    if hasattr(obj, '__dict__'):
+        return sys.getsizeof(obj) + estimate_nbytes(vars(obj), _depth + 1)
+    if hasattr(obj, '__slots__'):
+        return sys.getsizeof(obj) + sum(
+            estimate_nbytes(getattr(obj, slot, None), _depth + 1) for slot in obj.__slots__
+        )
+    return sys.getsizeof(obj)
+
+
+def process_rss():
+    """Sürecin şu anki yerleşik bellek kullanımı (bayt, bilinmiyorsa None)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss: Linux'ta KB, macOS'ta bayt cinsinden tepe değer
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _Entry:
+    """Bütçedeki tek bir girdi"""
+
+    __slots__ = ('value', 'version', 'nbytes', 'spillable', 'path', 'last_access', 'parent', 'spilling')
+
+    def __init__(self, value, version, nbytes, spillable, parent=None):
+        self.value = value
+        self.version = version
+        self.nbytes = nbytes
+        self.spillable = spillable
+        self.path = None
+        self.last_access = time.time()
+        self.parent = parent
+        self.spilling = False
+
+
+class _BuildLock:
+    """Bir anahtarın üretim kilidi ve onu bekleyen iş parçacığı sayısı"""
+
+    __slots__ = ('lock', 'waiters')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.waiters = 0
+
+
+class MemoryBudget:
+    """Bayt bütçeli, LRU sıralı, diske taşabilen nesne deposu"""
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_MB * 1024 * 1024, spill_dir=None):
+        self.budget_bytes = budget_bytes
+        # Süreç kapanınca (veya bütçe çöp toplanınca) taşınan dosyalar klasörle birlikte silinir
+        self.spill_dir = tempfile.mkdtemp(prefix='job_tracker_spill_', dir=spill_dir)
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self.spill_dir, True)
+        self.resident_bytes = 0
+        self.spilled_bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'spills': 0, 'reloads': 0, 'evictions': 0}
+        self._entries = OrderedDict()  # (owner, name) -> _Entry, en eski başta
+        self._dependents = {}  # (owner, name) -> ona referans veren girdilerin anahtarları
+        self._pending_spill_bytes = 0
+        self._lock = threading.RLock()
+        self._build_locks = {}  # (owner, name) -> _BuildLock, yalnızca bekleyen varken
+
+    def put(self, owner, name, value, version=None, spillable=True, nbytes=None, depends_on=None):
+        """Nesneyi kaydet ve gerekirse bütçeyi uygula
+
+        `depends_on`, nesnenin referans verdiği girdinin (owner, name) anahtarıdır;
+        bu girdi, bağımlısı bellekteyken diske taşınmaz ve atılmaz.
+        """
+        key = (owner, name)
+        entry = _Entry(value, version, estimate_nbytes(value) if nbytes is None else nbytes, spillable, depends_on)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = entry
+            self.resident_bytes += entry.nbytes
+            if depends_on is not None:
+                self._dependents.setdefault(depends_on, set()).add(key)
+            victims = self._enforce(keep=key)
+        self._spill(victims)
+        return value
+
+    def get(self, owner, name, version=None):
+        """Nesneyi döndür (sürüm uyuşmuyorsa veya atılmışsa None)"""
+        return self._lookup((owner, name), version)
+
+    def _lookup(self, key, version, count_miss=True):
+        """get(); `count_miss` False ise ıskalama istatistiğe yazılmaz"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                if count_miss:
+                    self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            entry.last_access = time.time()
+            if entry.spilling:
+                # Yeniden kullanılan girdinin süren taşıması iptal edilir
+                entry.spilling = False
+                self._pending_spill_bytes -= entry.nbytes
+            path = entry.path
+            if path is None:
+                self.stats['hits'] += 1
+                return entry.value
+        value = self._reload(key, entry, path)
+        with self._lock:
+            if value is not None:
+                self.stats['hits'] += 1
+            elif count_miss:
+                self.stats['misses'] += 1
+        return value
+
+    def contains(self, owner, name, version=None):
+        """Girdi bu sürümle kayıtlı mı? (istatistiklere ve LRU sırasına dokunmaz)"""
+        with self._lock:
+            entry = self._entries.get((owner, name))
+            return entry is not None and entry.version == version
+
+    def get_or_create(self, owner, name, factory, version=None, spillable=True, nbytes=None, depends_on=None):
+        """Kayıtlı nesneyi döndür, yoksa üretip kaydet (aynı anahtar için tek üretim)
+
+        Soğuk erişim istatistiğe tek ıskalama olarak yazılır.
+        """
+        key = (owner, name)
+        value = self._lookup(key, version, count_miss=False)
+        if value is not None:
+            return value
+        with self._lock:
+            build_lock = self._build_locks.get(key)
+            if build_lock is None:
+                build_lock = self._build_locks[key] = _BuildLock()
+            build_lock.waiters += 1
+        try:
+            with build_lock.lock:
+                value = self.get(owner, name, version)
+                if value is None:
+                    value = factory()
+                    if value is not None:
+                        self.put(owner, name, value, version=version, spillable=spillable, nbytes=nbytes,
+                                 depends_on=depends_on)
+        finally:
+            # Kilit yalnızca bekleyen kalmadığında bırakılır (sözlük filtre
+            # kombinasyonlarıyla büyümesin, yeni gelen ikinci bir kilit almasın)
+            with self._lock:
+                build_lock.waiters -= 1
+                if not build_lock.waiters:
+                    del self._build_locks[key]
+        return value
+
+    def discard(self, owner, name):
+        """Girdiyi bellekten ve diskten sil"""
+        with self._lock:
+            self._drop((owner, name))
+
+    def release(self, owner):
+        """Bir oturuma ait tüm girdileri bırak"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == owner]:
+                self._drop(key)
+
+    def prune(self, is_active):
+        """Artık aktif olmayan oturumların girdilerini bırak"""
+        with self._lock:
+            owners = {owner for owner, _ in self._entries if owner != SHARED}
+        for owner in owners:
+            if not is_active(owner):
+                self.release(owner)
+
+    def usage(self):
+        """Girdi başına kullanım: [{owner, name, bytes, state, idle_seconds}, ...]"""
+        now = time.time()
+        with self._lock:
+            return [
+                {
+                    'owner': owner,
+                    'name': name,
+                    'bytes': entry.nbytes,
+                    'state': 'disk' if entry.path is not None else 'memory',
+                    'idle_seconds': round(now - entry.last_access, 1),
+                }
+                for (owner, name), entry in reversed(self._entries.items())
+            ]
+
+    def summary(self):
+        """Toplam, paylaşılan ve oturum başına bayt sayıları"""
+        with self._lock:
+            per_owner = {}
+            for (owner, _), entry in self._entries.items():
+                if entry.path is None:
+                    per_owner[owner] = per_owner.get(owner, 0) + entry.nbytes
+            return {
+                'budget_bytes': self.budget_bytes,
+                'resident_bytes': self.resident_bytes,
+                'spilled_bytes': self.spilled_bytes,
+                'shared_bytes': per_owner.pop(SHARED, 0),
+                'session_bytes': per_owner,
+                **self.stats,
+            }
+
+    def close(self):
+        """Tüm girdileri bırak ve taşınan dosyaları sil"""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+        self._cleanup()
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        # Eski nesneye referans veren bağımlılar yeni sürümü kilitlemez
+        for child in self._dependents.pop(key, ()):
+            child_entry = self._entries.get(child)
+            if child_entry is not None:
+                child_entry.parent = None
+        if entry.parent is not None:
+            siblings = self._dependents.get(entry.parent)
+            if siblings is not None:
+                siblings.discard(key)
+                if not siblings:
+                    del self._dependents[entry.parent]
+        if entry.spilling:
+            # Süren taşıma bitince dosyası silinir (_spill girdiyi artık bulamaz)
+            entry.spilling = False
+            self._pending_spill_bytes -= entry.nbytes
+        if entry.path is not None:
+            self.spilled_bytes -= entry.nbytes
+            self._remove_file(entry.path)
+        else:
+            self.resident_bytes -= entry.nbytes
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _spill(self, victims):
+        """Seçilen girdileri kilit dışında diske yaz, sonra kilit altında belleği bırak"""
+        for key, entry in victims:
+            path = os.path.join(self.spill_dir, f'{uuid.uuid4().hex}.pkl')
+            try:
+                with open(path, 'wb') as f:
+                    pickle.dump(entry.value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                failed = True
+                self._remove_file(path)
+            else:
+                failed = False
+            with self._lock:
+                current = self._entries.get(key) is entry and entry.spilling
+                if not current:
+                    # Bu arada okunan, silinen veya yenilenen girdi bellekte kalır
+                    if not failed:
+                        self._remove_file(path)
+                    continue
+                entry.spilling = False
+                self._pending_spill_bytes -= entry.nbytes
+                if failed:
+                    # Diske yazılamayan nesne atılır
+                    self._drop(key)
+                    self.stats['evictions'] += 1
+                    continue
+                entry.value = None
+                entry.path = path
+                self.resident_bytes -= entry.nbytes
+                self.spilled_bytes += entry.nbytes
+                self.stats['spills'] += 1
+
+    def _reload(self, key, entry, path):
+        """Taşınan girdiyi kilit dışında oku, sonra kilit altında belleğe geri koy
+
+        Dosya kaybolmuş veya bozuksa girdi atılır ve None döner (ıskalama gibi
+        davranılır; çağıran nesneyi yeniden üretir).
+        """
+        while True:
+            try:
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+                break
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+                # Girdi bu arada başka bir iş parçacığınca geri okunmuş, yeniden
+                # taşınmış ya da silinmiş olabilir
+                with self._lock:
+                    if self._entries.get(key) is not entry:
+                        return None
+                    if entry.path is None:
+                        return entry.value
+                    if entry.path == path:
+                        self._drop(key)
+                        self.stats['evictions'] += 1
+                        return None
+                    path = entry.path
+        with self._lock:
+            if self._entries.get(key) is not entry or entry.path != path:
+                # Girdi bu arada geri okundu veya silindi; okunan kopya yine de geçerlidir
+                return entry.value if entry.path is None and entry.value is not None else value
+            entry.value = value
+            entry.path = None
+            self.spilled_bytes -= entry.nbytes
+            self.resident_bytes += entry.nbytes
+            self.stats['reloads'] += 1
+            self._remove_file(path)
+            victims = self._enforce(keep=key)
+        self._spill(victims)
+        return value
+
+    def _enforce(self, keep=None):
+        """Bütçe aşıldıkça en eski girdileri at; diske taşınacakları işaretleyip döndür
+
+        Bağımlısı bellekte olan girdiler atlanır: referansları yaşadığı için
+        taşımak veya atmak belleği boşaltmaz, bir sonraki erişim ikinci kopya üretir.
+        """
+        victims = []
+        for key in list(self._entries):
+            if self.resident_bytes - self._pending_spill_bytes <= self.budget_bytes:
+                break
+            entry = self._entries[key]
+            if key == keep or entry.path is not None or entry.spilling or self._dependents.get(key):
+                continue
+            if entry.spillable:
+                entry.spilling = True
+                self._pending_spill_bytes += entry.nbytes
+                victims.append((key, entry))
+            else:
+                self._drop(key)
+                self.stats['evictions'] += 1
+        return victims
@@ -0,0 +1,349 @@
+"""
+📤 Salt Okunur Metrik API'si
+============================
+Dashboard'daki sayıları (genel metrikler, günlük sayımlar, en çok başvurulan
+şirketler, şirket bazlı durum dağılımı) JSON olarak sunar. Veri seti
+dashboard'un kullandığı paylaşılan Arrow anlık görüntüsünden okunur;
+yanıtlar veri sürümü + istek başına önbelleğe alınır.
+
+Her yanıt veri sürümüne bağlı bir ETag taşır. `If-None-Match` ile gelen
+istekler veri değişmediyse veri setine hiç dokunmadan 304 alır.
+
+Kullanım:
+    python metrics_api.py --port 8766
+
+Uç noktalar (hepsi GET/HEAD):
+    /metrics                     -> Genel metrikler
+    /daily                       -> Günlük başvuru sayıları
+    /top-companies?limit=15      -> En çok başvurulan şirketler
+    /status-by-company?limit=10  -> Şirket bazlı durum dağılımı
+    /version, /health
+
+Filtreler sol paneldekilerle aynıdır:
+    start=2025-01-01&end=2025-01-31&status=Rejected&status=Interview&company=...&source=...
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+import analytics
+import arrow_store
+import date_index
+import loader
+from store import LocalStore
+
+ARROW_ENABLED = os.environ.get('JOB_TRACKER_ARROW', '1') == '1'
+DEFAULT_LIMITS = {'/top-companies': 15, '/status-by-company': 10}
+MAX_LIMIT = 100
+
+
+def _values(query, name):
+    """Tekrarlanan veya virgülle ayrılmış parametre değerleri"""
+    return [v.strip() for raw in query.get(name, []) for v in raw.split(',') if v.strip()]
+
+
+def parse_filters(query):
+    """Sorgu parametrelerini dashboard filtre sözlüğüne çevir (hatalıysa ValueError)"""
+    filters = {}
+    for name in ('start', 'end'):
+        if query.get(name):
+            try:
+                filters[name] = date.fromisoformat(query[name][0])
+            except ValueError:
+                raise ValueError(f'{name} YYYY-AA-GG biçiminde olmalı') from None
+    statuses = _values(query, 'status')
+    if statuses:
+        filters['statuses'] = sorted(set(statuses))
+    sources = _values(query, 'source')
+    if sources:
+        filters['sources'] = sorted(set(sources))
+    if query.get('company'):
+        filters['company'] = query['company'][0]
+    return filters
+
+
+def parse_limit(query, path):
+    """limit parametresi (1..MAX_LIMIT)"""
+    if path not in DEFAULT_LIMITS:
+        return None
+    try:
+        limit = int(query.get('limit', [DEFAULT_LIMITS[path]])[0])
+    except ValueError:
+        raise ValueError('limit sayı olmalı') from None
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ValueError(f'limit 1 ile {MAX_LIMIT} arasında olmalı')
+    return limit
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} JSON\'a çevrilemez')
+
+
+def etag_matches(header, etag):
+    """If-None-Match başlığı ETag'i içeriyor mu? (zayıf karşılaştırma)"""
+    if not header:
+        return False
+    candidates = [c.strip() for c in header.split(',')]
+    return '*' in candidates or etag in (c[2:] if c.startswith('W/') else c for c in candidates)
+
+
+class MetricsService:
+    """Veri sürümü başına bir kez yüklenen veri seti ve yanıt önbelleği"""
+
+    def __init__(self, store=None, cache_size=256):
+        self.store = store or LocalStore()
+        self.data_dir = str(self.store.data_dir)
+        self.cache_size = cache_size
+        self.stats = {'hits': 0, 'misses': 0, 'not_modified': 0}
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._loaded_version = None
+        self._df = None
+        self._prefix_index = None
+
+    def version(self):
+        """Veri sürümü: depo sayacı + CSV imzası (veri setini yüklemeden, ucuz)"""
+        store_version = self.store.version()
+        if not self.store.exists():
+            return (store_version, None)
+        return (store_version, arrow_store.source_signature([str(self.store.csv_path)]))
+
+    def etag(self, version, path, params):
+        digest = hashlib.blake2b(
+            repr((version, loader.SCHEMA_VERSION, path, params)).encode('utf-8'), digest_size=10
+        ).hexdigest()
+        return f'"{digest}"'
+
+    def _load(self, version):
+        """Dashboard'un canlı veri anlık görüntüsünü eşle (yoksa oluştur)"""
+        with self._load_lock:
+            if self._loaded_version == version:
+                return self._df, self._prefix_index
+            csv_path = str(self.store.csv_path)
+            factory = lambda: loader.read_many([csv_path]) if os.path.exists(csv_path) else None
+            if version[1] is None:
+                df = None
+            elif ARROW_ENABLED:
+                # Dashboard'daki load_dataset ile aynı ad ve sürüm: aynı dosya paylaşılır
+                dataset_key = ('live', self.data_dir, version[0])
+                df = arrow_store.load_or_build(
+                    ('live', self.data_dir), (dataset_key, version[1], loader.SCHEMA_VERSION), factory
+                )
+            else:
+                df = factory()
+            self._df = df
+            self._prefix_index = (
+                date_index.DailyPrefixIndex(df)
+                if df is not None and 'Date' in df.columns and df['Date'].notna().any()
+                else None
+            )
+            self._loaded_version = version
+            return df, self._prefix_index
+
+    def compute(self, path, filters, limit, version):
+        """Uç noktanın yanıt verisi (dashboard ile aynı hesaplama yolları)"""
+        df, prefix_index = self._load(version)
+        if df is None:
+            return None
+        range_index = prefix_index if prefix_index and prefix_index.covers(filters) else None
+
+        if path == '/metrics':
+            if range_index:
+                return range_index.metrics(filters)
+            return analytics.calculate_metrics(analytics.apply_filters(df, filters))
+
+        if path == '/daily':
+            if range_index:
+                counts = range_index.daily_counts(filters)
+            elif 'Date' in df.columns:
+                counts = analytics.daily_counts(analytics.apply_filters(df, filters))
+            else:
+                return []
+            return [
+                {'date': day.strftime('%Y-%m-%d'), 'count': int(count)}
+                for day, count in zip(counts['Date'], counts['count'])
+            ]
+
+        if path == '/top-companies':
+            if 'Company' not in df.columns:
+                return []
+            counts = analytics.apply_filters(df, filters)['Company'].value_counts().head(limit)
+            return [{'company': company, 'count': int(count)} for company, count in counts.items()]
+
+        if path == '/status-by-company':
+            if 'Company' not in df.columns or 'Status' not in df.columns:
+                return {}
+            table = range_index.status_by_company(filters, top_n=limit) if range_index else None
+            if table is None:
+                table = analytics.status_by_company(analytics.apply_filters(df, filters), top_n=limit)
+            return {
+                company: {status: int(n) for status, n in row.items() if n}
+                for company, row in table.iterrows()
+            }
+
+        raise KeyError(path)
+
+    def respond(self, path, filters, limit, if_none_match=None):
+        """(durum, ETag, gövde) — değişmediyse 304 ve boş gövde"""
+        version = self.version()
+        params = (tuple(sorted((k, repr(v)) for k, v in filters.items())), limit)
+        etag = self.etag(version, path, params)
+        if etag_matches(if_none_match, etag):
+            with self._lock:
+                self.stats['not_modified'] += 1
+            return 304, etag, b''
+
+        key = (version, path, params)
+        with self._lock:
+            body = self._responses.get(key)
+            if body is not None:
+                self._responses.move_to_end(key)
+                self.stats['hits'] += 1
+                return 200, etag, body
+            self.stats['misses'] += 1
+
+        data = self.compute(path, filters, limit, version)
+        if data is None:
+            return 404, None, json.dumps({'error': 'henüz veri yok'}, ensure_ascii=False).encode('utf-8')
+        body = json.dumps(
+            {
+                'version': version[0],
+                'filters': filters,
+                'data': data,
+            },
+            ensure_ascii=False, default=_json_default
+        ).encode('utf-8')
+        with self._lock:
+            self._responses[key] = body
+            # Eski sürümlere ait yanıtlar önce düşer
+            while len(self._responses) > self.cache_size:
+                self._responses.popitem(last=False)
+        return 200, etag, body
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Salt okunur metrik isteklerini karşılayan HTTP handler"""
+
+    server_version = 'JobTrackerMetrics/1.0'
+    endpoints = ('/metrics', '/daily', '/top-companies', '/status-by-company')
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=b'', etag=None, head=False):
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            # İstemci her seferinde ETag ile doğrulasın; değişmediyse 304 ucuzdur
+            self.send_header('Cache-Control', 'no-cache')
+        if status != 304:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and not head:
+            self.wfile.write(body)
+
+    def _send_json(self, status, payload, head=False):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'), head=head)
+
+    def _authorized(self):
+        token = self.server.token
+        return not token or self.headers.get('X-API-Token') == token
+
+    def _handle(self, head=False):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == '/health':
+            self._send_json(200, {'status': 'ok', 'cache': self.server.service.stats}, head=head)
+            return
+        if not self._authorized():
+            self._send_json(401, {'error': 'geçersiz token'}, head=head)
+            return
+        if url.path == '/version':
+            self._send_json(200, {'version': self.server.service.store.version()}, head=head)
+            return
+        if url.path not in self.endpoints:
+            self._send_json(404, {'error': 'bulunamadı'}, head=head)
+            return
+
+        try:
+            filters = parse_filters(query)
+            limit = parse_limit(query, url.path)
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)}, head=head)
+            return
+
+        status, etag, body = self.server.service.respond(
+            url.path, filters, limit, if_none_match=self.headers.get('If-None-Match')
+        )
+        self._send(status, body, etag=etag, head=head)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle(head=True)
+
+    def _method_not_allowed(self):
+        self.send_response(405)
+        self.send_header('Allow', 'GET, HEAD')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = _method_not_allowed
+
+
+def make_server(host='127.0.0.1', port=8766, store=None, token=None, quiet=False):
+    """API sunucusunu oluştur (port=0 verilirse boş bir port seçilir)"""
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    server.service = MetricsService(store)
+    server.token = token
+    server.quiet = quiet
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Salt okunur JSON metrik API\'si')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--data-dir', default=None, help='Veri klasörü (varsayılan: ./data)')
+    args = parser.parse_args()
+
+    server = make_server(
+        args.host, args.port,
+        store=LocalStore(args.data_dir),
+        token=os.environ.get('JOB_TRACKER_API_TOKEN'),
+    )
+    print(f"📤 Metrik API'si dinliyor: http://{args.host}:{server.server_port}/metrics")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
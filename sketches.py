@@ -0,0 +1,221 @@
+"""
+📐 Birleştirilebilir Top-K Özetleri
+===================================
+Yüksek kardinaliteli sütunlar (şirket, pozisyon) için Space-Saving
+özetleri. Her bölüm (gün + kaynak dosya) kendi özetini tutar; herhangi
+bir tarih aralığının top-N sıralaması satırlar yeniden taranmadan
+bölüm özetleri birleştirilerek elde edilir.
+
+Hata sınırı: her öğe için `count - error <= gerçek sayı <= count`.
+İzlenmeyen bir öğenin gerçek sayısı en fazla `threshold` olabilir.
+
+Tarihi olmayan satırlar ayrı bir bölümde (gün = None) tutulur ve yalnızca
+tarih sınırı yokken sayılır; durumu boş satırlar da ayrı bölümlerdedir ve
+durum filtresi onları dışarıda bıraktığında birleşime katılmaz. Böylece
+sonuç, aynı filtrelerle satırlar üzerinden hesaplanan sıralamayla aynı
+satır kümesine dayanır.
+"""
+
+import heapq
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from loader import SOURCE_COLUMN
+
+
+class SpaceSaving:
+    """Ağırlıklı, birleştirilebilir Space-Saving özeti"""
+
+    __slots__ = ('capacity', 'counts', 'errors', 'threshold', 'total')
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        # İzlenmeyen herhangi bir öğenin sayısı için üst sınır
+        self.threshold = 0
+        self.total = 0
+
+    @classmethod
+    def from_counts(cls, counts, capacity=256):
+        """Kesin sayımlardan (ör. bir bölümün value_counts'u) özet oluştur"""
+        sketch = cls(capacity)
+        items = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
+        for item, count in items[:capacity]:
+            sketch.counts[item] = int(count)
+            sketch.errors[item] = 0
+        if len(items) > capacity:
+            sketch.threshold = int(items[capacity][1])
+        sketch.total = int(sum(c for _, c in items))
+        return sketch
+
+    def update(self, item, count=1):
+        """Tek bir öğeyi (ağırlığıyla) ekle"""
+        self.total += count
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            return
+        # En küçük sayaçlı öğeyi çıkar, yeni öğe onun sayısını devralır
+        victim = min(self.counts, key=self.counts.__getitem__)
+        floor = self.counts.pop(victim)
+        self.errors.pop(victim)
+        self.threshold = max(self.threshold, floor)
+        self.counts[item] = floor + count
+        self.errors[item] = floor
+
+    def merge(self, other):
+        """İki özeti birleştirip yeni bir özet döndür (girdiler değişmez)"""
+        merged = SpaceSaving(max(self.capacity, other.capacity))
+        floor_a, floor_b = self.threshold, other.threshold
+        candidates = []
+        for item in self.counts.keys() | other.counts.keys():
+            count = self.counts.get(item, floor_a) + other.counts.get(item, floor_b)
+            error = self.errors.get(item, floor_a) + other.errors.get(item, floor_b)
+            candidates.append((count, error, item))
+
+        kept = heapq.nlargest(merged.capacity, candidates, key=lambda c: c[0])
+        for count, error, item in kept:
+            merged.counts[item] = count
+            merged.errors[item] = error
+
+        dropped_max = 0
+        if len(candidates) > len(kept):
+            kept_items = {item for _, _, item in kept}
+            dropped_max = max(c for c, _, item in candidates if item not in kept_items)
+        merged.threshold = max(floor_a + floor_b, dropped_max)
+        merged.total = self.total + other.total
+        return merged
+
+    @classmethod
+    def merge_all(cls, sketches, capacity=256):
+        """Çok sayıda özeti tek geçişte birleştir (ara kırpma olmadan)"""
+        sketches = list(sketches)
+        merged = cls(capacity)
+        floor_total = sum(s.threshold for s in sketches)
+        counts, errors, floors = {}, {}, {}
+        for sketch in sketches:
+            for item, count in sketch.counts.items():
+                counts[item] = counts.get(item, 0) + count
+                errors[item] = errors.get(item, 0) + sketch.errors[item]
+                floors[item] = floors.get(item, 0) + sketch.threshold
+            merged.total += sketch.total
+
+        # Bir özette bulunmayan öğe için o özetin eşiği üst sınır olarak eklenir
+        candidates = [
+            (count + floor_total - floors[item], errors[item] + floor_total - floors[item], item)
+            for item, count in counts.items()
+        ]
+        kept = heapq.nlargest(capacity, candidates, key=lambda c: c[0])
+        for count, error, item in kept:
+            merged.counts[item] = count
+            merged.errors[item] = error
+        dropped_max = kept[-1][0] if len(candidates) > len(kept) else 0
+        merged.threshold = max(floor_total, dropped_max)
+        return merged
+
+    def top(self, n):
+        """En yüksek tahmini sayıya sahip n öğe: [(öğe, sayı, hata), ...]"""
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], str(kv[0])))[:n]
+        return [(item, count, self.errors[item]) for item, count in ranked]
+
+
+class PartitionedTopK:
+    """Gün x kaynak x (durum var mı) bölümleri için tutulan Space-Saving özetleri"""
+
+    def __init__(self, column, capacity=256, max_cached_ranges=16):
+        self.column = column
+        self.capacity = capacity
+        self.partitions = {}
+        self._range_cache = OrderedDict()
+        self._max_cached_ranges = max_cached_ranges
+        # Özet paylaşılan önbellekte tutulur; aralık önbelleğine oturumlar aynı anda erişir
+        self._cache_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Kilit ve aralık önbelleği diske taşınmaz
+        state = dict(self.__dict__)
+        del state['_cache_lock']
+        state['_range_cache'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+    def add_frame(self, df):
+        """Yeni bir parçayı (ör. artımlı yüklenen satırlar) bölüm özetlerine ekle"""
+        if self.column not in df.columns or 'Date' not in df.columns or df.empty:
+            return self
+        # value_counts gibi boş değerler sıralamaya girmez
+        df = df[df[self.column].notna()]
+        keys = [df['Date'].dt.normalize()]
+        if SOURCE_COLUMN in df.columns:
+            keys.append(df[SOURCE_COLUMN].fillna(''))
+        else:
+            keys.append(pd.Series('', index=df.index))
+        if 'Status' in df.columns:
+            keys.append(df['Status'].notna())
+        else:
+            keys.append(pd.Series(True, index=df.index))
+        keys.append(df[self.column])
+
+        # dropna=False: tarihsiz (NaT) satırlar kendi bölümlerinde tutulur
+        grouped = df.groupby(keys, sort=False, observed=True, dropna=False).size()
+        for (day, source, has_status), counts in grouped.groupby(level=[0, 1, 2], sort=False, dropna=False):
+            sketch = SpaceSaving.from_counts(
+                dict(zip(counts.index.get_level_values(3), counts.to_numpy())),
+                capacity=self.capacity
+            )
+            key = (None if pd.isna(day) else day.date(), source, bool(has_status))
+            existing = self.partitions.get(key)
+            self.partitions[key] = existing.merge(sketch) if existing else sketch
+
+        with self._cache_lock:
+            self._range_cache.clear()
+        return self
+
+    def merged(self, start=None, end=None, sources=None, unknown_status=True):
+        """Tarih aralığı ve kaynaklar için birleşik özet
+
+        Tarih sınırı verilirse tarihsiz satırlar, `unknown_status` False ise
+        durumu boş satırlar dışarıda kalır (filter_mask ile aynı).
+        """
+        cache_key = (start, end, tuple(sources) if sources else None, unknown_status)
+        with self._cache_lock:
+            cached = self._range_cache.get(cache_key)
+            if cached is not None:
+                self._range_cache.move_to_end(cache_key)
+                return cached
+
+        bounded = start is not None or end is not None
+        selected = (
+            sketch for (day, source, has_status), sketch in self.partitions.items()
+            if (day is None and not bounded or day is not None
+                and (start is None or day >= start) and (end is None or day <= end))
+            and (not sources or source in sources)
+            and (has_status or unknown_status)
+        )
+        result = SpaceSaving.merge_all(selected, self.capacity)
+
+        with self._cache_lock:
+            self._range_cache[cache_key] = result
+            while len(self._range_cache) > self._max_cached_ranges:
+                self._range_cache.popitem(last=False)
+        return result
+
+    def top_series(self, n, start=None, end=None, sources=None, unknown_status=True):
+        """value_counts().head(n) biçiminde sonuç; hata sınırları `attrs` içinde"""
+        top = self.merged(start, end, sources, unknown_status).top(n)
+        series = pd.Series(
+            [count for _, count, _ in top],
+            index=pd.Index([item for item, _, _ in top], name=self.column),
+            name='count'
+        )
+        series.attrs['max_error'] = max((error for _, _, error in top), default=0)
+        return series
@@ -0,0 +1,167 @@
+"""
+🔮 Spekülatif Ön Hesaplama
+==========================
+Sayfa çizildikten sonra kullanıcının büyük olasılıkla açacağı sonraki
+görünümleri (diğer dönem seçimi, tek durum filtreleri, en çok başvurulan
+şirketler) tek bir düşük öncelikli arka plan iş parçacığında önbelleğe
+hesaplar. Oturumun girdileri değişince o oturumun bekleyen işleri iptal
+edilir; çalışan iş bir sonraki kontrol noktasında bırakılır.
+
+İşler tek argümanlı fonksiyonlardır: bir `check` çağrılabilirini alır,
+adımları arasında onu çağırır ve gerçekten hesapladığı önbellek anahtarlarını
+döndürür (hepsi zaten önbellekteyse boş liste). Ön plan bir görünümü
+istediğinde `record` ile bu anahtarlardan biri kullanıldıysa isabet sayılır.
+Streamlit'ten bağımsızdır.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+
+# Son gönderim/iptalden sonra arka plan işleri bu kadar bekler (ön plan ekrana yazılırken)
+DEFAULT_DELAY = 0.3
+# Linux'ta iş parçacığına verilen nice değeri (diğer sistemlerde etkisiz)
+DEFAULT_NICE = 10
+
+
+class Cancelled(Exception):
+    """İş, oturumun girdileri değiştiği için bırakıldı"""
+
+
+def lower_thread_priority(nice=DEFAULT_NICE):
+    """Yalnızca çağıran iş parçacığının önceliğini düşür (Linux)"""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), nice)
+    except (AttributeError, OSError):
+        pass
+
+
+class Speculator:
+    """Oturum başına iptal edilebilir iş listeleri ve tek düşük öncelikli işçi"""
+
+    def __init__(self, delay=DEFAULT_DELAY, nice=DEFAULT_NICE, max_tracked=1024):
+        self.delay = delay
+        self.nice = nice
+        self.max_tracked = max_tracked
+        self.stats = {
+            'submitted': 0, 'computed': 0, 'skipped': 0, 'cancelled': 0, 'failed': 0,
+            'hits': 0, 'misses': 0, 'busy_seconds': 0.0,
+        }
+        self._queues = OrderedDict()  # sahip -> (nesil, iş kuyruğu), en eski başta
+        self._generations = {}
+        self._speculated = OrderedDict()  # önceden hesaplanmış anahtar -> kullanıldı mı?
+        self._cond = threading.Condition()
+        self._last_change = 0.0
+        self._thread = None
+
+    def submit(self, owner, tasks):
+        """Sahibin bekleyen işlerini verilen listeyle değiştir"""
+        with self._cond:
+            generation = self._bump(owner)
+            tasks = deque(tasks)
+            self.stats['submitted'] += len(tasks)
+            if tasks:
+                self._queues[owner] = (generation, tasks)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='job-tracker-speculation', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def cancel(self, owner):
+        """Sahibin bekleyen ve çalışan işlerini iptal et"""
+        with self._cond:
+            self._bump(owner)
+            self._cond.notify_all()
+
+    def prune(self, is_active):
+        """Artık aktif olmayan oturumların işlerini ve nesil sayaçlarını bırak"""
+        with self._cond:
+            for owner in [o for o in self._generations if not is_active(o)]:
+                self._drop(owner)
+                del self._generations[owner]
+
+    def record(self, key, hit):
+        """Ön plandaki bir görünüm isteğini say: önceden hesaplanmışsa isabet"""
+        with self._cond:
+            if hit and self._speculated.get(key) is False:
+                self._speculated[key] = True
+                self.stats['hits'] += 1
+            elif not hit:
+                self.stats['misses'] += 1
+
+    def pending(self):
+        with self._cond:
+            return sum(len(tasks) for _, tasks in self._queues.values())
+
+    def summary(self):
+        """İstatistikler, bekleyen iş sayısı ve isabet oranı"""
+        with self._cond:
+            unused = sum(1 for used in self._speculated.values() if not used)
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        return {
+            **stats,
+            'pending': self.pending(),
+            'unused': unused,
+            'hit_rate': stats['hits'] / lookups if lookups else None,
+        }
+
+    def _bump(self, owner):
+        self._last_change = time.monotonic()
+        self._drop(owner)
+        generation = self._generations.get(owner, 0) + 1
+        self._generations[owner] = generation
+        return generation
+
+    def _drop(self, owner):
+        queued = self._queues.pop(owner, None)
+        if queued:
+            self.stats['cancelled'] += len(queued[1])
+
+    def _next(self):
+        """Sıradaki (sahip, nesil, iş); oturumlar sırayla hizmet alır"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queues)
+                # Yeni bir gönderim veya iptal gelirse bekleme baştan başlar
+                remaining = self.delay - (time.monotonic() - self._last_change)
+                if remaining > 0:
+                    self._cond.wait(timeout=remaining)
+                    continue
+                owner, (generation, tasks) = next(iter(self._queues.items()))
+                task = tasks.popleft()
+                del self._queues[owner]
+                if tasks:
+                    self._queues[owner] = (generation, tasks)
+                return owner, generation, task
+
+    def _run(self):
+        lower_thread_priority(self.nice)
+        while True:
+            owner, generation, task = self._next()
+
+            def check():
+                if self._generations.get(owner) != generation:
+                    raise Cancelled()
+
+            started = time.perf_counter()
+            computed = []
+            try:
+                computed = task(check)
+            except Cancelled:
+                outcome = 'cancelled'
+            except Exception:
+                # Spekülasyon hatası ön planı etkilemez; görünüm gerektiğinde yeniden hesaplanır
+                outcome = 'failed'
+            else:
+                outcome = 'computed' if computed else 'skipped'
+            with self._cond:
+                # Hesaplanan işler ürettikleri önbellek girdisi kadar sayılır
+                self.stats[outcome] += len(computed) if outcome == 'computed' else 1
+                self.stats['busy_seconds'] += time.perf_counter() - started
+                for key in computed:
+                    self._speculated[key] = False
+                    self._speculated.move_to_end(key)
+                while len(self._speculated) > self.max_tracked:
+                    self._speculated.popitem(last=False)
@@ -0,0 +1,420 @@
+"""
+🗄️ Gömülü SQL Analitik Motoru
+=============================
+Başvuru geçmişini disk üzerindeki bir analitik veritabanında tutar.
+DuckDB kuruluysa onu, değilse indeksli SQLite'ı kullanır. Dashboard
+grafikleri toplama işlemlerini buraya itebilir; özel sorgular tüm veri
+belleğe sığmasa bile çalışır.
+
+Kullanım:
+    db = AnalyticsDB('data/analytics.db')
+    db.ingest_csv('data/applications.csv')
+    db.query("SELECT status, COUNT(*) FROM applications GROUP BY status")
+"""
+
+import csv
+import io
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+
+import pandas as pd
+
+from loader import add_weekday_hour, normalize_columns
+
+try:
+    import duckdb
+except ImportError:  # DuckDB opsiyonel
+    duckdb = None
+
+TABLE = 'applications'
+
+# DataFrame sütunu -> SQL sütunu
+SQL_COLUMNS = {
+    'Date': 'date',
+    'Time': 'time',
+    'Company': 'company',
+    'Position': 'position',
+    'Category': 'category',
+    'Status': 'status',
+    'Subject': 'subject',
+    'Gmail Link': 'gmail_link',
+    'Processed At': 'processed_at',
+    'Source': 'source',
+    'Weekday': 'weekday',
+    'Hour': 'hour',
+}
+INT_COLUMNS = {'weekday', 'hour'}
+
+INDEXES = {
+    'idx_applications_date': '(date)',
+    'idx_applications_status_date': '(status, date)',
+    'idx_applications_company': '(company)',
+    'idx_applications_source': '(source)',
+}
+
+# Motor bazlı haftalık/aylık dönem ifadeleri
+PERIOD_SQL = {
+    'sqlite': {
+        'weekly': "date(date, 'weekday 0', '-6 days')",
+        'monthly': "strftime('%Y-%m', date)",
+    },
+    'duckdb': {
+        'weekly': "strftime(date_trunc('week', CAST(date AS DATE)), '%Y-%m-%d')",
+        'monthly': "strftime(CAST(date AS DATE), '%Y-%m')",
+    },
+}
+
+READ_ONLY_PATTERN = re.compile(r'^\s*(select|with|explain|pragma\s+table_info)\b', re.IGNORECASE)
+# DuckDB'de özel sorgu olarak izin verilen ifade türleri
+READ_ONLY_STATEMENTS = ('SELECT', 'EXPLAIN', 'PRAGMA')
+
+
+class QueryError(Exception):
+    """Özel sorgu reddedildiğinde veya başarısız olduğunda fırlatılır"""
+
+
+def default_engine():
+    return 'duckdb' if duckdb is not None else 'sqlite'
+
+
+def build_where(filters):
+    """Sidebar filtrelerini parametreli WHERE ifadesine çevir"""
+    clauses, params = [], []
+    filters = filters or {}
+    if filters.get('start'):
+        clauses.append('date >= ?')
+        params.append(str(filters['start']))
+    if filters.get('end'):
+        clauses.append('date <= ?')
+        params.append(str(filters['end']))
+    for key, column in (('statuses', 'status'), ('sources', 'source')):
+        values = filters.get(key)
+        if values:
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+    if filters.get('company'):
+        clauses.append('company = ?')
+        params.append(filters['company'])
+    where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+    return where, params
+
+
+def _prepare_frame(df):
+    """DataFrame'i tablo şemasına uygun hale getir"""
+    df = normalize_columns(df)
+    if 'Date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+        df = df.dropna(subset=['Date'])
+    if 'Date' in df.columns and 'Weekday' not in df.columns:
+        df = add_weekday_hour(df)
+
+    out = pd.DataFrame(index=df.index)
+    for column, sql_column in SQL_COLUMNS.items():
+        if column not in df.columns:
+            out[sql_column] = None
+        elif column == 'Date':
+            out[sql_column] = df[column].dt.strftime('%Y-%m-%d')
+        elif sql_column in INT_COLUMNS:
+            # Tarihsiz kaynaklardan gelen satırlarda gün/saat boştur (nullable Int8)
+            values = df[column]
+            if values.isna().any():
+                out[sql_column] = values.astype('object').where(values.notna(), None)
+            else:
+                out[sql_column] = values.astype('int64')
+        else:
+            out[sql_column] = df[column].astype('object').where(df[column].notna(), None)
+    return out
+
+
+def _file_position(stat):
+    """Dosya kimliği ve okunan bayt konumu: 'aygıt-inode:boyut'"""
+    return f'{stat.st_dev}-{stat.st_ino}:{stat.st_size}'
+
+
+def _release(con, temp_dir):
+    """Bağlantıyı kapat ve geçici veritabanı klasörünü sil"""
+    con.close()
+    if temp_dir:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class AnalyticsDB:
+    """Başvuru geçmişi için gömülü analitik veritabanı
+
+    `temporary=True` ile veritabanı geçici bir klasörde oluşturulur; klasör
+    `close()` çağrıldığında ya da nesne çöp toplandığında silinir.
+    """
+
+    def __init__(self, path=None, engine=None, temporary=False):
+        self.engine = engine or default_engine()
+        if self.engine == 'duckdb' and duckdb is None:
+            raise ImportError('DuckDB kurulu değil: pip install duckdb')
+        temp_dir = tempfile.mkdtemp(prefix='job_tracker_') if temporary else None
+        if temp_dir:
+            path = os.path.join(temp_dir, 'analytics.db')
+        self.path = str(path) if path else ':memory:'
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        if self.engine == 'duckdb':
+            self._con = duckdb.connect(self.path)
+        else:
+            self._con = sqlite3.connect(self.path, check_same_thread=False)
+        self._finalizer = weakref.finalize(self, _release, self._con, temp_dir)
+        # Aynı bağlantı birden fazla Streamlit oturumundan kullanılabilir
+        self._lock = threading.RLock()
+        self._create_schema()
+
+    # ---- Şema ve veri yükleme -------------------------------------------
+
+    def _create_schema(self):
+        columns = ', '.join(
+            f"{c} {'INTEGER' if c in INT_COLUMNS else 'TEXT'}" for c in SQL_COLUMNS.values()
+        )
+        self._con.execute(f'CREATE TABLE IF NOT EXISTS {TABLE} ({columns})')
+        self._con.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        if self.engine == 'sqlite':
+            # DuckDB min/max zone map'lerini kendisi tutar; SQLite için açık indeksler
+            for name, columns in INDEXES.items():
+                self._con.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {TABLE} {columns}')
+        self._con.commit()
+
+    def _insert(self, frame):
+        frame = _prepare_frame(frame)
+        if frame.empty:
+            return 0
+        if self.engine == 'duckdb':
+            self._con.register('incoming', frame)
+            self._con.execute(f'INSERT INTO {TABLE} SELECT * FROM incoming')
+            self._con.unregister('incoming')
+        else:
+            placeholders = ', '.join('?' * len(SQL_COLUMNS))
+            self._con.executemany(
+                f'INSERT INTO {TABLE} VALUES ({placeholders})',
+                frame.itertuples(index=False, name=None)
+            )
+        return len(frame)
+
+    def load_frame(self, df):
+        """Tabloyu bellekteki DataFrame ile değiştir"""
+        with self._lock:
+            self._con.execute(f'DELETE FROM {TABLE}')
+            count = self._insert(df)
+            self._con.commit()
+        return count
+
+    def ingest_csv(self, path, chunksize=50_000, replace=True):
+        """CSV'yi parça parça (belleğe tamamen almadan) tabloya yükle"""
+        with self._lock:
+            if replace:
+                self._con.execute(f'DELETE FROM {TABLE}')
+            count = 0
+            for chunk in pd.read_csv(path, chunksize=chunksize):
+                count += self._insert(chunk)
+            self._con.commit()
+        return count
+
+    def get_meta(self, key):
+        row = self._fetchone('SELECT value FROM meta WHERE key = ?', [key])
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self._lock:
+            self._con.execute('DELETE FROM meta WHERE key = ?', [key])
+            self._con.execute('INSERT INTO meta VALUES (?, ?)', [key, str(value)])
+            self._con.commit()
+
+    def sync_store(self, store):
+        """Yerel depo sürümü değiştiyse tabloyu güncelle
+
+        Depo yalnızca satır eklediyse (aynı dosya büyüdüyse) CSV'nin yalnızca
+        yeni baytları okunur. Dosya baştan yazıldıysa (upsert atomik yer
+        değiştirme ile yeni bir dosya oluşturur) tablo yeniden yüklenir.
+        """
+        with self._lock:
+            version = str(store.version())
+            if self.get_meta('store_version') == version or not store.exists():
+                return
+            if not self._append_csv_tail(store.csv_path):
+                before = _file_position(os.stat(store.csv_path))
+                self.ingest_csv(store.csv_path)
+                after = _file_position(os.stat(store.csv_path))
+                if before != after:
+                    # Okurken dosya değişti; bir sonraki senkronizasyon yeniden yükler
+                    return
+                self.set_meta('store_file', after)
+            self.set_meta('store_version', version)
+
+    def _append_csv_tail(self, path):
+        """Son senkronizasyondan beri dosyaya eklenen tam satırları tabloya ekle
+
+        Dosya değiştirildiyse veya kısaldıysa False döner.
+        """
+        previous = self.get_meta('store_file')
+        if not previous:
+            return False
+        file_id, offset = previous.rsplit(':', 1)
+        offset = int(offset)
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if _file_position(stat).rsplit(':', 1)[0] != file_id or stat.st_size < offset:
+                return False
+            header = next(csv.reader([f.readline().decode('utf-8')]), None)
+            f.seek(offset)
+            data = f.read(stat.st_size - offset)
+        # Yazılmakta olan son satır bir sonraki senkronizasyona kalır
+        data = data[:data.rfind(b'\n') + 1]
+        if data:
+            self._insert(pd.read_csv(io.BytesIO(data), header=None, names=header))
+        self.set_meta('store_file', f'{file_id}:{offset + len(data)}')
+        return True
+
+    # ---- Sorgular -------------------------------------------------------
+
+    def _fetch(self, sql, params=None):
+        with self._lock:
+            cursor = self._con.execute(sql, params or [])
+            columns = [d[0] for d in cursor.description]
+            return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+    def _fetchone(self, sql, params=None):
+        with self._lock:
+            return self._con.execute(sql, params or []).fetchone()
+
+    def query(self, sql, params=None, limit=10_000):
+        """Salt okunur özel sorgu çalıştır
+
+        Sorgu mevcut bağlantının bir imlecinde çalışır (DuckDB aynı dosyaya
+        farklı ayarla ikinci bağlantı açılmasına izin vermez). Salt okunurluk
+        SQLite'ta `PRAGMA query_only`, DuckDB'de ifade türü denetimi ve her
+        sorgudan sonra geri alınan işlemle sağlanır.
+        """
+        if not READ_ONLY_PATTERN.match(sql) or ';' in sql.strip().rstrip(';'):
+            raise QueryError('Yalnızca tek bir SELECT/WITH sorgusu çalıştırılabilir')
+        sql = sql.strip().rstrip(';')
+        try:
+            with self._lock:
+                cursor = self._con.cursor()
+                try:
+                    if self.engine == 'duckdb':
+                        return self._query_duckdb(cursor, sql, params, limit)
+                    cursor.execute('PRAGMA query_only = ON')
+                    try:
+                        cursor.execute(sql, params or [])
+                        columns = [d[0] for d in cursor.description]
+                        return pd.DataFrame(cursor.fetchmany(limit), columns=columns)
+                    finally:
+                        cursor.execute('PRAGMA query_only = OFF')
+                finally:
+                    cursor.close()
+        except (sqlite3.Error, RuntimeError) as e:
+            raise QueryError(str(e)) from e
+        except Exception as e:
+            if duckdb is not None and isinstance(e, duckdb.Error):
+                raise QueryError(str(e)) from e
+            raise
+
+    def _query_duckdb(self, cursor, sql, params, limit):
+        extract = getattr(cursor, 'extract_statements', None)  # DuckDB >= 0.10
+        if extract is not None:
+            statements = extract(sql)
+            if len(statements) != 1 or statements[0].type.name not in READ_ONLY_STATEMENTS:
+                raise QueryError('Yalnızca tek bir SELECT/WITH sorgusu çalıştırılabilir')
+        cursor.begin()
+        try:
+            cursor.execute(sql, params or [])
+            columns = [d[0] for d in cursor.description]
+            return pd.DataFrame(cursor.fetchmany(limit), columns=columns)
+        finally:
+            cursor.rollback()
+
+    def count(self, filters=None):
+        where, params = build_where(filters)
+        return self._fetchone(f'SELECT COUNT(*) FROM {TABLE}{where}', params)[0]
+
+    def metrics(self, filters=None):
+        """calculate_metrics ile aynı sözlüğü SQL üzerinden hesapla"""
+        where, params = build_where(filters)
+        row = self._fetchone(f"""
+            SELECT COUNT(*),
+                   SUM(CASE WHEN status = 'Applied' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN status = 'Rejected' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN status = 'Under Review' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN status = 'Interview' THEN 1 ELSE 0 END),
+                   COUNT(DISTINCT company)
+            FROM {TABLE}{where}
+        """, params)
+        total, applied, rejected, under_review, interview, unique_companies = [int(v or 0) for v in row]
+        return {
+            'total': total,
+            'applied': applied,
+            'rejected': rejected,
+            'under_review': under_review,
+            'interview': interview,
+            'rejection_rate': (rejected / total * 100) if total > 0 else 0,
+            'response_rate': ((rejected + interview + under_review) / total * 100) if total > 0 else 0,
+            'interview_rate': (interview / total * 100) if total > 0 else 0,
+            'unique_companies': unique_companies,
+        }
+
+    def value_counts(self, column, filters=None, limit=None):
+        """Sütun değerlerinin sayımı (pandas value_counts ile aynı biçimde)"""
+        if column not in SQL_COLUMNS:
+            raise KeyError(column)
+        sql_column = SQL_COLUMNS[column]
+        where, params = build_where(filters)
+        # pandas value_counts gibi boş değerler sayılmaz
+        connector = ' AND' if where else ' WHERE'
+        sql = (f'SELECT {sql_column} AS value, COUNT(*) AS n FROM {TABLE}{where}{connector} {sql_column} IS NOT NULL '
+               f'GROUP BY {sql_column} ORDER BY n DESC, value')
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        result = self._fetch(sql, params)
+        return pd.Series(result['n'].to_numpy(), index=pd.Index(result['value'], name=column), name='count')
+
+    def daily_counts(self, filters=None):
+        where, params = build_where(filters)
+        result = self._fetch(
+            f'SELECT date AS Date, COUNT(*) AS count FROM {TABLE}{where} GROUP BY date ORDER BY date',
+            params
+        )
+        result['Date'] = pd.to_datetime(result['Date'])
+        return result
+
+    def period_counts(self, period='weekly', filters=None):
+        """Haftalık/aylık sayımlar (create_period_histogram ile aynı etiketler)"""
+        expr = PERIOD_SQL[self.engine][period]
+        where, params = build_where(filters)
+        result = self._fetch(
+            f'SELECT {expr} AS Period, COUNT(*) AS count FROM {TABLE}{where} GROUP BY 1 ORDER BY 1',
+            params
+        )
+        if period == 'weekly' and not result.empty:
+            start = pd.to_datetime(result['Period'])
+            end = start + pd.Timedelta(days=6)
+            result['Period'] = start.dt.strftime('%Y-%m-%d') + '/' + end.dt.strftime('%Y-%m-%d')
+        return result
+
+    def status_by_company(self, filters=None, top_n=10):
+        where, params = build_where(filters)
+        connector = ' AND' if where else ' WHERE'
+        result = self._fetch(f"""
+            SELECT company AS Company, status AS Status, COUNT(*) AS n
+            FROM {TABLE}{where}{connector} company IN (
+                SELECT company FROM {TABLE}{where}
+                GROUP BY company ORDER BY COUNT(*) DESC, company LIMIT {int(top_n)}
+            )
+            GROUP BY company, status
+        """, params + params)
+        if result.empty:
+            return pd.DataFrame()
+        return result.pivot(index='Company', columns='Status', values='n').fillna(0).astype(int)
+
+    def close(self):
+        self._finalizer()
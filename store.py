@@ -0,0 +1,176 @@
+"""
+💾 Yerel Veri Deposu
+====================
+n8n'den gelen başvuru satırlarını yerel bir CSV dosyasında saklar.
+Her yazımda artan bir sürüm sayacı tutulur; dashboard bu sayacı okuyarak
+yeni veri gelip gelmediğini ucuza kontrol eder.
+"""
+
+import csv
+import io
+import json
+import os
+import threading
+from pathlib import Path
+
+# Google Sheets düğümüyle aynı sütun sırası
+COLUMNS = [
+    'Date', 'Time', 'Company', 'Position', 'Category',
+    'Status', 'Subject', 'Gmail Link', 'Processed At'
+]
+PROCESSED_COLUMN = 'Processed At'
+
+DEFAULT_DATA_DIR = Path(
+    os.environ.get('JOB_TRACKER_DATA_DIR', Path(__file__).resolve().parent / 'data')
+)
+
+
+def _atomic_write_text(path, text):
+    """Dosyayı geçici dosya + os.replace ile atomik olarak yaz"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class LocalStore:
+    """CSV tabanlı, sürüm sayaçlı başvuru deposu"""
+
+    def __init__(self, data_dir=None):
+        self.data_dir = Path(data_dir or DEFAULT_DATA_DIR)
+        self.csv_path = self.data_dir / 'applications.csv'
+        self.version_path = self.data_dir / 'version.json'
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._known_links = None
+        self._known_signature = None
+
+    def version(self):
+        """Mevcut veri sürümünü döndür (dosya yoksa 0)"""
+        try:
+            with open(self.version_path, encoding='utf-8') as f:
+                return int(json.load(f).get('version', 0))
+        except (FileNotFoundError, ValueError, json.JSONDecodeError):
+            return 0
+
+    def _signature(self):
+        """CSV dosyasının (mtime, boyut) imzası; dosya yoksa None"""
+        try:
+            stat = self.csv_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_known_links(self):
+        """Daha önce kaydedilmiş Gmail linklerini yükle (tekrarları engellemek için)"""
+        links = set()
+        if self.csv_path.exists():
+            with open(self.csv_path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    if row.get('Gmail Link'):
+                        links.add(row['Gmail Link'])
+        return links
+
+    def append(self, rows):
+        """Satırları dosyaya ekle, sürümü artır ve eklenen satır sayısını döndür"""
+        with self._lock:
+            # Dosya başka bir süreç tarafından yeniden yazıldıysa (ör. upsert) önbellek tazelenir
+            signature = self._signature()
+            if self._known_links is None or signature != self._known_signature:
+                self._known_links = self._load_known_links()
+                self._known_signature = signature
+
+            new_rows, new_links = [], set()
+            for row in rows:
+                link = row.get('Gmail Link')
+                if link:
+                    if link in self._known_links or link in new_links:
+                        continue
+                    new_links.add(link)
+                new_rows.append(row)
+
+            if not new_rows:
+                return 0
+
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            # Önceki yazım başlıktan önce kesildiyse dosya boş kalmış olabilir
+            write_header = not self.csv_path.exists() or self.csv_path.stat().st_size == 0
+            with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=COLUMNS, extrasaction='ignore')
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(new_rows)
+                f.flush()
+                os.fsync(f.fileno())
+            # Linkler yalnızca yazım başarılı olduktan sonra bilinir sayılır;
+            # aksi halde yeniden deneme tüm satırları tekrar diye atardı
+            self._known_links |= new_links
+            self._known_signature = self._signature()
+
+            new_version = self.version() + 1
+            _atomic_write_text(
+                self.version_path,
+                json.dumps({'version': new_version, 'rows_added': len(new_rows)})
+            )
+            self._changed.notify_all()
+            return len(new_rows)
+
+    def upsert(self, rows):
+        """Gmail linki aynı olan satırları güncelle, yenilerini ekle; dosyayı atomik olarak yeniden yaz.
+
+        Güncellenen ve eklenen satır sayılarını döndürür.
+        """
+        with self._lock:
+            existing = []
+            if self.csv_path.exists():
+                with open(self.csv_path, newline='', encoding='utf-8') as f:
+                    existing = list(csv.DictReader(f))
+            positions = {row.get('Gmail Link'): i for i, row in enumerate(existing) if row.get('Gmail Link')}
+
+            updated = added = 0
+            for row in rows:
+                row = {column: row.get(column, '') for column in COLUMNS}
+                position = positions.get(row['Gmail Link'])
+                if position is None:
+                    positions[row['Gmail Link']] = len(existing)
+                    existing.append(row)
+                    added += 1
+                else:
+                    current = {c: existing[position].get(c, '') for c in COLUMNS}
+                    # İşlenme zamanı değişiklik sayılmaz; gelen boşsa saklanan korunur
+                    if not row[PROCESSED_COLUMN]:
+                        row[PROCESSED_COLUMN] = current[PROCESSED_COLUMN]
+                    if any(current[c] != row[c] for c in COLUMNS if c != PROCESSED_COLUMN):
+                        existing[position] = row
+                        updated += 1
+
+            if not (updated or added):
+                return {'updated': 0, 'added': 0}
+
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(existing)
+            _atomic_write_text(self.csv_path, buffer.getvalue())
+            self._known_links = set(positions)
+            self._known_signature = self._signature()
+
+            new_version = self.version() + 1
+            _atomic_write_text(
+                self.version_path,
+                json.dumps({'version': new_version, 'rows_added': added, 'rows_updated': updated})
+            )
+            self._changed.notify_all()
+            return {'updated': updated, 'added': added}
+
+    def wait_for_change(self, since, timeout):
+        """Sürüm `since` değerini geçene kadar bekle (aynı süreç içi long-poll)"""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version() > since, timeout=timeout)
+        return self.version()
+
+    def exists(self):
+        return self.csv_path.exists()
@@ -0,0 +1,79 @@
+"""
+📋 Sayfalı Tablo İndeksi
+========================
+Tam veri seti için sütun başına sıralama indekslerini bir kez hesaplar.
+Filtre + sıralama kombinasyonu başına sıralı satır pozisyonları önbelleğe
+alınır; sayfa değiştirmek yalnızca görünen satırları okur.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+class TableIndex:
+    """Sıralama ve sayfalamayı sunucu tarafında yapan indeks"""
+
+    def __init__(self, df, columns, max_views=8):
+        self.df = df
+        self.columns = [c for c in columns if c in df.columns]
+        self.max_views = max_views
+        self._orders = {}
+        self._views = OrderedDict()
+        # İndeks oturumlar arasında paylaşılır; görünüm önbelleğine aynı anda erişilir
+        self._lock = threading.Lock()
+
+        # Sütun başına artan/azalan sıralama (eksik değerler her zaman sonda).
+        # Değerler sıralı tamsayı kodlarına çevrilir; yalnızca benzersiz değerler
+        # karşılaştırılır, satırlar tamsayı üzerinde stabil sıralanır.
+        for column in self.columns:
+            codes, uniques = pd.factorize(df[column], sort=True)
+            na_code = len(uniques)
+            codes = np.where(codes < 0, na_code, codes)
+            self._orders[(column, True)] = np.argsort(codes, kind='stable')
+            desc_codes = np.where(codes == na_code, na_code, na_code - 1 - codes)
+            self._orders[(column, False)] = np.argsort(desc_codes, kind='stable')
+
+    def memory_footprint(self):
+        """İndeksin kendi dizilerinin boyutu (paylaşılan DataFrame hariç)"""
+        with self._lock:
+            views = sum(v.nbytes for v in self._views.values())
+        return sum(o.nbytes for o in self._orders.values()) + views
+
+    def positions_of(self, filtered_df):
+        """Filtrelenmiş satırların tam veri setindeki pozisyonları"""
+        if len(filtered_df) == len(self.df):
+            return None
+        return self.df.index.get_indexer(filtered_df.index)
+
+    def view(self, view_key, filtered_df, column, ascending=True):
+        """Filtre + sıralama için sıralı pozisyon dizisini döndür (LRU önbellekli)"""
+        key = (view_key, column, ascending)
+        with self._lock:
+            cached = self._views.get(key)
+            if cached is not None:
+                self._views.move_to_end(key)
+                return cached
+
+        positions = self.positions_of(filtered_df)
+        order = self._orders[(column, ascending)]
+        if positions is None:
+            sorted_positions = order
+        else:
+            mask = np.zeros(len(self.df), dtype=bool)
+            mask[positions[positions >= 0]] = True
+            sorted_positions = order[mask[order]]
+
+        with self._lock:
+            self._views[key] = sorted_positions
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+        return sorted_positions
+
+    def page(self, sorted_positions, page, page_size, columns=None):
+        """Yalnızca istenen sayfanın satırlarını döndür"""
+        start = page * page_size
+        rows = self.df.iloc[sorted_positions[start:start + page_size]]
+        return rows[columns] if columns is not None else rows
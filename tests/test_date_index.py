@@ -0,0 +1,51 @@
+from datetime import date
+
+import pandas as pd
+
+import analytics
+from date_index import DailyPrefixIndex
+from loader import merge_frames
+
+
+def merged_with_undated_rows():
+    """Biri Date sütunu olmayan iki kaynağın birleşimi (tarihsiz satırlar NaT olur)"""
+    dated = pd.DataFrame({
+        'Date': pd.to_datetime(['2025-01-02', '2025-01-03', '2025-01-10', '2025-02-01']),
+        'Company': ['A', 'B', 'A', 'C'],
+        'Status': ['Applied', 'Rejected', 'Interview', 'Applied'],
+        'Subject': ['s1', 's2', 's3', 's4'],
+        'Source': 'a',
+    })
+    undated = pd.DataFrame({
+        'Company': ['D', 'A'],
+        'Status': ['Applied', 'Rejected'],
+        'Subject': ['s5', 's6'],
+        'Source': 'b',
+    })
+    return merge_frames([dated, undated])
+
+
+def test_undated_rows_are_left_out_of_the_index():
+    df = merged_with_undated_rows()
+    assert df['Date'].isna().sum() == 2
+
+    index = DailyPrefixIndex(df)
+    assert index.undated_rows == 2
+    assert index.last_day == date(2025, 2, 1)
+
+    filters = {'start': date(2025, 1, 1), 'end': date(2025, 2, 1)}
+    assert index.covers(filters)
+    expected = analytics.apply_filters(df, filters)
+    assert index.metrics(filters) == analytics.calculate_metrics(expected)
+    for period in ('weekly', 'monthly'):
+        pd.testing.assert_frame_equal(
+            index.period_counts(period, filters).reset_index(drop=True),
+            analytics.period_counts(expected, period),
+            check_dtype=False,
+        )
+
+
+def test_filters_without_date_bounds_fall_back_to_rows():
+    index = DailyPrefixIndex(merged_with_undated_rows())
+    assert not index.covers({})
+    assert not index.covers({'statuses': ['Applied']})
@@ -0,0 +1,195 @@
+import base64
+import json
+import sqlite3
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import gmail_fetcher
+from gmail_fetcher import GmailClient, GmailFetcher, SyncCursor
+
+PAGE_SIZE = 2
+
+
+class StubGmail:
+    """messages/history sayfalarını sunan bellek içi Gmail taklidi"""
+
+    def __init__(self):
+        self.messages = {}
+        self.history = []
+        self.history_id = 100
+        # Bu değerden eski historyId'ler için Gmail 404 döner
+        self.oldest_history_id = 0
+        self.requests = []
+
+    def add(self, message_id, sender='jobs-noreply@linkedin.com', subject='Application sent'):
+        self.history_id += 1
+        body = base64.urlsafe_b64encode(f'{subject} body'.encode()).decode().rstrip('=')
+        self.messages[message_id] = {
+            'id': message_id,
+            'threadId': message_id,
+            'historyId': str(self.history_id),
+            'internalDate': str(1735776000000 + self.history_id),
+            'payload': {
+                'mimeType': 'text/plain',
+                'headers': [
+                    {'name': 'From', 'value': sender},
+                    {'name': 'Subject', 'value': subject},
+                ],
+                'body': {'data': body},
+            },
+        }
+        self.history.append((self.history_id, message_id))
+
+    def handle(self, path, query):
+        self.requests.append(path)
+        name = path.split('/gmail/v1/users/me/', 1)[1]
+        if name == 'profile':
+            return 200, {'historyId': str(self.history_id)}
+        if name == 'messages':
+            ids = [
+                m for m, message in self.messages.items()
+                if 'from:linkedin.com' not in query.get('q', [''])[0]
+                or 'linkedin.com' in message['payload']['headers'][0]['value']
+            ]
+            return 200, self._page('messages', [{'id': m} for m in ids], query)
+        if name == 'history':
+            start = int(query['startHistoryId'][0])
+            if start < self.oldest_history_id:
+                return 404, {'error': {'code': 404, 'message': 'Requested entity was not found.'}}
+            records = [
+                {'id': str(h), 'messagesAdded': [{'message': {'id': m}}]}
+                for h, m in self.history if h > start
+            ]
+            page = self._page('history', records, query)
+            page['historyId'] = str(self.history_id)
+            return 200, page
+        message = self.messages.get(name.split('/', 1)[1])
+        return (200, message) if message else (404, {'error': {'code': 404}})
+
+    @staticmethod
+    def _page(key, items, query):
+        offset = int(query.get('pageToken', ['0'])[0])
+        page = {key: items[offset:offset + PAGE_SIZE]}
+        if offset + PAGE_SIZE < len(items):
+            page['nextPageToken'] = str(offset + PAGE_SIZE)
+        return page
+
+
+@pytest.fixture
+def gmail():
+    stub = StubGmail()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            status, body = stub.handle(url.path, parse_qs(url.query))
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub.api_base = f'http://127.0.0.1:{server.server_port}'
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+def make_fetcher(gmail, tmp_path):
+    client = GmailClient('token', api_base=gmail.api_base, max_retries=0)
+    return GmailFetcher(client, SyncCursor(tmp_path / 'cursor.json'), max_workers=2)
+
+
+def test_first_sync_pages_through_all_messages(gmail, tmp_path):
+    for n in range(5):
+        gmail.add(f'm{n}')
+    gmail.add('other', sender='friend@example.com')
+
+    messages = list(make_fetcher(gmail, tmp_path).sync())
+    assert [m['id'] for m in messages] == [f'm{n}' for n in range(5)]
+    assert messages[0]['subject'] == 'Application sent'
+    assert messages[0]['textPlain'] == 'Application sent body'
+
+    state = SyncCursor(tmp_path / 'cursor.json').load()
+    assert state['mode'] == 'full'
+    assert state['historyId'] == str(gmail.history_id)
+    assert sum(path.endswith('/messages') for path in gmail.requests) == 3
+
+
+def test_incremental_sync_fetches_only_new_messages(gmail, tmp_path):
+    gmail.add('m0')
+    list(make_fetcher(gmail, tmp_path).sync())
+
+    gmail.add('m1')
+    gmail.add('other', sender='friend@example.com')
+    gmail.add('m2')
+    gmail.requests.clear()
+    messages = list(make_fetcher(gmail, tmp_path).sync())
+
+    # history API gönderen filtresi uygulamaz; çekici kendisi ayıklar
+    assert [m['id'] for m in messages] == ['m1', 'm2']
+    assert not any(path.endswith('/messages') for path in gmail.requests)
+    state = SyncCursor(tmp_path / 'cursor.json').load()
+    assert state['mode'] == 'incremental'
+    assert state['historyId'] == str(gmail.history_id)
+
+    assert list(make_fetcher(gmail, tmp_path).sync()) == []
+
+
+def test_expired_history_id_falls_back_to_full_sync(gmail, tmp_path):
+    gmail.add('m0')
+    gmail.add('m1')
+    list(make_fetcher(gmail, tmp_path).sync())
+
+    gmail.add('m2')
+    gmail.oldest_history_id = gmail.history_id + 1
+    messages = list(make_fetcher(gmail, tmp_path).sync())
+
+    # Son senkronizasyonda görülen mesajlar tam taramada tekrar indirilmez
+    assert [m['id'] for m in messages] == ['m2']
+    state = SyncCursor(tmp_path / 'cursor.json').load()
+    assert state['mode'] == 'full'
+    assert state['historyId'] == str(gmail.history_id)
+
+
+def test_pending_messages_are_flushed_before_the_cursor_moves(gmail, tmp_path):
+    gmail.add('m0')
+    cursor = SyncCursor(tmp_path / 'cursor.json')
+    seen_at_flush = []
+    fetcher = make_fetcher(gmail, tmp_path)
+    list(fetcher.sync(flush=lambda: seen_at_flush.append(cursor.load())))
+    assert seen_at_flush == [{}]
+    assert cursor.load()['historyId'] == str(gmail.history_id)
+
+
+def test_main_archives_the_last_batch_with_the_cursor(gmail, tmp_path, monkeypatch):
+    for n in range(3):
+        gmail.add(f'm{n}')
+    saved = []
+    real_save = SyncCursor.save
+
+    def save(cursor, state):
+        # İmleç kaydedildiği anda son parti arşivde olmalı
+        with sqlite3.connect(tmp_path / 'email_archive.sqlite') as con:
+            saved.append(con.execute('SELECT COUNT(*) FROM messages').fetchone()[0])
+        real_save(cursor, state)
+
+    monkeypatch.setattr(SyncCursor, 'save', save)
+    monkeypatch.setattr(sys, 'argv', [
+        'gmail_fetcher.py', '--token', 'token', '--api-base', gmail.api_base, '--data-dir', str(tmp_path),
+    ])
+    gmail_fetcher.main()
+
+    assert saved == [3]
+    lines = (tmp_path / 'gmail_messages.jsonl').read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['id'] for line in lines] == ['m0', 'm1', 'm2']
@@ -0,0 +1,100 @@
+import csv
+import json
+import threading
+import urllib.request
+
+import pytest
+
+import store as store_module
+from ingest_server import make_server, shutdown_server
+from metrics_api import MetricsService
+from store import LocalStore
+
+
+class FakeN8nClient:
+    """n8n HTTP Request düğümü gibi {"items": [{"json": {...}}]} gövdeleri gönderir"""
+
+    def __init__(self, port):
+        self.base = f'http://127.0.0.1:{port}'
+
+    def post(self, items):
+        body = json.dumps({'items': [{'json': item} for item in items]}).encode('utf-8')
+        request = urllib.request.Request(
+            self.base + '/ingest', data=body, headers={'Content-Type': 'application/json'}
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+
+    def version(self):
+        with urllib.request.urlopen(self.base + '/version', timeout=5) as response:
+            return json.loads(response.read())['version']
+
+
+def item(n, status='Applied'):
+    return {
+        'date': f'2025-01-{n:02d}', 'company': f'Company {n}', 'status': status,
+        'subject': f'Application {n}', 'gmailLink': f'https://mail.google.com/mail/u/0/#inbox/{n}',
+        'processedAt': f'2025-01-{n:02d}T10:00:00Z',
+    }
+
+
+@pytest.fixture
+def server(tmp_path):
+    # Arka plan yazıcısı test süresince kendiliğinden boşaltmasın
+    server = make_server(port=0, store=LocalStore(tmp_path), batch_size=1000, flush_interval=60, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    shutdown_server(server)
+
+
+def stored_links(store):
+    with open(store.csv_path, newline='', encoding='utf-8') as f:
+        return [row['Gmail Link'] for row in csv.DictReader(f)]
+
+
+def test_batches_with_duplicates_and_a_failed_write(server, monkeypatch):
+    client = FakeN8nClient(server.server_port)
+    store = server.store
+    metrics = MetricsService(store)
+
+    assert client.post([item(1), item(2), item(2)]) == (202, {'accepted': 3, 'rejected': []})
+    assert server.buffer.flush()
+    assert stored_links(store) == [item(1)['gmailLink'], item(2)['gmailLink']]
+    assert client.version() == 1
+    status, first_etag, _ = metrics.respond('/metrics', {}, None)
+    assert status == 200
+    assert metrics.respond('/metrics', {}, None, if_none_match=first_etag)[0] == 304
+
+    # Yeni satırlar yazılırken disk hatası: kayıtlar tamponda kalır, sürüm artmaz
+    real_writer = csv.DictWriter
+
+    class FailingWriter(real_writer):
+        def writerows(self, rows):
+            monkeypatch.setattr(store_module.csv, 'DictWriter', real_writer)
+            raise OSError('disk dolu')
+
+    monkeypatch.setattr(store_module.csv, 'DictWriter', FailingWriter)
+    client.post([item(2), item(3), item(4)])
+    assert not server.buffer.flush()
+    assert server.buffer.pending() == 3
+    assert client.version() == 1
+    assert metrics.respond('/metrics', {}, None, if_none_match=first_etag)[0] == 304
+
+    # Yeniden denemede başarısız yazımın linkleri tekrar sayılmamalı
+    client.post([item(4), item(5)])
+    assert server.buffer.flush()
+    assert server.buffer.pending() == 0
+    assert stored_links(store) == [item(n)['gmailLink'] for n in range(1, 6)]
+    assert client.version() == 2
+    status, etag, body = metrics.respond('/metrics', {}, None, if_none_match=first_etag)
+    assert status == 200 and etag != first_etag
+    assert json.loads(body)['version'] == 2
+
+
+def test_invalid_items_are_rejected(server):
+    client = FakeN8nClient(server.server_port)
+    status, body = client.post([item(1), {'company': 'No date'}, item(2, status='Ghosted')])
+    assert status == 202
+    assert body['accepted'] == 1
+    assert [r['index'] for r in body['rejected']] == [1, 2]
@@ -0,0 +1,26 @@
+import warnings
+
+import pandas as pd
+
+from loader import merge_frames
+
+
+def test_merge_keeps_column_order_without_concat_warnings():
+    a = pd.DataFrame({
+        'Date': pd.to_datetime(['2025-01-02', '2025-01-03']),
+        'Company': ['A', 'B'],
+        'Position': [None, None],
+        'Subject': ['s1', 's2'],
+        'Source': 'a',
+    })
+    b = pd.DataFrame({'Company': ['C'], 'Position': ['Engineer'], 'Subject': ['s3'], 'Notes': [None], 'Source': 'b'})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FutureWarning)
+        df = merge_frames([a, b])
+
+    assert list(df.columns[:3]) == ['Date', 'Company', 'Position']
+    assert 'Notes' in df.columns and df['Notes'].isna().all()
+    assert df.set_index('Company')['Position'].dropna().to_dict() == {'C': 'Engineer'}
+    assert pd.api.types.is_datetime64_any_dtype(df['Date'])
+    assert df['Date'].isna().sum() == 1
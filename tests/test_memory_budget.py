@@ -0,0 +1,77 @@
+import os
+import threading
+
+import pytest
+
+from memory_budget import SHARED, MemoryBudget
+
+
+@pytest.fixture
+def budget(tmp_path):
+    budget = MemoryBudget(budget_bytes=1000, spill_dir=tmp_path)
+    yield budget
+    budget.close()
+
+
+def test_cold_lookup_counts_one_miss(budget):
+    assert budget.get_or_create(SHARED, 'a', lambda: 'value', nbytes=10) == 'value'
+    assert (budget.stats['misses'], budget.stats['hits']) == (1, 0)
+    assert budget.get_or_create(SHARED, 'a', lambda: 'other', nbytes=10) == 'value'
+    assert (budget.stats['misses'], budget.stats['hits']) == (1, 1)
+    assert budget._build_locks == {}
+
+
+def test_concurrent_builders_share_one_lock(budget):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'value'
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(budget.get_or_create(SHARED, 'a', factory, nbytes=10)))
+        for _ in range(4)
+    ]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # Bekleyenler varken kilit sözlükte kalır
+    while budget._build_locks[(SHARED, 'a')].waiters < 4:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ['value'] * 4
+    assert len(calls) == 1
+    assert budget._build_locks == {}
+
+
+def spill(budget, name):
+    """`name` girdisini büyük bir girdiyle bütçeden taşır ve dosya yolunu döndürür"""
+    budget.put(SHARED, 'big', b'x', nbytes=1000)
+    path = budget._entries[(SHARED, name)].path
+    assert path is not None
+    return path
+
+
+@pytest.mark.parametrize('damage', ['missing', 'corrupt'])
+def test_unreadable_spill_file_is_rebuilt(budget, damage):
+    budget.put(SHARED, 'a', {'rows': list(range(10))}, nbytes=100)
+    path = spill(budget, 'a')
+    if damage == 'missing':
+        os.remove(path)
+    else:
+        with open(path, 'wb') as f:
+            f.write(b'not a pickle')
+
+    assert budget.get(SHARED, 'a') is None
+    assert not budget.contains(SHARED, 'a')
+    rebuilt = budget.get_or_create(SHARED, 'a', lambda: {'rows': []}, nbytes=100)
+    assert rebuilt == {'rows': []}
+    assert budget.get(SHARED, 'a') == {'rows': []}
@@ -0,0 +1,48 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+from sketches import PartitionedTopK
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    n = 400
+    dates = pd.Series(pd.to_datetime('2025-01-01') + pd.to_timedelta(rng.integers(0, 60, n), unit='D'))
+    dates[rng.random(n) < 0.15] = pd.NaT
+    statuses = pd.Series(rng.choice(['Applied', 'Rejected', 'Interview'], n), dtype=object)
+    statuses[rng.random(n) < 0.1] = np.nan
+    return pd.DataFrame({
+        'Date': dates,
+        'Status': statuses,
+        'Company': [f'Company {i}' for i in rng.zipf(1.6, n) % 40],
+        'Source': rng.choice(['a', 'b'], n),
+    })
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'start': date(2025, 1, 10), 'end': date(2025, 2, 10)},
+    {'statuses': ['Applied', 'Rejected', 'Interview']},
+    {'statuses': ['Applied', 'Rejected', 'Interview', np.nan], 'sources': ['a']},
+    {'start': date(2025, 1, 1), 'statuses': ['Applied', 'Rejected', 'Interview']},
+])
+def test_sketch_matches_filtered_rows(frame, filters):
+    # Kapasite bölüm başına öğe sayısından büyük: özet kesin sayar
+    topk = PartitionedTopK('Company', capacity=256).add_frame(frame)
+    statuses = filters.get('statuses')
+    unknown_status = not statuses or any(pd.isna(s) for s in statuses)
+    series = topk.top_series(
+        10, filters.get('start'), filters.get('end'), filters.get('sources'), unknown_status
+    )
+    expected = analytics.apply_filters(frame, filters)['Company'].value_counts()
+    assert series.attrs['max_error'] == 0
+    assert series.tolist() == expected.head(10).tolist()
+    assert all(expected[company] == count for company, count in series.items())
+    assert topk.merged(*(filters.get(k) for k in ('start', 'end', 'sources')), unknown_status).total == (
+        expected.sum()
+    )
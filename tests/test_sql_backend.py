@@ -0,0 +1,71 @@
+import pytest
+
+from sql_backend import AnalyticsDB
+from store import LocalStore
+
+
+def row(n, status='Applied'):
+    return {
+        'Date': f'2025-01-{n:02d}', 'Time': '10:00', 'Company': f'Company {n}', 'Status': status,
+        'Subject': f'Application {n}', 'Gmail Link': f'https://mail.google.com/mail/u/0/#inbox/{n}',
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = AnalyticsDB(tmp_path / 'analytics.db', engine='sqlite')
+    yield db
+    db.close()
+
+
+def statuses(db):
+    return dict(db.query('SELECT company, status FROM applications').itertuples(index=False))
+
+
+def test_sync_store_appends_only_new_rows(tmp_path, db, monkeypatch):
+    store = LocalStore(tmp_path)
+    store.append([row(1), row(2)])
+    db.sync_store(store)
+    assert db.count() == 2
+
+    def reload(*args, **kwargs):
+        raise AssertionError('yalnızca eklenen satırlar okunmalı')
+
+    monkeypatch.setattr(db, 'ingest_csv', reload)
+    store.append([row(3)])
+    store.append([row(4), row(5)])
+    db.sync_store(store)
+    assert db.count() == 5
+
+    # Yarım yazılmış satır bir sonraki senkronizasyona kalır
+    with open(store.csv_path, 'a', encoding='utf-8') as f:
+        f.write('2025-01-06,10:00,Company 6')
+    monkeypatch.setattr(store, 'version', lambda: 99)
+    db.sync_store(store)
+    assert db.count() == 5
+    with open(store.csv_path, 'a', encoding='utf-8') as f:
+        f.write(',,Applied,Application 6,https://mail.google.com/mail/u/0/#inbox/6,\r\n')
+    monkeypatch.setattr(store, 'version', lambda: 100)
+    db.sync_store(store)
+    assert db.count() == 6
+
+
+def test_sync_store_reloads_after_a_rewrite(tmp_path, db):
+    store = LocalStore(tmp_path)
+    store.append([row(1), row(2)])
+    db.sync_store(store)
+
+    store.upsert([row(1, status='Rejected'), row(3)])
+    db.sync_store(store)
+    assert statuses(db) == {'Company 1': 'Rejected', 'Company 2': 'Applied', 'Company 3': 'Applied'}
+
+    store.append([row(4)])
+    db.sync_store(store)
+    assert db.count() == 4
+
+    # Aynı klasördeki kalıcı veritabanını yeniden açan süreç kaldığı yerden devam eder
+    reopened = AnalyticsDB(tmp_path / 'analytics.db', engine='sqlite')
+    store.append([row(5)])
+    reopened.sync_store(store)
+    assert reopened.count() == 5
+    reopened.close()
@@ -0,0 +1,29 @@
+import csv
+
+from store import LocalStore
+
+
+def read_rows(store):
+    with open(store.csv_path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_upsert_keeps_processed_at_when_incoming_is_empty(tmp_path):
+    store = LocalStore(tmp_path)
+    n8n_row = {
+        'Date': '2025-01-02', 'Company': 'Acme', 'Status': 'Applied',
+        'Gmail Link': 'https://mail.google.com/mail/u/0/#inbox/1',
+        'Processed At': '2025-01-02T10:00:00Z',
+    }
+    store.append([n8n_row])
+
+    # Arşivden gelen satırın işlenme zamanı boştur; değişiklik sayılmamalı
+    archived = dict(n8n_row, **{'Processed At': ''})
+    assert store.upsert([archived]) == {'updated': 0, 'added': 0}
+    assert store.upsert([dict(n8n_row, **{'Processed At': '2025-02-01T00:00:00Z'})]) == {'updated': 0, 'added': 0}
+
+    result = store.upsert([dict(archived, Status='Rejected')])
+    assert result == {'updated': 1, 'added': 0}
+    [row] = read_rows(store)
+    assert row['Status'] == 'Rejected'
+    assert row['Processed At'] == '2025-01-02T10:00:00Z'
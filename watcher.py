@@ -0,0 +1,117 @@
+"""
+👀 Klasör İzleyici
+==================
+Yapılandırılmış bir klasördeki (veya tek dosyadaki) CSV exportlarını izler.
+Değişiklikler önce ucuz olan mtime/boyut imzasıyla, ardından içerik
+hash'iyle tespit edilir; yalnızca yeni veya değişen dosyalar yeniden
+ayrıştırılır.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+
+from loader import merge_frames, read_source_csv
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path):
+    """Dosya içeriğinin blake2b özetini parça parça hesapla"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class _WatchedFile:
+    __slots__ = ('signature', 'digest', 'frame')
+
+    def __init__(self, signature, digest, frame):
+        self.signature = signature
+        self.digest = digest
+        self.frame = frame
+
+
+class FolderWatcher:
+    """Klasördeki CSV dosyalarını izleyip birleşik DataFrame üreten sınıf"""
+
+    def __init__(self, path, pattern='*.csv'):
+        self.path = Path(path).expanduser()
+        self.pattern = pattern
+        self.generation = 0
+        self.errors = {}
+        self._files = {}
+        self._failed = {}  # ayrıştırılamayan dosya -> imzası (değişmedikçe yeniden denenmez)
+        self._combined = None
+        self._lock = threading.Lock()
+
+    def _list_files(self):
+        if self.path.is_file():
+            return [self.path]
+        if self.path.is_dir():
+            return sorted(p for p in self.path.glob(self.pattern) if p.is_file())
+        return []
+
+    def scan(self):
+        """Değişiklikleri kontrol et; veri değiştiyse True döndür"""
+        with self._lock:
+            changed = False
+            current = set()
+
+            for path in self._list_files():
+                current.add(path)
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
+                entry = self._files.get(path)
+                if self._failed.get(path) == signature:
+                    continue
+                if entry is not None and entry.signature == signature:
+                    continue
+
+                # İmza değişti: içerik gerçekten değişmiş mi?
+                digest = file_digest(path)
+                if entry is not None and entry.digest == digest:
+                    entry.signature = signature
+                    self._failed.pop(path, None)
+                    self.errors.pop(path.name, None)
+                    continue
+
+                try:
+                    frame = read_source_csv(path)
+                except Exception as e:
+                    self.errors[path.name] = str(e)
+                    self._failed[path] = signature
+                    continue
+                self.errors.pop(path.name, None)
+                self._failed.pop(path, None)
+                self._files[path] = _WatchedFile(signature, digest, frame)
+                changed = True
+
+            for removed in set(self._files) - current:
+                del self._files[removed]
+                changed = True
+            for removed in set(self._failed) - current:
+                del self._failed[removed]
+            current_names = {path.name for path in current}
+            for name in set(self.errors) - current_names:
+                del self.errors[name]
+
+            if changed:
+                self.generation += 1
+                self._combined = None
+            return changed
+
+    def frame(self):
+        """Tüm izlenen dosyaların birleşik verisini döndür"""
+        with self._lock:
+            if self._combined is None:
+                self._combined = merge_frames(entry.frame for entry in self._files.values())
+            return self._combined
+
+    def file_count(self):
+        return len(self._files)